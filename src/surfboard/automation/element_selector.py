@@ -6,17 +6,145 @@ mechanisms, visual detection, and context-aware selection.
 """
 
 import asyncio
+import heapq
 import logging
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from enum import Enum, IntFlag
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Pattern, Set, Tuple, Union
 
+from ..protocols.cdp import CDPError
 from ..protocols.cdp_domains import CDPSession
 from ..protocols.llm_protocol import ElementSelector, ElementSelectorType
 
+try:
+    from rapidfuzz import fuzz, process
+
+    _RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    # Fall back to the pure Python bit-parallel scorer below
+    _RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    # rapidfuzz.process.cdist returns numpy arrays
+    _NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on the text serialized back over CDP per element. Scoring runs
+# on the full text inside the page; only the returned copy is truncated.
+_MAX_TEXT_LENGTH = 1000
+
+# Bounding box keys, in the order compact script rows list them
+_BOX_KEYS = ("x", "y", "width", "height")
+
+# Shared helpers prepended to the selection scripts
+_JS_HELPERS = """
+function __sbAttrs(element) {
+    // Index the NamedNodeMap directly: no name array, iterator or per-name
+    // attribute lookup
+    const nodes = element.attributes;
+    const attributes = {};
+    for (let i = 0; i < nodes.length; i++) {
+        const attribute = nodes[i];
+        attributes[attribute.name] = attribute.value;
+    }
+    return attributes;
+}
+
+// Multi-element scripts dictionary-encode attribute names: each name is
+// listed once in `names`, and elements carry flat [code, value, ...] pairs
+function __sbAttrPairs(element, names, codes) {
+    const nodes = element.attributes;
+    const pairs = [];
+    for (let i = 0; i < nodes.length; i++) {
+        const attribute = nodes[i];
+        let code = codes.get(attribute.name);
+        if (code === undefined) {
+            code = names.length;
+            names.push(attribute.name);
+            codes.set(attribute.name, code);
+        }
+        pairs.push(code, attribute.value);
+    }
+    return pairs;
+}
+
+// Element rects are read fresh: each lookup reads an element's rect once,
+// and a page-level cache would miss CSS transitions and other layout changes
+// that fire no event
+function __sbRect(element) {
+    return element.getBoundingClientRect();
+}
+
+function __sbIsVisible(element, rect) {
+    if (rect.width < 1 || rect.height < 1) return false;
+    const style = window.getComputedStyle(element);
+    return style.display !== 'none' && style.visibility !== 'hidden';
+}
+
+// Cheap per-element state packed into one integer (see ElementFlags)
+function __sbFlags(element, rect) {
+    let flags = __sbIsVisible(element, rect) ? 1 : 0;
+    if (rect.bottom > 0 && rect.right > 0 &&
+            rect.top < window.innerHeight && rect.left < window.innerWidth) {
+        flags |= 2;
+    }
+    if (element.matches(
+            'a[href], button, input, select, textarea, [role="button"], [onclick]')) {
+        flags |= 4;
+    }
+    return flags;
+}
+"""
+
+# Protocol error for an execution context id that no longer exists, e.g.
+# an isolated world whose frame has navigated
+_STALE_CONTEXT_ERROR = "Cannot find context with specified id"
+
+# Selectors whose subject is '*', with no selector list: they match most of
+# the document, so a limited walk beats a full querySelectorAll
+_BROAD_SELECTOR_PATTERN = re.compile(r"^(?:[^,]*[\s>+~])?\*[^\s>+~,]*$")
+
+# Cached multi-element scripts per selector before the cache is reset
+_SCRIPT_CACHE_SIZE = 256
+
+# Excludes explicitly hidden elements inside the selector match itself, so
+# broad scans never lay out or style-resolve them
+_HIDDEN_FILTER = ':not([hidden]):not([aria-hidden="true"])'
+
+# Disjoint DOM shards harvested concurrently for fuzzy matching:
+# interactive, textual and structural elements.
+_HARVEST_SHARDS = tuple(
+    ", ".join(f"{tag}{_HIDDEN_FILTER}" for tag in tags)
+    for tags in (
+        ("button", "a", "input", "select", "textarea", "[role]"),
+        (
+            "h1:not([role])",
+            "h2:not([role])",
+            "h3:not([role])",
+            "h4:not([role])",
+            "label:not([role])",
+            "span:not([role])",
+            "p:not([role])",
+        ),
+        (
+            "div:not([role])",
+            "li:not([role])",
+            "td:not([role])",
+            "article:not([role])",
+            "section:not([role])",
+        ),
+    )
+)
+
 
 class SelectionStrategy(str, Enum):
     """Element selection strategies."""
@@ -29,7 +157,15 @@ class SelectionStrategy(str, Enum):
     STRUCTURAL = "structural"
 
 
-@dataclass
+class ElementFlags(IntFlag):
+    """Element state reported alongside multi-element selection results."""
+
+    VISIBLE = 1
+    IN_VIEWPORT = 2
+    INTERACTIVE = 4
+
+
+@dataclass(slots=True)
 class SelectionResult:
     """Result of element selection."""
 
@@ -41,6 +177,230 @@ class SelectionResult:
     attributes: Dict[str, str]
     text_content: str
     screenshot_data: Optional[str] = None
+    frame_id: Optional[str] = None
+    flags: ElementFlags = ElementFlags(0)
+
+
+def _intern_attributes(raw: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Copy an attribute map, interning its keys.
+
+    Similar elements share the same handful of attribute names (``class``,
+    ``role``, ``type``...), so interning lets every result reuse one string
+    object per name instead of holding its own copy.
+    """
+    if not raw:
+        return {}
+    return {sys.intern(name): value for name, value in raw.items()}
+
+
+def _decode_attributes(
+    pairs: Optional[List[Any]],
+    names: List[str],
+    value_cache: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Decode a dictionary-encoded ``[code, value, ...]`` attribute list.
+
+    ``names`` is the batch's name table, already interned, so every result
+    shares one string object per attribute name. Values are deduplicated
+    through ``value_cache`` when one is shared across a batch of results;
+    unlike names they are page data, so they are not interned process-wide.
+    """
+    if not pairs:
+        return {}
+    values = pairs[1::2]
+    if value_cache is not None:
+        values = [value_cache.setdefault(value, value) for value in values]
+    return dict(zip([names[code] for code in pairs[0::2]], values))
+
+
+def _intern_names(payload: Dict[str, Any]) -> List[str]:
+    """Intern the attribute name table of a multi-element script payload."""
+    return [sys.intern(name) for name in payload.get("names") or ()]
+
+
+# One XPath location step: axis, lowercase tag name or '*', and an optional
+# single attribute equality predicate
+_XPATH_STEP_PATTERN = re.compile(
+    r"(//|/)([a-z][a-z0-9-]*|\*)"
+    r"(?:\[@([a-z][a-z0-9-]*)\s*=\s*(?:'([^'\\\n]*)'|\"([^\"\\\n]*)\")\])?"
+)
+
+
+@lru_cache(maxsize=128)
+def _xpath_to_css(xpath: str) -> Optional[str]:
+    """Translate a simple XPath step chain into an equivalent CSS selector.
+
+    Covers expressions such as ``//form//button[@type='submit']`` so they can
+    run through the browser's native selector engine instead of
+    ``document.evaluate``. Returns None for anything more complex.
+    """
+    xpath = xpath.strip()
+    if not xpath.startswith("//"):
+        return None
+
+    parts = []
+    position = 0
+    while position < len(xpath):
+        match = _XPATH_STEP_PATTERN.match(xpath, position)
+        if not match:
+            return None
+
+        axis, tag, attribute, single_quoted, double_quoted = match.groups()
+        if parts:
+            parts.append(" " if axis == "//" else " > ")
+        parts.append(tag)
+        if attribute:
+            value = single_quoted if single_quoted is not None else double_quoted
+            value = value.replace('"', '\\"')
+            parts.append(f'[{attribute}="{value}"]')
+
+        position = match.end()
+
+    return "".join(parts)
+
+
+def _fold_text(value: Optional[str]) -> Optional[str]:
+    """Case-fold search text once in Python rather than per element in JS."""
+    if not value:
+        return None
+    return value.strip().lower()
+
+
+@lru_cache(maxsize=128)
+def _compile_target_phrases(target: str) -> Tuple[Tuple[str, ...], Pattern[str]]:
+    """Split folded target text into alternative phrases and compile them.
+
+    Labels such as ``"sign in|log in"`` match any of their phrases; the
+    combined pattern lets the whole harvest be scanned in a single pass.
+    """
+    phrases = tuple(
+        phrase for phrase in (part.strip() for part in target.split("|")) if phrase
+    )
+    pattern = re.compile("|".join(re.escape(phrase) for phrase in phrases))
+    return phrases, pattern
+
+
+def _find_phrase_hits(pattern: Pattern[str], texts: List[str]) -> Set[int]:
+    """Return indexes of texts containing a phrase, using one joined scan."""
+    offsets = []
+    position = 0
+    for text in texts:
+        offsets.append(position)
+        position += len(text) + 1
+
+    joined = "\x01".join(texts)
+    return {
+        bisect_right(offsets, match.start()) - 1 for match in pattern.finditer(joined)
+    }
+
+
+@lru_cache(maxsize=128)
+def _phrase_masks(phrase: str) -> Dict[str, int]:
+    """Bitmask of the positions of each character in a phrase."""
+    masks: Dict[str, int] = {}
+    for position, char in enumerate(phrase):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _indel_ratio(phrase: str, text: str) -> float:
+    """Normalized indel similarity, the same measure as ``fuzz.ratio``.
+
+    Computes the longest common subsequence bit-parallel (Allison-Dix /
+    Hyyrö): the whole phrase is one Python int, so each text character costs
+    a few big-int operations instead of a row of the DP table.
+    """
+    total = len(phrase) + len(text)
+    if not total:
+        return 1.0
+
+    masks = _phrase_masks(phrase)
+    full = (1 << len(phrase)) - 1
+    row = full
+    for char in text:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+
+    common = len(phrase) - row.bit_count()
+    return 2 * common / total
+
+
+def _length_window(length: int, threshold: float) -> Tuple[float, float]:
+    """Text lengths whose similarity ratio against ``length`` can reach threshold.
+
+    Both fuzz.ratio and _indel_ratio are 2 * matches / (L + M), which
+    never exceeds 2 * min(L, M) / (L + M), so the length difference alone
+    bounds the best possible score.
+    """
+    if threshold <= 0:
+        return 0.0, float("inf")
+    return (
+        length * threshold / (2 - threshold) - 1e-9,
+        length * (2 - threshold) / threshold + 1e-9,
+    )
+
+
+def _score_phrase_similarity(
+    phrases: Tuple[str, ...], texts: List[str], threshold: float
+) -> Dict[int, float]:
+    """Score texts against their closest phrase.
+
+    Returns:
+        Mapping of text index to similarity (0-1) for texts reaching threshold
+    """
+    scores: Dict[int, float] = {}
+
+    # Phrase lengths are fixed, so compute each admissible length window once
+    # and prune candidates before any edit distance work
+    windows = [_length_window(len(phrase), threshold) for phrase in phrases]
+    lowest = min(low for low, _ in windows)
+    highest = max(high for _, high in windows)
+    candidates = [
+        index for index, text in enumerate(texts) if lowest <= len(text) <= highest
+    ]
+    if not candidates:
+        return scores
+    pool = [texts[index] for index in candidates]
+
+    if _RAPIDFUZZ_AVAILABLE and _NUMPY_AVAILABLE:
+        # Score every phrase against the whole pool in one multithreaded C
+        # call, then keep each text's best phrase
+        best = process.cdist(
+            phrases,
+            pool,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+            workers=-1,
+        ).max(axis=0)
+        for position in np.flatnonzero(best >= threshold * 100):
+            scores[candidates[position]] = float(best[position]) / 100
+        return scores
+
+    if _RAPIDFUZZ_AVAILABLE:
+        # score_cutoff lets rapidfuzz abandon a comparison as soon as the
+        # threshold is out of reach
+        for phrase in phrases:
+            for _, score, position in process.extract(
+                phrase,
+                pool,
+                scorer=fuzz.ratio,
+                score_cutoff=threshold * 100,
+                limit=None,
+            ):
+                index = candidates[position]
+                scores[index] = max(scores.get(index, 0.0), score / 100)
+        return scores
+
+    for index, text in zip(candidates, pool):
+        text_length = len(text)
+        for phrase, (low, high) in zip(phrases, windows):
+            if not low <= text_length <= high:
+                continue
+            score = _indel_ratio(phrase, text)
+            if score >= threshold:
+                scores[index] = max(scores.get(index, 0.0), score)
+
+    return scores
 
 
 class AdvancedElementSelector:
@@ -57,6 +417,25 @@ class AdvancedElementSelector:
             SelectionStrategy.STRUCTURAL,
         ]
 
+        # Strategy dispatch table; every method takes (session, selector, context)
+        self.strategy_methods = {
+            SelectionStrategy.EXACT_MATCH: self._exact_match_strategy,
+            SelectionStrategy.FUZZY_TEXT: self._fuzzy_text_strategy,
+            SelectionStrategy.CONTEXT_AWARE: self._context_aware_strategy,
+            SelectionStrategy.ATTRIBUTE_PATTERN: self._attribute_pattern_strategy,
+            SelectionStrategy.VISUAL_SIMILARITY: self._visual_similarity_strategy,
+            SelectionStrategy.STRUCTURAL: self._structural_strategy,
+        }
+
+        # Multi-element scripts keyed by (type, value, visible_only, limit,
+        # fast_path)
+        self._script_cache: Dict[Tuple[Any, str, bool, int, bool], str] = {}
+
+        # Isolated world context ids per (client, frame id), reused until the
+        # frame's document replaces them or the frame leaves the tree
+        self._frame_worlds: Dict[Tuple[Any, str], int] = {}
+        self._world_clients: Set[Any] = set()
+
     async def find_element(
         self,
         session: CDPSession,
@@ -81,17 +460,28 @@ class AdvancedElementSelector:
             f"Finding element with selector: {selector.type.value}={selector.value}"
         )
 
-        # Adjust timeout based on page complexity if adaptive
-        timeout = selector.timeout
-        if adaptive_timeout:
-            timeout = await self._calculate_adaptive_timeout(session, selector.timeout)
+        # Resolved lazily: an exact match returns at full confidence, so the
+        # page complexity probe is only paid for once it has missed
+        timeout: Optional[float] = None
 
         # Try each strategy in order
         for attempt in range(max_attempts):
             for strategy in self.strategies:
+                if timeout is None and strategy != SelectionStrategy.EXACT_MATCH:
+                    # Adjust timeout based on page complexity if adaptive
+                    timeout = selector.timeout
+                    if adaptive_timeout:
+                        timeout = await self._calculate_adaptive_timeout(
+                            session, selector.timeout
+                        )
+
                 try:
                     result = await self._try_strategy(
-                        session, selector, strategy, context, timeout
+                        session,
+                        selector,
+                        strategy,
+                        context,
+                        timeout or selector.timeout,
                     )
 
                     if result and result.confidence > 0.7:  # High confidence threshold
@@ -115,23 +505,244 @@ class AdvancedElementSelector:
         selector: ElementSelector,
         limit: int = 10,
         similarity_threshold: float = 0.8,
+        fast_path: bool = False,
     ) -> List[SelectionResult]:
-        """Find multiple similar elements."""
+        """Find multiple similar elements.
+
+        Args:
+            session: CDP session
+            selector: Element selector
+            limit: Maximum number of results
+            similarity_threshold: Minimum fuzzy match confidence
+            fast_path: Only collect element ids and bounding boxes for exact
+                matches, skipping attribute and text serialization
+
+        Returns:
+            Selection results, exact matches first
+        """
+        return [
+            result
+            async for result in self.iter_elements(
+                session, selector, limit, similarity_threshold, fast_path
+            )
+        ]
+
+    async def iter_elements(
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        limit: int = 10,
+        similarity_threshold: float = 0.8,
+        fast_path: bool = False,
+    ) -> AsyncIterator[SelectionResult]:
+        """Yield multiple similar elements, exact matches first.
+
+        Takes the same arguments as ``find_multiple_elements``. Callers that
+        stop iterating early skip building the remaining results, and the
+        fuzzy pass only runs once every exact match has been consumed.
+        """
         logger.debug(
             f"Finding multiple elements: {selector.type.value}={selector.value}"
         )
 
         # Start with exact matches
-        results = await self._find_exact_matches(session, selector, limit)
+        found = 0
+        async for result in self._find_exact_matches(
+            session, selector, limit, fast_path=fast_path
+        ):
+            yield result
+            found += 1
 
         # If not enough results, try fuzzy matching
-        if len(results) < limit:
+        if found < limit:
             fuzzy_results = await self._find_fuzzy_matches(
-                session, selector, limit - len(results), similarity_threshold
+                session, selector, limit - found, similarity_threshold
+            )
+            for result in fuzzy_results:
+                yield result
+
+    async def find_multiple_elements_in_frames(
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        limit: int = 10,
+        fast_path: bool = False,
+    ) -> List[SelectionResult]:
+        """Find exact matches across the page and all of its same-process iframes.
+
+        Frames are queried concurrently, each in its own isolated world, so
+        the total latency is that of the slowest frame rather than the sum.
+        Bounding boxes are relative to each result's own frame.
+
+        Args:
+            session: CDP session
+            selector: CSS or XPath element selector
+            limit: Maximum number of results across all frames
+            fast_path: Only collect element ids and bounding boxes
+
+        Returns:
+            Selection results in frame tree order, tagged with their frame id
+        """
+        script = self._exact_matches_script(selector, limit, fast_path)
+        if script is None:
+            return []
+
+        frame_ids = []
+        pending = [(await session.page.get_frame_tree()).get("frameTree", {})]
+        while pending:
+            node = pending.pop(0)
+            if "frame" in node:
+                frame_ids.append(node["frame"]["id"])
+            pending.extend(node.get("childFrames", []))
+
+        self._forget_departed_frames(session, frame_ids)
+
+        # Out-of-process iframes cannot host a world from this session, so
+        # their lookups fail and are skipped
+        payloads = await asyncio.gather(
+            *(
+                self._evaluate_in_frame(session, frame_id, script)
+                for frame_id in frame_ids
+            ),
+            return_exceptions=True,
+        )
+
+        value_cache: Dict[str, str] = {}
+        results: List[SelectionResult] = []
+
+        for frame_id, payload in zip(frame_ids, payloads):
+            if isinstance(payload, BaseException):
+                logger.debug(f"Frame {frame_id} selection failed: {payload}")
+                continue
+            if not payload or not payload.get("rows"):
+                continue
+
+            names = _intern_names(payload)
+            for row in payload["rows"][: limit - len(results)]:
+                result = self._build_row_result(
+                    row,
+                    names,
+                    selector,
+                    SelectionStrategy.EXACT_MATCH,
+                    1.0,
+                    value_cache,
+                )
+                result.frame_id = frame_id
+                results.append(result)
+
+            if len(results) >= limit:
+                break
+
+        return results
+
+    async def _evaluate_in_frame(
+        self, session: CDPSession, frame_id: str, script: str
+    ) -> Any:
+        """Evaluate a script in the frame's isolated world, creating it once.
+
+        A frame's navigation destroys its world. The client keeps one handler
+        per CDP event, and the smart waiter already owns Page.frameNavigated,
+        so a destroyed world is noticed when its context id is rejected; a
+        new world is then created and the script run again.
+        """
+
+        key = (session.client, frame_id)
+        context_id = self._frame_worlds.get(key)
+        if context_id is not None:
+            try:
+                return await session.runtime.evaluate(script, context_id=context_id)
+            except CDPError as e:
+                if _STALE_CONTEXT_ERROR not in str(e):
+                    raise
+                del self._frame_worlds[key]
+
+        context_id = await session.page.create_isolated_world(frame_id, "surfboard")
+        if session.client not in self._world_clients:
+            client = session.client
+            self._world_clients.add(client)
+            client.add_close_callback(lambda: self._forget_client_worlds(client))
+        self._frame_worlds[key] = context_id
+        return await session.runtime.evaluate(script, context_id=context_id)
+
+    def _forget_departed_frames(
+        self, session: CDPSession, frame_ids: List[str]
+    ) -> None:
+        """Drop the worlds of frames no longer in the session's frame tree."""
+
+        current = set(frame_ids)
+        for key in [
+            key
+            for key in self._frame_worlds
+            if key[0] is session.client and key[1] not in current
+        ]:
+            del self._frame_worlds[key]
+
+    def _forget_client_worlds(self, client: Any) -> None:
+        """Drop every world kept for a client whose connection closed."""
+
+        self._world_clients.discard(client)
+        for key in [key for key in self._frame_worlds if key[0] is client]:
+            del self._frame_worlds[key]
+
+    async def find_element_handles(
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        limit: int = 10,
+    ) -> List[str]:
+        """Find visible elements as remote object IDs.
+
+        For callers that only act on the elements (click, focus...), this
+        keeps the nodes live in the page and skips serializing their
+        attributes, geometry and text.
+
+        Args:
+            session: CDP session
+            selector: CSS or XPath element selector
+            limit: Maximum number of elements
+
+        Returns:
+            Remote object IDs of the matching elements, in document order
+        """
+        elements_js = self._elements_expression(selector, limit)
+        if elements_js is None:
+            return []
+
+        visible_only_js = "true" if selector.visible_only else "false"
+
+        script = f"""
+        (function() {{
+            {_JS_HELPERS}
+
+            const elements = {elements_js};
+            if (!{visible_only_js}) return elements;
+
+            const rects = elements.map(__sbRect);
+            return elements.filter(
+                (element, index) => __sbIsVisible(element, rects[index])
+            );
+        }})()
+        """
+
+        remote = await session.runtime.evaluate(script, return_by_value=False)
+        array_id = remote.get("objectId") if remote else None
+        if not array_id:
+            return []
+
+        try:
+            properties = await session.runtime.get_properties(
+                array_id, own_properties=True
             )
-            results.extend(fuzzy_results)
+        finally:
+            await session.runtime.release_object(array_id)
 
-        return results[:limit]
+        handles = [
+            (int(prop["name"]), prop["value"]["objectId"])
+            for prop in properties
+            if prop.get("name", "").isdigit() and "objectId" in prop.get("value", {})
+        ]
+        handles.sort()
+        return [object_id for _, object_id in handles]
 
     async def _try_strategy(
         self,
@@ -143,92 +754,75 @@ class AdvancedElementSelector:
     ) -> Optional[SelectionResult]:
         """Try a specific selection strategy."""
 
-        if strategy == SelectionStrategy.EXACT_MATCH:
-            return await self._exact_match_strategy(session, selector)
-        elif strategy == SelectionStrategy.FUZZY_TEXT:
-            return await self._fuzzy_text_strategy(session, selector)
-        elif strategy == SelectionStrategy.CONTEXT_AWARE:
-            return await self._context_aware_strategy(session, selector, context)
-        elif strategy == SelectionStrategy.ATTRIBUTE_PATTERN:
-            return await self._attribute_pattern_strategy(session, selector)
-        elif strategy == SelectionStrategy.VISUAL_SIMILARITY:
-            return await self._visual_similarity_strategy(session, selector)
-        elif strategy == SelectionStrategy.STRUCTURAL:
-            return await self._structural_strategy(session, selector)
+        strategy_method = self.strategy_methods.get(strategy)
+        if strategy_method is None:
+            return None
 
-        return None
+        return await strategy_method(session, selector, context)
 
     async def _exact_match_strategy(
-        self, session: CDPSession, selector: ElementSelector
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Exact match selection strategy."""
 
         if selector.type == ElementSelectorType.CSS:
             script = f"""
             (function() {{
+                {_JS_HELPERS}
+
                 const element = document.querySelector({repr(selector.value)});
                 if (!element) return null;
 
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return null;
-                }}
+                const rect = __sbRect(element);
+                if (!__sbIsVisible(element, rect)) return null;
 
                 return {{
                     elementId: element.id || null,
-                    tagName: element.tagName.toLowerCase(),
-                    text: element.textContent.trim(),
-                    attributes: Object.fromEntries(
-                        Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                    ),
+                    text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
+                    attributes: __sbAttrs(element),
                     boundingBox: {{
                         x: rect.x,
                         y: rect.y,
                         width: rect.width,
                         height: rect.height
-                    }},
-                    isVisible: rect.width > 0 && rect.height > 0
+                    }}
                 }};
             }})()
             """
 
         elif selector.type == ElementSelectorType.XPATH:
+            css = _xpath_to_css(selector.value)
+            if css:
+                lookup_js = f"document.querySelector({repr(css)})"
+            else:
+                lookup_js = (
+                    f"document.evaluate({repr(selector.value)}, document, null, "
+                    "XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+                )
+
             script = f"""
             (function() {{
-                const result = document.evaluate(
-                    {repr(selector.value)},
-                    document,
-                    null,
-                    XPathResult.FIRST_ORDERED_NODE_TYPE,
-                    null
-                );
+                {_JS_HELPERS}
 
-                const element = result.singleNodeValue;
+                const element = {lookup_js};
                 if (!element) return null;
 
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return null;
-                }}
+                const rect = __sbRect(element);
+                if (!__sbIsVisible(element, rect)) return null;
 
                 return {{
                     elementId: element.id || null,
-                    tagName: element.tagName.toLowerCase(),
-                    text: element.textContent.trim(),
-                    attributes: Object.fromEntries(
-                        Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                    ),
+                    text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
+                    attributes: __sbAttrs(element),
                     boundingBox: {{
                         x: rect.x,
                         y: rect.y,
                         width: rect.width,
                         height: rect.height
-                    }},
-                    isVisible: rect.width > 0 && rect.height > 0
+                    }}
                 }};
             }})()
             """
@@ -236,13 +830,15 @@ class AdvancedElementSelector:
         elif selector.type == ElementSelectorType.TEXT:
             script = f"""
             (function() {{
+                {_JS_HELPERS}
+
                 const walker = document.createTreeWalker(
                     document.body,
                     NodeFilter.SHOW_ELEMENT
                 );
 
                 let element = null;
-                const targetText = {repr(selector.value.lower())};
+                const targetText = {repr(_fold_text(selector.value) or '')};
 
                 while (walker.nextNode()) {{
                     const node = walker.currentNode;
@@ -256,27 +852,19 @@ class AdvancedElementSelector:
 
                 if (!element) return null;
 
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return null;
-                }}
+                const rect = __sbRect(element);
+                if (!__sbIsVisible(element, rect)) return null;
 
                 return {{
                     elementId: element.id || null,
-                    tagName: element.tagName.toLowerCase(),
-                    text: element.textContent.trim(),
-                    attributes: Object.fromEntries(
-                        Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                    ),
+                    text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
+                    attributes: __sbAttrs(element),
                     boundingBox: {{
                         x: rect.x,
                         y: rect.y,
                         width: rect.width,
                         height: rect.height
-                    }},
-                    isVisible: rect.width > 0 && rect.height > 0
+                    }}
                 }};
             }})()
             """
@@ -287,18 +875,15 @@ class AdvancedElementSelector:
         if not result_data:
             return None
 
-        return SelectionResult(
-            element_id=result_data.get("elementId"),
-            selector_used=selector.value,
-            strategy=SelectionStrategy.EXACT_MATCH,
-            confidence=1.0,
-            bounding_box=result_data.get("boundingBox", {}),
-            attributes=result_data.get("attributes", {}),
-            text_content=result_data.get("text", ""),
+        return self._build_result(
+            result_data, selector, SelectionStrategy.EXACT_MATCH, 1.0
         )
 
     async def _fuzzy_text_strategy(
-        self, session: CDPSession, selector: ElementSelector
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Fuzzy text matching strategy."""
 
@@ -307,8 +892,12 @@ class AdvancedElementSelector:
 
         script = f"""
         (function() {{
-            const targetText = {repr(selector.value.lower())};
-            const elements = Array.from(document.querySelectorAll('*'));
+            {_JS_HELPERS}
+
+            const targetText = {repr(_fold_text(selector.value) or '')};
+            const elements = Array.from(
+                document.querySelectorAll({repr('*' + _HIDDEN_FILTER)})
+            );
 
             let bestMatch = null;
             let bestScore = 0;
@@ -348,36 +937,35 @@ class AdvancedElementSelector:
             }}
 
             elements.forEach(element => {{
-                const text = element.textContent.trim().toLowerCase();
-                if (text.length === 0) return;
+                const rawText = element.textContent.trim();
+                if (rawText.length === 0) return;
+                const text = rawText.toLowerCase();
 
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return;
-                }}
+                const rect = __sbRect(element);
+                if (rect.width < 1 || rect.height < 1) return;
 
                 // Check exact substring match first
                 let score = 0;
                 if (text.includes(targetText)) {{
                     score = 0.9;
                 }} else {{
-                    // Fuzzy matching
-                    score = calculateSimilarity(text, targetText);
+                    // Fuzzy matching. The edit distance is at least the length
+                    // difference, so skip candidates that cannot beat the best.
+                    const lengthBound =
+                        Math.min(text.length, targetText.length) /
+                        Math.max(text.length, targetText.length);
+                    if (lengthBound > Math.max(bestScore, 0.6)) {{
+                        score = calculateSimilarity(text, targetText);
+                    }}
                 }}
 
-                if (score > bestScore && score > 0.6) {{
+                if (score > bestScore && score > 0.6 && __sbIsVisible(element, rect)) {{
                     bestScore = score;
                     bestMatch = {{
-                        element: element,
                         score: score,
                         elementId: element.id || null,
-                        tagName: element.tagName.toLowerCase(),
-                        text: element.textContent.trim(),
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
+                        text: rawText.slice(0, {_MAX_TEXT_LENGTH}),
+                        attributes: __sbAttrs(element),
                         boundingBox: {{
                             x: rect.x,
                             y: rect.y,
@@ -396,21 +984,18 @@ class AdvancedElementSelector:
         if not result_data:
             return None
 
-        return SelectionResult(
-            element_id=result_data.get("elementId"),
-            selector_used=selector.value,
-            strategy=SelectionStrategy.FUZZY_TEXT,
-            confidence=result_data.get("score", 0.0),
-            bounding_box=result_data.get("boundingBox", {}),
-            attributes=result_data.get("attributes", {}),
-            text_content=result_data.get("text", ""),
+        return self._build_result(
+            result_data,
+            selector,
+            SelectionStrategy.FUZZY_TEXT,
+            result_data.get("score", 0.0),
         )
 
     async def _context_aware_strategy(
         self,
         session: CDPSession,
         selector: ElementSelector,
-        context: Optional[Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Context-aware selection strategy."""
 
@@ -418,13 +1003,16 @@ class AdvancedElementSelector:
             return None
 
         # Use context hints to improve selection
-        nearby_text = context.get("nearby_text")
-        form_context = context.get("form_context")
-        section_context = context.get("section_context")
+        nearby_text = _fold_text(context.get("nearby_text"))
+        form_context = _fold_text(context.get("form_context"))
+        section_context = _fold_text(context.get("section_context"))
 
         script = f"""
         (function() {{
+            {_JS_HELPERS}
+
             const targetValue = {repr(selector.value)};
+            const targetLower = {repr(_fold_text(selector.value) or '')};
             const nearbyText = {repr(nearby_text) if nearby_text else 'null'};
             const formContext = {repr(form_context) if form_context else 'null'};
             const sectionContext = {repr(section_context) if section_context else 'null'};
@@ -435,23 +1023,22 @@ class AdvancedElementSelector:
             if ({repr(selector.type.value)} === 'css') {{
                 candidates = Array.from(document.querySelectorAll(targetValue));
             }} else if ({repr(selector.type.value)} === 'text') {{
-                candidates = Array.from(document.querySelectorAll('*')).filter(el =>
-                    el.textContent.toLowerCase().includes(targetValue.toLowerCase())
+                candidates = Array.from(
+                    document.querySelectorAll({repr('*' + _HIDDEN_FILTER)})
+                ).filter(el =>
+                    el.textContent.toLowerCase().includes(targetLower)
                 );
             }}
 
             if (candidates.length === 0) return null;
             if (candidates.length === 1) {{
                 const element = candidates[0];
-                const rect = element.getBoundingClientRect();
+                const rect = __sbRect(element);
 
                 return {{
                     elementId: element.id || null,
-                    tagName: element.tagName.toLowerCase(),
-                    text: element.textContent.trim(),
-                    attributes: Object.fromEntries(
-                        Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                    ),
+                    text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
+                    attributes: __sbAttrs(element),
                     boundingBox: {{
                         x: rect.x,
                         y: rect.y,
@@ -468,17 +1055,13 @@ class AdvancedElementSelector:
             candidates.forEach(element => {{
                 let score = 0.5; // Base score
 
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return;
-                }}
+                const rect = __sbRect(element);
+                if (rect.width < 1 || rect.height < 1) return;
 
                 // Check nearby text context
                 if (nearbyText) {{
                     const parent = element.closest('form, section, div, article');
-                    if (parent && parent.textContent.toLowerCase().includes(nearbyText.toLowerCase())) {{
+                    if (parent && parent.textContent.toLowerCase().includes(nearbyText)) {{
                         score += 0.3;
                     }}
                 }}
@@ -486,7 +1069,7 @@ class AdvancedElementSelector:
                 // Check form context
                 if (formContext && element.closest('form')) {{
                     const form = element.closest('form');
-                    if (form && form.textContent.toLowerCase().includes(formContext.toLowerCase())) {{
+                    if (form && form.textContent.toLowerCase().includes(formContext)) {{
                         score += 0.2;
                     }}
                 }}
@@ -494,22 +1077,18 @@ class AdvancedElementSelector:
                 // Check section context
                 if (sectionContext) {{
                     const section = element.closest('section, article, main, div');
-                    if (section && section.textContent.toLowerCase().includes(sectionContext.toLowerCase())) {{
+                    if (section && section.textContent.toLowerCase().includes(sectionContext)) {{
                         score += 0.2;
                     }}
                 }}
 
-                if (score > bestScore) {{
+                if (score > bestScore && __sbIsVisible(element, rect)) {{
                     bestScore = score;
                     bestMatch = {{
-                        element: element,
                         score: score,
                         elementId: element.id || null,
-                        tagName: element.tagName.toLowerCase(),
-                        text: element.textContent.trim(),
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
+                        text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
+                        attributes: __sbAttrs(element),
                         boundingBox: {{
                             x: rect.x,
                             y: rect.y,
@@ -528,23 +1107,25 @@ class AdvancedElementSelector:
         if not result_data:
             return None
 
-        return SelectionResult(
-            element_id=result_data.get("elementId"),
-            selector_used=selector.value,
-            strategy=SelectionStrategy.CONTEXT_AWARE,
-            confidence=result_data.get("score", 0.5),
-            bounding_box=result_data.get("boundingBox", {}),
-            attributes=result_data.get("attributes", {}),
-            text_content=result_data.get("text", ""),
+        return self._build_result(
+            result_data,
+            selector,
+            SelectionStrategy.CONTEXT_AWARE,
+            result_data.get("score", 0.5),
         )
 
     async def _attribute_pattern_strategy(
-        self, session: CDPSession, selector: ElementSelector
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Attribute pattern matching strategy."""
 
         script = f"""
         (function() {{
+            {_JS_HELPERS}
+
             const selectorType = {repr(selector.type.value)};
             const selectorValue = {repr(selector.value)};
 
@@ -565,13 +1146,8 @@ class AdvancedElementSelector:
             let bestScore = 0;
 
             candidates.forEach(element => {{
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden' ||
-                    rect.width < 1 || rect.height < 1) {{
-                    return;
-                }}
+                const rect = __sbRect(element);
+                if (rect.width < 1 || rect.height < 1) return;
 
                 let score = 0.7; // Base score for attribute match
 
@@ -586,15 +1162,12 @@ class AdvancedElementSelector:
                     score += 0.1;
                 }}
 
-                if (score > bestScore) {{
+                if (score > bestScore && __sbIsVisible(element, rect)) {{
                     bestScore = score;
                     bestMatch = {{
                         elementId: element.id || null,
-                        tagName: element.tagName.toLowerCase(),
-                        text: text,
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
+                        text: text.slice(0, {_MAX_TEXT_LENGTH}),
+                        attributes: __sbAttrs(element),
                         boundingBox: {{
                             x: rect.x,
                             y: rect.y,
@@ -614,18 +1187,18 @@ class AdvancedElementSelector:
         if not result_data:
             return None
 
-        return SelectionResult(
-            element_id=result_data.get("elementId"),
-            selector_used=selector.value,
-            strategy=SelectionStrategy.ATTRIBUTE_PATTERN,
-            confidence=result_data.get("score", 0.7),
-            bounding_box=result_data.get("boundingBox", {}),
-            attributes=result_data.get("attributes", {}),
-            text_content=result_data.get("text", ""),
+        return self._build_result(
+            result_data,
+            selector,
+            SelectionStrategy.ATTRIBUTE_PATTERN,
+            result_data.get("score", 0.7),
         )
 
     async def _visual_similarity_strategy(
-        self, session: CDPSession, selector: ElementSelector
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Visual similarity strategy (placeholder for future ML integration)."""
 
@@ -635,24 +1208,32 @@ class AdvancedElementSelector:
         return None
 
     async def _structural_strategy(
-        self, session: CDPSession, selector: ElementSelector
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        context: Optional[Dict[str, Any]] = None,
     ) -> Optional[SelectionResult]:
         """Structural relationship-based strategy."""
 
         script = f"""
         (function() {{
+            {_JS_HELPERS}
+
             const selectorValue = {repr(selector.value)};
             const selectorType = {repr(selector.type.value)};
+            const targetLower = {repr(_fold_text(selector.value) or '')};
 
             // Find elements using structural relationships
             let candidates = [];
 
             if (selectorType === 'text') {{
                 // Find by text content and then check structural context
-                const allElements = Array.from(document.querySelectorAll('*'));
+                const allElements = Array.from(
+                    document.querySelectorAll({repr('*' + _HIDDEN_FILTER)})
+                );
                 allElements.forEach(element => {{
                     const text = element.textContent.trim().toLowerCase();
-                    if (text.includes(selectorValue.toLowerCase())) {{
+                    if (text.includes(targetLower)) {{
                         candidates.push(element);
                     }}
                 }});
@@ -665,12 +1246,8 @@ class AdvancedElementSelector:
             let bestScore = 0;
 
             candidates.forEach(element => {{
-                const rect = element.getBoundingClientRect();
-                const style = window.getComputedStyle(element);
-
-                if (style.display === 'none' || style.visibility === 'hidden') {{
-                    return;
-                }}
+                const rect = __sbRect(element);
+                if (rect.width < 1 || rect.height < 1) return;
 
                 let score = 0.5;
 
@@ -698,15 +1275,11 @@ class AdvancedElementSelector:
                     score += 0.1;
                 }}
 
-                if (score > bestScore) {{
+                if (score > bestScore && __sbIsVisible(element, rect)) {{
                     bestScore = score;
                     bestMatch = {{
                         elementId: element.id || null,
-                        tagName: element.tagName.toLowerCase(),
-                        text: element.textContent.trim(),
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
+                        text: element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH}),
                         boundingBox: {{
                             x: rect.x,
                             y: rect.y,
@@ -726,14 +1299,59 @@ class AdvancedElementSelector:
         if not result_data:
             return None
 
+        return self._build_result(
+            result_data,
+            selector,
+            SelectionStrategy.STRUCTURAL,
+            result_data.get("score", 0.5),
+        )
+
+    def _build_result(
+        self,
+        data: Dict[str, Any],
+        selector: ElementSelector,
+        strategy: SelectionStrategy,
+        confidence: float,
+    ) -> SelectionResult:
+        """Build a selection result from a script payload."""
         return SelectionResult(
-            element_id=result_data.get("elementId"),
+            element_id=data.get("elementId"),
             selector_used=selector.value,
-            strategy=SelectionStrategy.STRUCTURAL,
-            confidence=result_data.get("score", 0.5),
-            bounding_box=result_data.get("boundingBox", {}),
-            attributes=result_data.get("attributes", {}),
-            text_content=result_data.get("text", ""),
+            strategy=strategy,
+            confidence=confidence,
+            bounding_box=data.get("boundingBox", {}),
+            attributes=_intern_attributes(data.get("attributes")),
+            text_content=data.get("text", ""),
+            # Single-element strategies only ever return visible elements
+            flags=ElementFlags.VISIBLE,
+        )
+
+    def _build_row_result(
+        self,
+        row: List[Any],
+        names: List[str],
+        selector: ElementSelector,
+        strategy: SelectionStrategy,
+        confidence: float,
+        value_cache: Optional[Dict[str, str]] = None,
+    ) -> SelectionResult:
+        """Build a selection result from a compact multi-element script row.
+
+        Rows are ``[elementId, [x, y, width, height], attributes, text,
+        flags]``, which keeps key names out of the serialized payload.
+        Attributes are ``[code, value, ...]`` pairs indexing the batch's
+        ``names`` table, and flags is an ``ElementFlags`` bitfield.
+        """
+        element_id, box, attributes, text, flags = row
+        return SelectionResult(
+            element_id=element_id,
+            selector_used=selector.value,
+            strategy=strategy,
+            confidence=confidence,
+            bounding_box=dict(zip(_BOX_KEYS, box)),
+            attributes=_decode_attributes(attributes, names, value_cache),
+            text_content=text,
+            flags=ElementFlags(flags),
         )
 
     async def _calculate_adaptive_timeout(
@@ -791,57 +1409,152 @@ class AdvancedElementSelector:
         return adaptive_timeout
 
     async def _find_exact_matches(
-        self, session: CDPSession, selector: ElementSelector, limit: int
-    ) -> List[SelectionResult]:
-        """Find exact matches for multiple elements."""
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        limit: int,
+        fast_path: bool = False,
+    ) -> AsyncIterator[SelectionResult]:
+        """Yield exact matches for multiple elements."""
 
-        if selector.type == ElementSelectorType.CSS:
-            script = f"""
-            (function() {{
-                const elements = Array.from(document.querySelectorAll({repr(selector.value)}))
-                    .slice(0, {limit});
+        script = self._exact_matches_script(selector, limit, fast_path)
+        if script is None:
+            return
 
-                return elements.map(element => {{
-                    const rect = element.getBoundingClientRect();
-                    const style = window.getComputedStyle(element);
+        payload = await session.runtime.evaluate(script)
+        if not payload or not payload.get("rows"):
+            return
 
-                    return {{
-                        elementId: element.id || null,
-                        tagName: element.tagName.toLowerCase(),
-                        text: element.textContent.trim(),
-                        attributes: Object.fromEntries(
-                            Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                        ),
-                        boundingBox: {{
-                            x: rect.x,
-                            y: rect.y,
-                            width: rect.width,
-                            height: rect.height
-                        }},
-                        isVisible: style.display !== 'none' && style.visibility !== 'hidden'
-                    }};
-                }}).filter(item => item.isVisible);
+        names = _intern_names(payload)
+
+        # Similar elements repeat attribute values too (class="item"...)
+        value_cache: Dict[str, str] = {}
+
+        for row in payload["rows"][:limit]:
+            yield self._build_row_result(
+                row, names, selector, SelectionStrategy.EXACT_MATCH, 1.0, value_cache
+            )
+
+    def _exact_matches_script(
+        self, selector: ElementSelector, limit: int, fast_path: bool
+    ) -> Optional[str]:
+        """Get the multi-element selection script for a selector, cached."""
+
+        # Polling loops select the same selector repeatedly, so build each
+        # script once and send V8 an identical source it has already compiled
+        key = (selector.type, selector.value, selector.visible_only, limit, fast_path)
+        script = self._script_cache.get(key)
+        if script is None:
+            script = self._build_exact_matches_script(selector, limit, fast_path)
+            if script is None:
+                return None
+
+            if len(self._script_cache) >= _SCRIPT_CACHE_SIZE:
+                self._script_cache.clear()
+            self._script_cache[key] = script
+
+        return script
+
+    def _build_exact_matches_script(
+        self, selector: ElementSelector, limit: int, fast_path: bool
+    ) -> Optional[str]:
+        """Build the multi-element selection script for a selector."""
+
+        if fast_path:
+            attributes_js = "null"
+            text_js = '""'
+        else:
+            attributes_js = "__sbAttrPairs(element, names, codes)"
+            text_js = f"element.textContent.trim().slice(0, {_MAX_TEXT_LENGTH})"
+
+        elements_js = self._elements_expression(selector, limit)
+        if elements_js is None:
+            return None
+
+        # Hidden elements are dropped in the page rather than shipped
+        visible_only_js = "true" if selector.visible_only else "false"
+
+        return f"""
+            (function() {{
+                {_JS_HELPERS}
+
+                const elements = {elements_js};
+
+                // Read all geometry in one pass before any style reads, so
+                // layout is resolved once rather than per element
+                const rects = elements.map(__sbRect);
+                const names = [];
+                const codes = new Map();
+                const rows = [];
+
+                elements.forEach((element, index) => {{
+                    const rect = rects[index];
+                    const flags = __sbFlags(element, rect);
+                    if ({visible_only_js} && !(flags & 1)) return;
+
+                    rows.push([
+                        element.id || null,
+                        [rect.x, rect.y, rect.width, rect.height],
+                        {attributes_js},
+                        {text_js},
+                        flags
+                    ]);
+                }});
+
+                return {{names: names, rows: rows}};
             }})()
             """
+
+    def _elements_expression(
+        self, selector: ElementSelector, limit: int
+    ) -> Optional[str]:
+        """Build a JS expression evaluating to up to ``limit`` matching elements."""
+
+        if selector.type == ElementSelectorType.CSS:
+            css = selector.value
+        elif selector.type == ElementSelectorType.XPATH:
+            css = _xpath_to_css(selector.value)
         else:
-            return []
+            return None
 
-        results_data = await session.runtime.evaluate(script) or []
+        if css is not None and _BROAD_SELECTOR_PATTERN.match(css):
+            # '*'-rooted selectors match most of the document; walk it and
+            # stop at the limit instead of materializing every element
+            return f"""(() => {{
+                    const walker = document.createTreeWalker(
+                        document, NodeFilter.SHOW_ELEMENT
+                    );
+                    const nodes = [];
+                    let node;
+                    while (nodes.length < {limit} && (node = walker.nextNode())) {{
+                        if (node.matches({repr(css)})) nodes.push(node);
+                    }}
+                    return nodes;
+                }})()"""
 
-        results = []
-        for data in results_data:
-            result = SelectionResult(
-                element_id=data.get("elementId"),
-                selector_used=selector.value,
-                strategy=SelectionStrategy.EXACT_MATCH,
-                confidence=1.0,
-                bounding_box=data.get("boundingBox", {}),
-                attributes=data.get("attributes", {}),
-                text_content=data.get("text", ""),
+        if css is not None:
+            return (
+                "Array.prototype.slice.call("
+                f"document.querySelectorAll({repr(css)}), 0, {limit})"
             )
-            results.append(result)
 
-        return results
+        return f"""(() => {{
+                    const snapshot = document.evaluate(
+                        {repr(selector.value)},
+                        document,
+                        null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+                        null
+                    );
+                    const nodes = [];
+                    for (let i = 0; i < snapshot.snapshotLength; i++) {{
+                        const node = snapshot.snapshotItem(i);
+                        if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                        nodes.push(node);
+                        if (nodes.length === {limit}) break;
+                    }}
+                    return nodes;
+                }})()"""
 
     async def _find_fuzzy_matches(
         self,
@@ -852,6 +1565,109 @@ class AdvancedElementSelector:
     ) -> List[SelectionResult]:
         """Find fuzzy matches for multiple elements."""
 
-        # Implement fuzzy matching logic similar to single element
-        # but return multiple results above threshold
-        return []  # Placeholder for now
+        if selector.type != ElementSelectorType.TEXT:
+            return []
+
+        target = _fold_text(selector.value)
+        if not target:
+            return []
+
+        phrases, pattern = _compile_target_phrases(target)
+        if not phrases:
+            return []
+
+        # Harvest the shards concurrently so their evaluation and
+        # serialization overlap on the CDP connection
+        shards = await asyncio.gather(
+            *(
+                self._harvest_candidates(session, shard_selector)
+                for shard_selector in _HARVEST_SHARDS
+            )
+        )
+
+        # Attribute pairs stay encoded until a row makes the limit
+        candidates = [(row, names) for names, rows in shards for row in rows]
+        texts = [row[3].lower() for row, _ in candidates]
+        hits = _find_phrase_hits(pattern, texts)
+
+        # Substring hits take precedence over similarity scores
+        scores = _score_phrase_similarity(phrases, texts, threshold)
+        scores.update(dict.fromkeys(hits, 0.9))
+        if not scores:
+            return []
+
+        # Rank candidate indices only, in document order for equal scores,
+        # and build results just for the rows that make the cut
+        ranked = heapq.nlargest(limit, sorted(scores), key=scores.__getitem__)
+
+        value_cache: Dict[str, str] = {}
+        results = []
+
+        for index in ranked:
+            row, names = candidates[index]
+            results.append(
+                self._build_row_result(
+                    row,
+                    names,
+                    selector,
+                    SelectionStrategy.FUZZY_TEXT,
+                    scores[index],
+                    value_cache,
+                )
+            )
+
+        return results
+
+    async def _harvest_candidates(
+        self, session: CDPSession, shard_selector: str
+    ) -> Tuple[List[str], List[List[Any]]]:
+        """Collect visible, non-empty text candidates for fuzzy scoring.
+
+        Returns:
+            The shard's attribute name table and its candidate rows
+        """
+
+        script = f"""
+        (function() {{
+            {_JS_HELPERS}
+
+            const elements = [];
+            const texts = [];
+
+            document.querySelectorAll({repr(shard_selector)}).forEach(element => {{
+                const text = element.textContent.trim();
+                if (text.length === 0) return;
+
+                elements.push(element);
+                texts.push(text);
+            }});
+
+            // Read all geometry in one pass before any style reads, so
+            // layout is resolved once rather than per element
+            const rects = elements.map(__sbRect);
+            const names = [];
+            const codes = new Map();
+            const rows = [];
+
+            elements.forEach((element, index) => {{
+                const rect = rects[index];
+                const flags = __sbFlags(element, rect);
+                if (!(flags & 1)) return;
+
+                rows.push([
+                    element.id || null,
+                    [rect.x, rect.y, rect.width, rect.height],
+                    __sbAttrPairs(element, names, codes),
+                    texts[index].slice(0, {_MAX_TEXT_LENGTH}),
+                    flags
+                ]);
+            }});
+
+            return {{names: names, rows: rows}};
+        }})()
+        """
+
+        payload = await session.runtime.evaluate(script)
+        if not payload or not payload.get("rows"):
+            return [], []
+        return _intern_names(payload), payload["rows"]
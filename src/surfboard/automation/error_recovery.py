@@ -6,13 +6,19 @@ failure analysis, and adaptive recovery mechanisms.
 """
 
 import asyncio
+import json
 import logging
 import random
+import re
 import time
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
+from ..protocols.cdp import CDPConnectionError, CDPTimeoutError
 from ..protocols.cdp_domains import CDPSession
 from ..protocols.llm_protocol import (
     BaseCommand,
@@ -55,7 +61,276 @@ class RecoveryStrategy(str, Enum):
     GRACEFUL_DEGRADATION = "graceful_degradation"
 
 
-@dataclass
+# Error message keywords per error type, in classification priority order
+_ERROR_KEYWORDS = (
+    (ErrorType.ELEMENT_NOT_FOUND, ("element not found", "no such element")),
+    (ErrorType.ELEMENT_NOT_CLICKABLE, ("not clickable", "not interactable")),
+    (ErrorType.TIMEOUT_ERROR, ("timeout",)),
+    (ErrorType.NETWORK_ERROR, ("network", "connection")),
+    (ErrorType.NAVIGATION_ERROR, ("navigation",)),
+    (ErrorType.SCRIPT_ERROR, ("script", "javascript")),
+    (ErrorType.ELEMENT_STALE, ("stale",)),
+    (ErrorType.PAGE_CRASH, ("crash",)),
+    (ErrorType.PERMISSION_DENIED, ("permission",)),
+    (ErrorType.RATE_LIMITED, ("rate limit",)),
+)
+
+# All keywords in one case-insensitive pattern, one named group per type, so
+# a single scan classifies a message
+_ERROR_PATTERN = re.compile(
+    "|".join(
+        f"(?P<t{priority}>{'|'.join(map(re.escape, keywords))})"
+        for priority, (_, keywords) in enumerate(_ERROR_KEYWORDS)
+    ),
+    re.IGNORECASE,
+)
+
+
+# Exception classes that identify the error type on their own, without
+# looking at the message
+_EXCEPTION_CLASS_TYPES: Dict[type, ErrorType] = {
+    asyncio.TimeoutError: ErrorType.TIMEOUT_ERROR,
+    TimeoutError: ErrorType.TIMEOUT_ERROR,
+    ConnectionError: ErrorType.NETWORK_ERROR,
+    PermissionError: ErrorType.PERMISSION_DENIED,
+    CDPTimeoutError: ErrorType.TIMEOUT_ERROR,
+    CDPConnectionError: ErrorType.CONNECTION_LOST,
+}
+
+
+@lru_cache(maxsize=128)
+def _classify_exception_class(error_class: type) -> Optional[ErrorType]:
+    """Resolve an exception class through its MRO, once per class."""
+    for base in error_class.__mro__:
+        error_type = _EXCEPTION_CLASS_TYPES.get(base)
+        if error_type is not None:
+            return error_type
+    return None
+
+
+# Upper bound for a single context probe evaluation, so a wedged page
+# cannot stall the recovery path
+_EVAL_TIMEOUT = 0.5
+
+# Page probes shared by the individual context helpers and the fused
+# error-path probe
+_PAGE_STATE_PROBE = """
+function() {
+    return {
+        url: window.location.href,
+        title: document.title,
+        readyState: document.readyState,
+        elementCount: document.querySelectorAll('*').length,
+        errorElements: document.querySelectorAll('.error, .alert, .warning').length,
+        modalElements: document.querySelectorAll('.modal, .popup, .dialog').length,
+        loadingElements: document.querySelectorAll('.loading, .spinner').length,
+        timestamp: Date.now()
+    };
+}
+"""
+
+_ELEMENT_INFO_PROBE = """
+function(selectorType, selectorValue) {
+    let element = null;
+
+    try {
+        if (selectorType === 'css') {
+            element = document.querySelector(selectorValue);
+        } else if (selectorType === 'xpath') {
+            const result = document.evaluate(
+                selectorValue, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            );
+            element = result.singleNodeValue;
+        }
+    } catch (e) {
+        return {error: e.message};
+    }
+
+    if (!element) {
+        return {found: false, similar: []};
+    }
+
+    const rect = element.getBoundingClientRect();
+    const style = window.getComputedStyle(element);
+
+    return {
+        found: true,
+        tagName: element.tagName.toLowerCase(),
+        text: element.textContent.trim().substring(0, 100),
+        visible: style.display !== 'none' && style.visibility !== 'hidden',
+        rect: {
+            x: rect.x,
+            y: rect.y,
+            width: rect.width,
+            height: rect.height
+        },
+        attributes: Object.fromEntries(
+            Array.from(element.attributes).map(attr => [attr.name, attr.value])
+        )
+    };
+}
+"""
+
+_NETWORK_INFO_PROBE = """
+function() {
+    const connection = navigator.connection || navigator.mozConnection || navigator.webkitConnection;
+    return {
+        online: navigator.onLine,
+        connectionType: connection ? connection.effectiveType : 'unknown',
+        networkState: document.readyState,
+        performanceEntries: performance.getEntriesByType('navigation').length
+    };
+}
+"""
+
+_ELEMENT_WAIT_PROBE = """
+function(selectorType, selectorValue) {
+    return new Promise((resolve) => {
+        let attempts = 0;
+        const maxAttempts = 30; // 3 seconds
+
+        function checkElement() {
+            let element = null;
+
+            if (selectorType === 'css') {
+                element = document.querySelector(selectorValue);
+            }
+
+            if (element) {
+                const rect = element.getBoundingClientRect();
+                const style = window.getComputedStyle(element);
+
+                if (style.display !== 'none' &&
+                    style.visibility !== 'hidden' &&
+                    rect.width > 0 && rect.height > 0) {
+                    resolve(true);
+                    return;
+                }
+            }
+
+            attempts++;
+            if (attempts >= maxAttempts) {
+                resolve(false);
+                return;
+            }
+
+            setTimeout(checkElement, 100);
+        }
+
+        checkElement();
+    });
+}
+"""
+
+_VISIBLE_ELEMENT_PROBE = """
+function(selectorType, selectorValue) {
+    let element = null;
+
+    if (selectorType === 'css') {
+        element = document.querySelector(selectorValue);
+    }
+
+    if (element) {
+        const rect = element.getBoundingClientRect();
+        const style = window.getComputedStyle(element);
+
+        return style.display !== 'none' &&
+               style.visibility !== 'hidden' &&
+               rect.width > 0 && rect.height > 0;
+    }
+
+    return false;
+}
+"""
+
+# All three probes in one evaluation; a probe that throws reports the same
+# error dict its standalone helper would
+_PROBE_TEMPLATE = f"""
+(function(selectorType, selectorValue) {{
+    const run = (probe, message) => {{
+        try {{
+            return probe() || {{}};
+        }} catch (e) {{
+            return {{error: message}};
+        }}
+    }};
+    return {{
+        page: run({_PAGE_STATE_PROBE.strip()}, 'Could not retrieve page state'),
+        element: selectorType === null ? {{}} : run(
+            () => ({_ELEMENT_INFO_PROBE.strip()})(selectorType, selectorValue),
+            'Could not retrieve element info'
+        ),
+        network: run({_NETWORK_INFO_PROBE.strip()}, 'Could not retrieve network info')
+    }};
+}})"""
+
+
+def _call_probe(probe: str, *args: Optional[str]) -> str:
+    """Build an expression that calls a constant probe with literal arguments.
+
+    Arguments are JSON-encoded, which is always a valid JavaScript literal.
+    """
+    arguments = ", ".join(json.dumps(arg) for arg in args)
+    return f"({probe.strip()})({arguments})"
+
+
+# Fallback strategies for error types without a dedicated mapping
+_DEFAULT_STRATEGIES = (
+    RecoveryStrategy.EXPONENTIAL_BACKOFF,
+    RecoveryStrategy.GRACEFUL_DEGRADATION,
+)
+
+# Strategies that never consult the probed page context
+_PROBE_FREE_STRATEGIES = frozenset(
+    {RecoveryStrategy.IMMEDIATE_RETRY, RecoveryStrategy.EXPONENTIAL_BACKOFF}
+)
+
+# Strategies that read the page state (the current URL)
+_PAGE_CONTEXT_STRATEGIES = frozenset(
+    {RecoveryStrategy.PAGE_REFRESH, RecoveryStrategy.NAVIGATION_RETRY}
+)
+
+
+# Argument-free probe expressions, built once
+_PAGE_STATE_JS = _call_probe(_PAGE_STATE_PROBE)
+_NETWORK_INFO_JS = _call_probe(_NETWORK_INFO_PROBE)
+_PAGE_PROBE_JS = _call_probe(_PROBE_TEMPLATE, None, None)
+
+_CONTEXT_RECOVERY_JS = """
+(function() {
+    let closed = 0;
+
+    // Close common modal patterns
+    const closeSelectors = [
+        '.modal .close', '.modal button[aria-label="Close"]',
+        '.popup .close', '.dialog .close',
+        '.overlay .close', '.lightbox .close',
+        '[data-dismiss="modal"]', '[data-close="modal"]'
+    ];
+
+    closeSelectors.forEach(selector => {
+        document.querySelectorAll(selector).forEach(btn => {
+            if (btn.offsetParent !== null) {  // Visible element
+                btn.click();
+                closed++;
+            }
+        });
+    });
+
+    // Try pressing Escape key
+    document.body.dispatchEvent(new KeyboardEvent('keydown', {
+        key: 'Escape',
+        keyCode: 27,
+        bubbles: true
+    }));
+
+    return {closed: closed, escapeSent: true};
+})()
+"""
+
+
+@dataclass(slots=True)
 class ErrorContext:
     """Context information about an error."""
 
@@ -68,9 +343,15 @@ class ErrorContext:
     element_info: Dict[str, Any] = field(default_factory=dict)
     network_info: Dict[str, Any] = field(default_factory=dict)
     additional_context: Dict[str, Any] = field(default_factory=dict)
+    selector: Optional[ElementSelector] = None
 
+    def __post_init__(self):
+        # Resolved once here so strategies don't probe the command each time
+        if self.selector is None:
+            self.selector = getattr(self.command, "selector", None)
 
-@dataclass
+
+@dataclass(slots=True)
 class RecoveryResult:
     """Result of error recovery attempt."""
 
@@ -88,44 +369,63 @@ class ErrorRecoverySystem:
 
     def __init__(self):
         """Initialize error recovery system."""
-        self.error_history = []
+        self.error_history: deque = deque(maxlen=500)
         self.recovery_patterns = {}
+        # Per error type strategy outcome counts, updated incrementally
+        self.pattern_success: Dict[ErrorType, Counter] = defaultdict(Counter)
+        self.pattern_fail: Dict[ErrorType, Counter] = defaultdict(Counter)
         self.max_retry_attempts = 3
         self.base_retry_delay = 1.0
         self.max_retry_delay = 30.0
+        self._rng = random.Random()
+        # Running recoveries shared by identical concurrent errors
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+        # Strategy handlers
+        self._dispatch = {
+            RecoveryStrategy.IMMEDIATE_RETRY: self._immediate_retry,
+            RecoveryStrategy.EXPONENTIAL_BACKOFF: self._exponential_backoff,
+            RecoveryStrategy.ELEMENT_WAIT_RETRY: self._element_wait_retry,
+            RecoveryStrategy.PAGE_REFRESH: self._page_refresh,
+            RecoveryStrategy.ALTERNATIVE_SELECTOR: self._alternative_selector,
+            RecoveryStrategy.NAVIGATION_RETRY: self._navigation_retry,
+            RecoveryStrategy.SESSION_RESTART: self._session_restart,
+            RecoveryStrategy.CONTEXT_RECOVERY: self._context_recovery,
+            RecoveryStrategy.GRACEFUL_DEGRADATION: self._graceful_degradation,
+        }
 
         # Strategy mapping
         self.strategy_map = {
-            ErrorType.ELEMENT_NOT_FOUND: [
+            ErrorType.ELEMENT_NOT_FOUND: (
                 RecoveryStrategy.ELEMENT_WAIT_RETRY,
                 RecoveryStrategy.ALTERNATIVE_SELECTOR,
                 RecoveryStrategy.PAGE_REFRESH,
-            ],
-            ErrorType.ELEMENT_NOT_CLICKABLE: [
+            ),
+            ErrorType.ELEMENT_NOT_CLICKABLE: (
                 RecoveryStrategy.ELEMENT_WAIT_RETRY,
                 RecoveryStrategy.CONTEXT_RECOVERY,
                 RecoveryStrategy.ALTERNATIVE_SELECTOR,
-            ],
-            ErrorType.TIMEOUT_ERROR: [
+            ),
+            ErrorType.TIMEOUT_ERROR: (
                 RecoveryStrategy.EXPONENTIAL_BACKOFF,
                 RecoveryStrategy.PAGE_REFRESH,
                 RecoveryStrategy.NAVIGATION_RETRY,
-            ],
-            ErrorType.NETWORK_ERROR: [
+            ),
+            ErrorType.NETWORK_ERROR: (
                 RecoveryStrategy.EXPONENTIAL_BACKOFF,
                 RecoveryStrategy.NAVIGATION_RETRY,
                 RecoveryStrategy.SESSION_RESTART,
-            ],
-            ErrorType.NAVIGATION_ERROR: [
+            ),
+            ErrorType.NAVIGATION_ERROR: (
                 RecoveryStrategy.NAVIGATION_RETRY,
                 RecoveryStrategy.SESSION_RESTART,
                 RecoveryStrategy.GRACEFUL_DEGRADATION,
-            ],
-            ErrorType.PAGE_CRASH: [
+            ),
+            ErrorType.PAGE_CRASH: (
                 RecoveryStrategy.SESSION_RESTART,
                 RecoveryStrategy.NAVIGATION_RETRY,
                 RecoveryStrategy.GRACEFUL_DEGRADATION,
-            ],
+            ),
         }
 
     async def handle_error(
@@ -148,31 +448,88 @@ class ErrorRecoverySystem:
         Returns:
             Recovery result with success status and strategy used
         """
-        start_time = time.time()
+        # Classify first; strategy selection needs no page context
+        error_context = self._classify_fast(
+            error, command, attempt_count, context or {}
+        )
 
-        # Analyze error to determine type and context
-        error_context = await self._analyze_error(
-            session, error, command, attempt_count, context or {}
+        # Identical errors on the same session and attempt share one
+        # recovery flight. It runs in its own task, so cancelling whichever
+        # caller started it leaves the others waiting on it.
+        selector = error_context.selector
+        key = (
+            session,
+            error_context.error_type,
+            selector and selector.type,
+            selector and selector.value,
+            error_context.attempt_count,
         )
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._recover_shared(session, error_context))
+            self._inflight[key] = flight
+            flight.add_done_callback(partial(self._end_flight, key))
+
+        result, selector_state = await asyncio.shield(flight)
+
+        # A recovery may rewrite the selector (ALTERNATIVE_SELECTOR); every
+        # caller's own command gets the rewritten one
+        if selector is not None and selector_state is not None:
+            selector.type, selector.value = selector_state
+        return result
+
+    async def _recover_shared(
+        self, session: CDPSession, error_context: ErrorContext
+    ) -> Tuple[RecoveryResult, Optional[Tuple[Any, str]]]:
+        """Recover, reporting the selector as the recovery left it."""
+        result = await self._recover(session, error_context)
+        selector = error_context.selector
+        return result, selector and (selector.type, selector.value)
+
+    def _end_flight(self, key: tuple, flight: asyncio.Task) -> None:
+        """Forget a finished recovery flight."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # Retrieved so a flight whose callers were all cancelled does not warn
+        if not flight.cancelled():
+            flight.exception()
+
+    async def _recover(
+        self, session: CDPSession, error_context: ErrorContext
+    ) -> RecoveryResult:
+        """Run the recovery strategy ladder for a classified error."""
+        start_time = time.monotonic()
+        attempt_count = error_context.attempt_count
 
         logger.warning(
-            f"Handling error: {error_context.error_type} (attempt {attempt_count})"
+            "Handling error: %s (attempt %d)", error_context.error_type, attempt_count
         )
 
         # Get appropriate recovery strategies
         strategies = self._get_recovery_strategies(error_context)
 
+        # Backoff-style strategies never read the page, so only probe it
+        # up front when something else leads, and lazily otherwise
+        enriched = False
+        if strategies and strategies[0] not in _PROBE_FREE_STRATEGIES:
+            await self._enrich_context(session, error_context)
+            enriched = True
+
         # Try each strategy
         for strategy in strategies:
             try:
-                logger.debug(f"Attempting recovery strategy: {strategy}")
+                if not enriched and strategy in _PAGE_CONTEXT_STRATEGIES:
+                    await self._enrich_context(session, error_context)
+                    enriched = True
+
+                logger.debug("Attempting recovery strategy: %s", strategy)
 
                 success, result = await self._apply_recovery_strategy(
                     session, strategy, error_context
                 )
 
                 if success:
-                    recovery_time = time.time() - start_time
+                    recovery_time = time.monotonic() - start_time
 
                     # Learn from successful recovery
                     self._record_successful_recovery(
@@ -189,11 +546,13 @@ class ErrorRecoverySystem:
                     )
 
             except Exception as strategy_error:
-                logger.debug(f"Recovery strategy {strategy} failed: {strategy_error}")
+                logger.debug(
+                    "Recovery strategy %s failed: %s", strategy, strategy_error
+                )
                 continue
 
         # All strategies failed
-        recovery_time = time.time() - start_time
+        recovery_time = time.monotonic() - start_time
 
         # Try graceful degradation as last resort
         fallback_result = await self._attempt_graceful_degradation(
@@ -237,17 +596,19 @@ class ErrorRecoverySystem:
 
         for attempt in range(1, max_attempts + 1):
             try:
-                logger.debug(f"Executing operation (attempt {attempt}/{max_attempts})")
+                logger.debug(
+                    "Executing operation (attempt %d/%d)", attempt, max_attempts
+                )
                 result = await operation()
-                logger.debug(f"Operation succeeded on attempt {attempt}")
+                logger.debug("Operation succeeded on attempt %d", attempt)
                 return True, result
 
             except Exception as error:
                 last_error = error
-                logger.debug(f"Operation failed on attempt {attempt}: {error}")
+                logger.debug("Operation failed on attempt %d: %s", attempt, error)
 
                 if attempt == max_attempts:
-                    logger.error(f"Operation failed after {max_attempts} attempts")
+                    logger.error("Operation failed after %d attempts", max_attempts)
                     break
 
                 # Apply error recovery
@@ -256,21 +617,52 @@ class ErrorRecoverySystem:
                 )
 
                 if not recovery_result.success:
-                    logger.error(f"Error recovery failed on attempt {attempt}")
+                    logger.error("Error recovery failed on attempt %d", attempt)
                     # Continue to next attempt anyway
 
-                # Wait before retry with exponential backoff
-                delay = min(
-                    self.base_retry_delay * (2 ** (attempt - 1)), self.max_retry_delay
-                ) + random.uniform(
-                    0, 0.5
-                )  # Add jitter
+                # Wait before retry with exponential backoff and full jitter
+                cap = min(
+                    self.base_retry_delay * (1 << (attempt - 1)), self.max_retry_delay
+                )
+                delay = self._rng.random() * cap
 
-                logger.debug(f"Waiting {delay:.1f}s before retry")
+                logger.debug("Waiting %.1fs before retry", delay)
                 await asyncio.sleep(delay)
 
         return False, last_error
 
+    def load_history(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Replay persisted recovery history into the learning state.
+
+        Args:
+            entries: History entries shaped like recorded ones; enum fields
+                may be given by value, and entries without an ``error_type``
+                are classified from their ``error_message``
+        """
+        # Replayed logs repeat the same few messages, so classify each once
+        classified: Dict[str, ErrorType] = {}
+
+        for entry in entries:
+            entry = dict(entry)
+
+            error_type = entry.get("error_type")
+            if error_type is None:
+                message = str(entry.get("error_message", ""))
+                error_type = classified.get(message)
+                if error_type is None:
+                    error_type = self._classify_error(Exception(message), message)
+                    classified[message] = error_type
+            entry["error_type"] = error_type = ErrorType(error_type)
+
+            strategy = entry.get("strategy")
+            if strategy is not None:
+                entry["strategy"] = strategy = RecoveryStrategy(strategy)
+                self._update_recovery_patterns(
+                    error_type, strategy, bool(entry.get("success", False))
+                )
+
+            self.error_history.append(entry)
+
     async def _analyze_error(
         self,
         session: CDPSession,
@@ -281,79 +673,103 @@ class ErrorRecoverySystem:
     ) -> ErrorContext:
         """Analyze error to determine type and gather context."""
 
-        error_type = self._classify_error(error)
+        error_context = self._classify_fast(error, command, attempt_count, context)
+        await self._enrich_context(session, error_context)
+        return error_context
 
-        # Gather page state information
-        page_state = await self._get_page_state(session)
-
-        # Gather element information if relevant
-        element_info = {}
-        if hasattr(command, "selector") and command.selector:
-            element_info = await self._get_element_info(session, command.selector)
-
-        # Gather network information
-        network_info = await self._get_network_info(session)
+    def _classify_fast(
+        self,
+        error: Exception,
+        command: BaseCommand,
+        attempt_count: int,
+        context: Dict[str, Any],
+    ) -> ErrorContext:
+        """Build an error context from the error alone, without page I/O."""
 
+        # Rendered once; long messages (stack traces) are not re-stringified
+        message = str(error)
         return ErrorContext(
-            error_type=error_type,
-            error_message=str(error),
+            error_type=self._classify_error(error, message),
+            error_message=message,
             command=command,
             attempt_count=attempt_count,
             timestamp=time.time(),
-            page_state=page_state,
-            element_info=element_info,
-            network_info=network_info,
             additional_context=context,
         )
 
-    def _classify_error(self, error: Exception) -> ErrorType:
+    async def _enrich_context(
+        self, session: CDPSession, error_context: ErrorContext
+    ) -> None:
+        """Fill in page state, element and network info from the page."""
+
+        (
+            error_context.page_state,
+            error_context.element_info,
+            error_context.network_info,
+        ) = await self._combined_probe(session, error_context.selector)
+
+    def _classify_error(
+        self, error: Exception, message: Optional[str] = None
+    ) -> ErrorType:
         """Classify error type based on error message and type."""
 
-        error_str = str(error).lower()
-
-        if "element not found" in error_str or "no such element" in error_str:
-            return ErrorType.ELEMENT_NOT_FOUND
-        elif "not clickable" in error_str or "not interactable" in error_str:
-            return ErrorType.ELEMENT_NOT_CLICKABLE
-        elif "timeout" in error_str:
-            return ErrorType.TIMEOUT_ERROR
-        elif "network" in error_str or "connection" in error_str:
-            return ErrorType.NETWORK_ERROR
-        elif "navigation" in error_str:
-            return ErrorType.NAVIGATION_ERROR
-        elif "script" in error_str or "javascript" in error_str:
-            return ErrorType.SCRIPT_ERROR
-        elif "stale" in error_str:
-            return ErrorType.ELEMENT_STALE
-        elif "crash" in error_str:
-            return ErrorType.PAGE_CRASH
-        elif "permission" in error_str:
-            return ErrorType.PERMISSION_DENIED
-        elif "rate limit" in error_str:
-            return ErrorType.RATE_LIMITED
-        else:
+        error_type = _classify_exception_class(type(error))
+        if error_type is not None:
+            return error_type
+
+        # Messages can mention several keywords; the highest priority type
+        # wins regardless of where its keyword appears
+        if message is None:
+            message = str(error)
+
+        best = len(_ERROR_KEYWORDS)
+        for match in _ERROR_PATTERN.finditer(message):
+            best = min(best, int(match.lastgroup[1:]))
+            if best == 0:
+                break
+
+        if best == len(_ERROR_KEYWORDS):
             return ErrorType.UNKNOWN_ERROR
+        return _ERROR_KEYWORDS[best][0]
+
+    async def _combined_probe(
+        self, session: CDPSession, selector: Optional[ElementSelector]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Get page state, element and network info in one evaluation."""
+
+        if selector:
+            script = _call_probe(_PROBE_TEMPLATE, selector.type.value, selector.value)
+        else:
+            script = _PAGE_PROBE_JS
+
+        try:
+            probe = await asyncio.wait_for(
+                session.runtime.evaluate(script), _EVAL_TIMEOUT
+            )
+        except Exception:
+            return (
+                {"error": "Could not retrieve page state"},
+                {"error": "Could not retrieve element info"} if selector else {},
+                {"error": "Could not retrieve network info"},
+            )
+
+        probe = probe or {}
+        return (
+            probe.get("page") or {},
+            probe.get("element") or {},
+            probe.get("network") or {},
+        )
 
     async def _get_page_state(self, session: CDPSession) -> Dict[str, Any]:
         """Get current page state information."""
 
-        script = """
-        (function() {
-            return {
-                url: window.location.href,
-                title: document.title,
-                readyState: document.readyState,
-                elementCount: document.querySelectorAll('*').length,
-                errorElements: document.querySelectorAll('.error, .alert, .warning').length,
-                modalElements: document.querySelectorAll('.modal, .popup, .dialog').length,
-                loadingElements: document.querySelectorAll('.loading, .spinner').length,
-                timestamp: Date.now()
-            };
-        })()
-        """
+        script = _PAGE_STATE_JS
 
         try:
-            return await session.runtime.evaluate(script) or {}
+            result = await asyncio.wait_for(
+                session.runtime.evaluate(script), _EVAL_TIMEOUT
+            )
+            return result or {}
         except Exception:
             return {"error": "Could not retrieve page state"}
 
@@ -362,71 +778,26 @@ class ErrorRecoverySystem:
     ) -> Dict[str, Any]:
         """Get information about the target element."""
 
-        script = f"""
-        (function() {{
-            let element = null;
-
-            try {{
-                if ({repr(selector.type.value)} === 'css') {{
-                    element = document.querySelector({repr(selector.value)});
-                }} else if ({repr(selector.type.value)} === 'xpath') {{
-                    const result = document.evaluate(
-                        {repr(selector.value)}, document, null,
-                        XPathResult.FIRST_ORDERED_NODE_TYPE, null
-                    );
-                    element = result.singleNodeValue;
-                }}
-            }} catch (e) {{
-                return {{error: e.message}};
-            }}
-
-            if (!element) {{
-                return {{found: false, similar: []}};
-            }}
-
-            const rect = element.getBoundingClientRect();
-            const style = window.getComputedStyle(element);
-
-            return {{
-                found: true,
-                tagName: element.tagName.toLowerCase(),
-                text: element.textContent.trim().substring(0, 100),
-                visible: style.display !== 'none' && style.visibility !== 'hidden',
-                rect: {{
-                    x: rect.x,
-                    y: rect.y,
-                    width: rect.width,
-                    height: rect.height
-                }},
-                attributes: Object.fromEntries(
-                    Array.from(element.attributes).map(attr => [attr.name, attr.value])
-                )
-            }};
-        }})()
-        """
+        script = _call_probe(_ELEMENT_INFO_PROBE, selector.type.value, selector.value)
 
         try:
-            return await session.runtime.evaluate(script) or {}
+            result = await asyncio.wait_for(
+                session.runtime.evaluate(script), _EVAL_TIMEOUT
+            )
+            return result or {}
         except Exception:
             return {"error": "Could not retrieve element info"}
 
     async def _get_network_info(self, session: CDPSession) -> Dict[str, Any]:
         """Get network-related information."""
 
-        script = """
-        (function() {
-            const connection = navigator.connection || navigator.mozConnection || navigator.webkitConnection;
-            return {
-                online: navigator.onLine,
-                connectionType: connection ? connection.effectiveType : 'unknown',
-                networkState: document.readyState,
-                performanceEntries: performance.getEntriesByType('navigation').length
-            };
-        })()
-        """
+        script = _NETWORK_INFO_JS
 
         try:
-            return await session.runtime.evaluate(script) or {}
+            result = await asyncio.wait_for(
+                session.runtime.evaluate(script), _EVAL_TIMEOUT
+            )
+            return result or {}
         except Exception:
             return {"error": "Could not retrieve network info"}
 
@@ -436,30 +807,31 @@ class ErrorRecoverySystem:
         """Get appropriate recovery strategies for error type."""
 
         strategies = self.strategy_map.get(
-            error_context.error_type,
-            [
-                RecoveryStrategy.EXPONENTIAL_BACKOFF,
-                RecoveryStrategy.GRACEFUL_DEGRADATION,
-            ],
-        ).copy()
-
-        # Adjust strategies based on context
-        if error_context.attempt_count > 2:
-            # On later attempts, prioritize more aggressive strategies
-            if RecoveryStrategy.PAGE_REFRESH in strategies:
-                strategies.remove(RecoveryStrategy.PAGE_REFRESH)
-                strategies.insert(0, RecoveryStrategy.PAGE_REFRESH)
-
-        # Learn from history
-        learned_strategies = self._get_learned_strategies(error_context)
-        if learned_strategies:
-            # Prioritize strategies that have worked before
-            for strategy in reversed(learned_strategies):
-                if strategy in strategies:
-                    strategies.remove(strategy)
-                    strategies.insert(0, strategy)
-
-        return strategies[:3]  # Limit to top 3 strategies
+            error_context.error_type, _DEFAULT_STRATEGIES
+        )
+
+        # On later attempts, prioritize more aggressive strategies
+        preferred: Tuple[RecoveryStrategy, ...] = ()
+        if (
+            error_context.attempt_count > 2
+            and RecoveryStrategy.PAGE_REFRESH in strategies
+        ):
+            preferred = (RecoveryStrategy.PAGE_REFRESH,)
+
+        # Strategies that have worked before go first
+        learned = [
+            strategy
+            for strategy in self._get_learned_strategies(error_context)
+            if strategy in strategies
+        ]
+
+        seen = set()
+        ordered = (
+            strategy
+            for strategy in chain(learned, preferred, strategies)
+            if not (strategy in seen or seen.add(strategy))
+        )
+        return list(islice(ordered, 3))  # Limit to top 3 strategies
 
     async def _apply_recovery_strategy(
         self,
@@ -469,26 +841,10 @@ class ErrorRecoverySystem:
     ) -> tuple[bool, Any]:
         """Apply specific recovery strategy."""
 
-        if strategy == RecoveryStrategy.IMMEDIATE_RETRY:
-            return await self._immediate_retry(session, error_context)
-        elif strategy == RecoveryStrategy.EXPONENTIAL_BACKOFF:
-            return await self._exponential_backoff(session, error_context)
-        elif strategy == RecoveryStrategy.ELEMENT_WAIT_RETRY:
-            return await self._element_wait_retry(session, error_context)
-        elif strategy == RecoveryStrategy.PAGE_REFRESH:
-            return await self._page_refresh(session, error_context)
-        elif strategy == RecoveryStrategy.ALTERNATIVE_SELECTOR:
-            return await self._alternative_selector(session, error_context)
-        elif strategy == RecoveryStrategy.NAVIGATION_RETRY:
-            return await self._navigation_retry(session, error_context)
-        elif strategy == RecoveryStrategy.SESSION_RESTART:
-            return await self._session_restart(session, error_context)
-        elif strategy == RecoveryStrategy.CONTEXT_RECOVERY:
-            return await self._context_recovery(session, error_context)
-        elif strategy == RecoveryStrategy.GRACEFUL_DEGRADATION:
-            return await self._graceful_degradation(session, error_context)
-        else:
+        handler = self._dispatch.get(strategy)
+        if handler is None:
             return False, None
+        return await handler(session, error_context)
 
     async def _immediate_retry(
         self, session: CDPSession, error_context: ErrorContext
@@ -508,7 +864,7 @@ class ErrorRecoverySystem:
             self.max_retry_delay,
         )
 
-        logger.debug(f"Exponential backoff: waiting {delay:.1f}s")
+        logger.debug("Exponential backoff: waiting %.1fs", delay)
         await asyncio.sleep(delay)
 
         return True, "backoff_complete"
@@ -518,50 +874,12 @@ class ErrorRecoverySystem:
     ) -> tuple[bool, Any]:
         """Wait for element to appear/become clickable."""
 
-        if not hasattr(error_context.command, "selector"):
+        selector = error_context.selector
+        if selector is None:
             return False, "No selector to wait for"
 
-        selector = error_context.command.selector
-
         # Wait for element with extended timeout
-        script = f"""
-        (function() {{
-            return new Promise((resolve) => {{
-                let attempts = 0;
-                const maxAttempts = 30; // 3 seconds
-
-                function checkElement() {{
-                    let element = null;
-
-                    if ({repr(selector.type.value)} === 'css') {{
-                        element = document.querySelector({repr(selector.value)});
-                    }}
-
-                    if (element) {{
-                        const rect = element.getBoundingClientRect();
-                        const style = window.getComputedStyle(element);
-
-                        if (style.display !== 'none' &&
-                            style.visibility !== 'hidden' &&
-                            rect.width > 0 && rect.height > 0) {{
-                            resolve(true);
-                            return;
-                        }}
-                    }}
-
-                    attempts++;
-                    if (attempts >= maxAttempts) {{
-                        resolve(false);
-                        return;
-                    }}
-
-                    setTimeout(checkElement, 100);
-                }}
-
-                checkElement();
-            }});
-        }})()
-        """
+        script = _call_probe(_ELEMENT_WAIT_PROBE, selector.type.value, selector.value)
 
         try:
             result = await session.runtime.evaluate(script)
@@ -577,11 +895,9 @@ class ErrorRecoverySystem:
         try:
             current_url = error_context.page_state.get("url")
             if current_url:
+                # navigate() returns once Page.loadEventFired arrives
                 await session.page.navigate(current_url)
 
-                # Wait for page to load
-                await asyncio.sleep(2)
-
                 return True, "page_refreshed"
             else:
                 return False, "No URL to refresh"
@@ -593,44 +909,26 @@ class ErrorRecoverySystem:
     ) -> tuple[bool, Any]:
         """Try alternative selectors for element."""
 
-        if not hasattr(error_context.command, "selector"):
+        original_selector = error_context.selector
+        if original_selector is None:
             return False, "No selector to alternate"
 
-        original_selector = error_context.command.selector
-
         # Generate alternative selectors
         alternatives = await self._generate_alternative_selectors(
             session, original_selector
         )
 
         for alt_selector in alternatives:
-            script = f"""
-            (function() {{
-                let element = null;
-
-                if ({repr(alt_selector['type'])} === 'css') {{
-                    element = document.querySelector({repr(alt_selector['value'])});
-                }}
-
-                if (element) {{
-                    const rect = element.getBoundingClientRect();
-                    const style = window.getComputedStyle(element);
-
-                    return style.display !== 'none' &&
-                           style.visibility !== 'hidden' &&
-                           rect.width > 0 && rect.height > 0;
-                }}
-
-                return false;
-            }})()
-            """
+            script = _call_probe(
+                _VISIBLE_ELEMENT_PROBE, alt_selector["type"], alt_selector["value"]
+            )
 
             try:
                 found = await session.runtime.evaluate(script)
                 if found:
                     # Update the command selector
-                    error_context.command.selector.type = alt_selector["type"]
-                    error_context.command.selector.value = alt_selector["value"]
+                    original_selector.type = alt_selector["type"]
+                    original_selector.value = alt_selector["value"]
                     return True, f"Alternative selector found: {alt_selector['value']}"
             except Exception:
                 continue
@@ -651,7 +949,6 @@ class ErrorRecoverySystem:
             await session.page.go_back()
             await asyncio.sleep(1)
             await session.page.navigate(current_url)
-            await asyncio.sleep(2)
 
             return True, "navigation_retried"
         except Exception as e:
@@ -671,41 +968,9 @@ class ErrorRecoverySystem:
     ) -> tuple[bool, Any]:
         """Recover by addressing context issues."""
 
-        # Close modals or popups that might be blocking interaction
-        script = """
-        (function() {
-            let closed = 0;
-
-            // Close common modal patterns
-            const closeSelectors = [
-                '.modal .close', '.modal button[aria-label="Close"]',
-                '.popup .close', '.dialog .close',
-                '.overlay .close', '.lightbox .close',
-                '[data-dismiss="modal"]', '[data-close="modal"]'
-            ];
-
-            closeSelectors.forEach(selector => {
-                document.querySelectorAll(selector).forEach(btn => {
-                    if (btn.offsetParent !== null) {  // Visible element
-                        btn.click();
-                        closed++;
-                    }
-                });
-            });
-
-            // Try pressing Escape key
-            document.body.dispatchEvent(new KeyboardEvent('keydown', {
-                key: 'Escape',
-                keyCode: 27,
-                bubbles: true
-            }));
-
-            return {closed: closed, escapeSent: true};
-        })()
-        """
-
         try:
-            result = await session.runtime.evaluate(script)
+            # Close modals or popups that might be blocking interaction
+            result = await session.runtime.evaluate(_CONTEXT_RECOVERY_JS)
             await asyncio.sleep(0.5)  # Give time for modals to close
 
             return True, f"Context recovery: closed {result.get('closed', 0)} elements"
@@ -773,29 +1038,12 @@ class ErrorRecoverySystem:
     ) -> List[RecoveryStrategy]:
         """Get strategies that have worked for similar errors."""
 
-        # Filter history for similar errors
-        similar_errors = [
-            entry
-            for entry in self.error_history[-50:]  # Last 50 errors
-            if (
-                entry.get("error_type") == error_context.error_type
-                and entry.get("success", False)
-            )
-        ]
-
-        # Extract successful strategies
-        strategies = [
-            entry.get("strategy") for entry in similar_errors if entry.get("strategy")
-        ]
+        successes = self.pattern_success.get(error_context.error_type)
+        if not successes:
+            return []
 
         # Return most frequent strategies
-        strategy_counts = {}
-        for strategy in strategies:
-            strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
-
-        return sorted(
-            strategy_counts.keys(), key=lambda s: strategy_counts[s], reverse=True
-        )
+        return [strategy for strategy, _ in successes.most_common(3)]
 
     def _record_successful_recovery(
         self,
@@ -825,28 +1073,28 @@ class ErrorRecoverySystem:
     ) -> None:
         """Record failed recovery for learning."""
 
+        timestamp = time.time()
         for strategy in strategies_tried:
             entry = {
                 "error_type": error_context.error_type,
                 "strategy": strategy,
                 "recovery_time": recovery_time,
                 "success": False,
-                "timestamp": time.time(),
+                "timestamp": timestamp,
                 "attempt_count": error_context.attempt_count,
             }
 
             self.error_history.append(entry)
             self._update_recovery_patterns(error_context.error_type, strategy, False)
 
-        # Keep history manageable
-        if len(self.error_history) > 500:
-            self.error_history = self.error_history[-250:]
-
     def _update_recovery_patterns(
         self, error_type: ErrorType, strategy: RecoveryStrategy, success: bool
     ) -> None:
         """Update recovery patterns for learning."""
 
+        outcomes = self.pattern_success if success else self.pattern_fail
+        outcomes[error_type][strategy] += 1
+
         if error_type not in self.recovery_patterns:
             self.recovery_patterns[error_type] = {}
 
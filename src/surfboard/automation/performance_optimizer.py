@@ -7,10 +7,14 @@ and memory management for efficient browser automation.
 
 import asyncio
 import logging
+import re
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import psutil
 
@@ -39,7 +43,185 @@ class OptimizationLevel(str, Enum):
     MAXIMUM = "maximum"
 
 
-@dataclass
+# Comment patterns stripped from scripts at the higher optimization levels
+_COMMENT_LINE = re.compile(r"//.*?\n")
+_COMMENT_BLOCK = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# Number of recent samples averaged by get_optimization_recommendations
+_RECENT_WINDOW = 10
+
+# Bounds, in seconds, for the adaptive resource monitor interval
+_MIN_MONITOR_INTERVAL = 1.0
+_MAX_MONITOR_INTERVAL = 60.0
+
+# Page scripts run on every monitor tick or cleanup pass
+
+# A live collection's length avoids snapshotting every element into a static
+# NodeList
+_DOM_COUNT_JS = "document.getElementsByTagName('*').length"
+
+_DOM_CLEANUP_JS = """
+(function() {
+    let removed = 0;
+
+    // Find empty text nodes and childless invisible elements in a
+    // single traversal, then detach them
+    const doomed = [];
+    const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT
+    );
+
+    let node;
+    while (node = walker.nextNode()) {
+        if (node.nodeType === Node.TEXT_NODE) {
+            if (node.nodeValue.trim() === '') {
+                doomed.push(node);
+            }
+        } else if (
+            node.style.display === 'none' &&
+            node.children.length === 0 &&
+            node.tagName !== 'SCRIPT' &&
+            node.tagName !== 'STYLE'
+        ) {
+            doomed.push(node);
+        }
+    }
+
+    doomed.forEach(node => {
+        if (node.parentNode) {
+            node.parentNode.removeChild(node);
+            removed++;
+        }
+    });
+
+    return removed;
+})()
+"""
+
+# Scripts run once per page load. A compiled script does not survive the
+# navigation between runs, so these stay on plain Runtime.evaluate.
+_PRELOAD_JS = """
+// Clear previous page data; void keeps the PerformanceMark out of the reply
+if (window.performance && window.performance.mark) {
+    void window.performance.mark('surfboard-preload-start');
+}
+"""
+
+_LOAD_METRICS_JS = """
+(function() {
+    if (!window.performance) return {};
+
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+
+    // One pass for both sizes; spreading a large list into Math.max can
+    // exceed the engine's argument limit
+    let total = 0, largest = 0;
+    for (let i = 0; i < resources.length; i++) {
+        const size = resources[i].transferSize || 0;
+        total += size;
+        if (size > largest) largest = size;
+    }
+
+    return {
+        loadTime: navigation ? navigation.loadEventEnd - navigation.navigationStart : 0,
+        domContentLoaded: navigation ? navigation.domContentLoadedEventEnd - navigation.navigationStart : 0,
+        resourceCount: resources.length,
+        totalResourceSize: total,
+        largestResource: largest
+    };
+})()
+"""
+
+_POSTLOAD_JS = """
+(function() {
+    let optimizations = {
+        removedNodes: 0,
+        optimizedStyles: 0,
+        cleanedEvents: 0
+    };
+
+    // Remove hidden elements in one traversal; rejecting a hidden
+    // element skips its subtree, which goes with it anyway
+    const hidden = [];
+    const walker = document.createTreeWalker(
+        document.body,
+        NodeFilter.SHOW_ELEMENT,
+        {
+            acceptNode: function(el) {
+                const tag = el.tagName;
+                if (tag === 'SCRIPT' || tag === 'STYLE') {
+                    return NodeFilter.FILTER_REJECT;
+                }
+                if (el.hidden || el.style.display === 'none') {
+                    hidden.push(el);
+                    return NodeFilter.FILTER_REJECT;
+                }
+                return NodeFilter.FILTER_SKIP;
+            }
+        }
+    );
+    walker.nextNode();
+
+    for (const el of hidden) {
+        el.remove();
+    }
+    optimizations.removedNodes = hidden.length;
+
+    // Mark optimization complete
+    if (window.performance && window.performance.mark) {
+        window.performance.mark('surfboard-optimization-complete');
+    }
+
+    return optimizations;
+})()
+"""
+
+
+@lru_cache(maxsize=512)
+def _optimize_script_cached(level: OptimizationLevel, script: str) -> str:
+    """Optimize a script for a level; pure, so repeat scripts are cache hits."""
+
+    # Basic script optimizations
+    optimized = script.strip()
+
+    # Remove comments for smaller payload
+    if level in (OptimizationLevel.AGGRESSIVE, OptimizationLevel.MAXIMUM):
+        # Substring checks are far cheaper than a regex scan that finds nothing
+        if "//" in optimized:
+            optimized = _COMMENT_LINE.sub("\n", optimized)
+        if "/*" in optimized:
+            optimized = _COMMENT_BLOCK.sub("", optimized)
+
+    # Minify whitespace
+    if level == OptimizationLevel.MAXIMUM:
+        optimized = " ".join(optimized.split())
+
+    return optimized
+
+
+@lru_cache(maxsize=None)
+def _applied_optimizations(
+    enable_dom: bool, enable_script: bool, cache_disabled: bool
+) -> Tuple[str, ...]:
+    """Names of the optimizations a settings combination applies."""
+
+    optimizations = []
+
+    if enable_dom:
+        optimizations.append("dom_cleanup")
+
+    if enable_script:
+        optimizations.append("script_optimization")
+
+    if cache_disabled:
+        optimizations.append("cache_disabled")
+
+    return tuple(optimizations)
+
+
+@dataclass(slots=True)
 class ResourceMetrics:
     """Resource usage metrics."""
 
@@ -75,11 +257,24 @@ class PerformanceOptimizer:
     def __init__(self, settings: OptimizationSettings):
         """Initialize performance optimizer."""
         self.settings = settings
-        self.metrics_history = []
+        self.metrics_history: deque = deque(maxlen=1000)
         self.resource_limits = {}
         self.optimization_cache = {}
-        self.active_sessions = set()
-        self.cleanup_tasks = []
+        # Cache keys written on behalf of each session
+        self._cache_by_session: Dict[str, Set[str]] = {}
+        self.active_sessions: Dict[str, CDPSession] = {}
+        # Handles for the background loops started by initialize()
+        self.cleanup_tasks: List[asyncio.Task] = []
+
+        # Process handle reused by every sample; prime cpu_percent so later
+        # non-blocking reads have a baseline
+        self._process = psutil.Process()
+        self._process.cpu_percent(None)
+        self._cpu_count = psutil.cpu_count() or 1
+        # net_connections() replaced connections() in psutil 6
+        self._process_connections = (
+            getattr(self._process, "net_connections", None) or self._process.connections
+        )
 
         # Performance thresholds
         self.memory_warning_threshold = settings.max_memory_mb * 0.8
@@ -117,6 +312,12 @@ class PerformanceOptimizer:
             },
         }
 
+        # Monitor cadence, adapted to load by _adapt_monitor_interval
+        self._monitor_interval = float(
+            self.optimization_strategies[settings.level]["resource_monitoring_interval"]
+        )
+        self._quiet_samples = 0
+
     async def initialize(self) -> None:
         """Initialize performance optimization system."""
         logger.info(
@@ -124,20 +325,31 @@ class PerformanceOptimizer:
         )
 
         # Start resource monitoring
-        asyncio.create_task(self._resource_monitor_loop())
+        self.cleanup_tasks.append(
+            asyncio.create_task(self._resource_monitor_loop(), name="perf-monitor")
+        )
 
         # Start periodic cleanup
         if self.settings.enable_resource_cleanup:
-            asyncio.create_task(self._cleanup_loop())
+            self.cleanup_tasks.append(
+                asyncio.create_task(self._cleanup_loop(), name="perf-cleanup")
+            )
 
         # Apply initial optimizations
         await self._apply_system_optimizations()
 
+    async def close(self) -> None:
+        """Stop the background monitoring and cleanup loops."""
+        for task in self.cleanup_tasks:
+            task.cancel()
+        await asyncio.gather(*self.cleanup_tasks, return_exceptions=True)
+        self.cleanup_tasks.clear()
+
     async def register_session(self, session: CDPSession, session_id: str) -> None:
         """Register a CDP session for optimization."""
         logger.debug(f"Registering session for optimization: {session_id}")
 
-        self.active_sessions.add((session, session_id))
+        self.active_sessions[session_id] = session
 
         # Apply session-specific optimizations
         await self._optimize_session(session, session_id)
@@ -146,9 +358,7 @@ class PerformanceOptimizer:
         """Unregister a CDP session."""
         logger.debug(f"Unregistering session: {session_id}")
 
-        self.active_sessions = {
-            (session, sid) for session, sid in self.active_sessions if sid != session_id
-        }
+        self.active_sessions.pop(session_id, None)
 
         # Clean up session resources
         await self._cleanup_session_resources(session_id)
@@ -182,6 +392,7 @@ class PerformanceOptimizer:
 
         # Cache optimization results
         self.optimization_cache[url] = optimization_result
+        self._cache_by_session.setdefault(session_id, set()).add(url)
 
         return optimization_result
 
@@ -202,8 +413,9 @@ class PerformanceOptimizer:
                 "optimized": False,
             }
 
-        # Apply script optimizations
-        optimized_script = await self._optimize_script(script)
+        # Apply script optimizations; repeated scripts come straight from the
+        # memoized transform without an extra coroutine hop
+        optimized_script = _optimize_script_cached(self.settings.level, script)
 
         # Execute with performance monitoring
         start_time = time.time()
@@ -236,33 +448,29 @@ class PerformanceOptimizer:
     async def get_performance_metrics(self) -> ResourceMetrics:
         """Get current performance metrics."""
 
-        # System metrics
-        memory_info = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        network_connections = len(psutil.net_connections())
+        # Process metrics, read off the event loop in one executor hop
+        loop = asyncio.get_running_loop()
+        sample = await loop.run_in_executor(None, self._sample_process)
+        memory_usage_mb, cpu_percent, network_connections = sample
 
         # Browser-specific metrics
         dom_elements = 0
         if self.active_sessions:
-            session, _ = next(iter(self.active_sessions))
+            session = next(iter(self.active_sessions.values()))
             dom_elements = await self._get_dom_element_count(session)
 
         metrics = ResourceMetrics(
             timestamp=time.time(),
-            memory_usage_mb=memory_info.used / 1024 / 1024,
+            memory_usage_mb=memory_usage_mb,
             cpu_percent=cpu_percent,
             network_active_connections=network_connections,
             dom_element_count=dom_elements,
             active_browser_instances=len(self.active_sessions),
         )
 
-        # Store in history
+        # Store in history; the deque drops the oldest samples itself
         self.metrics_history.append(metrics)
 
-        # Keep only recent history
-        if len(self.metrics_history) > 1000:
-            self.metrics_history = self.metrics_history[-500:]
-
         return metrics
 
     async def cleanup_resources(self, force: bool = False) -> Dict[str, Any]:
@@ -278,32 +486,41 @@ class PerformanceOptimizer:
 
         # Memory cleanup
         if force or await self._should_cleanup_memory():
-            memory_before = psutil.virtual_memory().used / 1024 / 1024
+            memory_before = self._memory_usage_mb()
 
             # Clear optimization cache
             cache_size = len(self.optimization_cache)
             self.optimization_cache.clear()
+            self._cache_by_session.clear()
             cleanup_results["cache_entries_cleared"] = cache_size
 
             # Clean up metrics history
-            self.metrics_history = self.metrics_history[-100:]
+            while len(self.metrics_history) > 100:
+                self.metrics_history.popleft()
 
             # Force garbage collection
             import gc
 
             gc.collect()
 
-            memory_after = psutil.virtual_memory().used / 1024 / 1024
+            memory_after = self._memory_usage_mb()
             cleanup_results["memory_freed_mb"] = max(0, memory_before - memory_after)
 
-        # DOM cleanup for active sessions
-        for session, session_id in self.active_sessions.copy():
-            try:
-                nodes_removed = await self._cleanup_dom_nodes(session)
-                cleanup_results["dom_nodes_removed"] += nodes_removed
-                cleanup_results["sessions_cleaned"] += 1
-            except Exception as e:
-                logger.warning(f"DOM cleanup failed for session {session_id}: {e}")
+        # DOM cleanup for active sessions, one concurrent round-trip each.
+        # Snapshot once so sessions registered mid-cleanup cannot skew the zip
+        sessions = tuple(self.active_sessions.items())
+        results = await asyncio.gather(
+            *(self._cleanup_dom_nodes(session) for _, session in sessions),
+            return_exceptions=True,
+        )
+        for (session_id, _), nodes_removed in zip(sessions, results):
+            if isinstance(nodes_removed, Exception):
+                logger.warning(
+                    f"DOM cleanup failed for session {session_id}: {nodes_removed}"
+                )
+                continue
+            cleanup_results["dom_nodes_removed"] += nodes_removed
+            cleanup_results["sessions_cleaned"] += 1
 
         logger.info(f"Resource cleanup completed: {cleanup_results}")
         return cleanup_results
@@ -311,12 +528,10 @@ class PerformanceOptimizer:
     async def _resource_monitor_loop(self) -> None:
         """Background resource monitoring loop."""
 
-        strategy = self.optimization_strategies[self.settings.level]
-        interval = strategy["resource_monitoring_interval"]
-
         while True:
             try:
                 metrics = await self.get_performance_metrics()
+                self._adapt_monitor_interval(metrics)
 
                 # Check for resource warnings
                 if metrics.memory_usage_mb > self.memory_warning_threshold:
@@ -329,11 +544,34 @@ class PerformanceOptimizer:
                     logger.warning(f"High CPU usage: {metrics.cpu_percent:.1f}%")
                     await self._throttle_operations()
 
-                await asyncio.sleep(interval)
+                await asyncio.sleep(self._monitor_interval)
 
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Resource monitoring error: {e}")
-                await asyncio.sleep(interval * 2)  # Back off on error
+                await asyncio.sleep(self._monitor_interval * 2)  # Back off on error
+
+    def _adapt_monitor_interval(self, metrics: ResourceMetrics) -> None:
+        """Sample faster near the warning thresholds and slower when idle."""
+
+        memory_ratio = metrics.memory_usage_mb / self.memory_warning_threshold
+        cpu_ratio = metrics.cpu_percent / self.cpu_warning_threshold
+
+        if memory_ratio > 0.9 or cpu_ratio > 0.9:
+            self._quiet_samples = 0
+            self._monitor_interval = max(
+                _MIN_MONITOR_INTERVAL, self._monitor_interval / 2
+            )
+        elif memory_ratio < 0.5 and cpu_ratio < 0.5:
+            self._quiet_samples += 1
+            # Only back off after two idle samples in a row
+            if self._quiet_samples >= 2:
+                self._monitor_interval = min(
+                    _MAX_MONITOR_INTERVAL, self._monitor_interval * 1.5
+                )
+        else:
+            self._quiet_samples = 0
 
     async def _cleanup_loop(self) -> None:
         """Background cleanup loop."""
@@ -346,6 +584,8 @@ class PerformanceOptimizer:
                 await asyncio.sleep(interval)
                 await self.cleanup_resources()
 
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Cleanup loop error: {e}")
 
@@ -354,7 +594,7 @@ class PerformanceOptimizer:
         logger.debug("Applying system optimizations")
 
         # Set process priority based on optimization level
-        current_process = psutil.Process()
+        current_process = self._process
 
         if self.settings.level == OptimizationLevel.MAXIMUM:
             try:
@@ -375,13 +615,10 @@ class PerformanceOptimizer:
             OptimizationLevel.AGGRESSIVE,
             OptimizationLevel.MAXIMUM,
         ]:
-            # Disable images for faster loading
+            # Disable images for faster loading; match on the resource type
+            # Chromium has already parsed rather than globbing every URL
             await session.page.set_resource_response_interception(
-                patterns=[
-                    {"urlPattern": "*.jpg", "resourceType": "Image"},
-                    {"urlPattern": "*.png", "resourceType": "Image"},
-                    {"urlPattern": "*.gif", "resourceType": "Image"},
-                ]
+                patterns=[{"urlPattern": "*", "resourceType": "Image"}]
             )
 
         # Enable performance monitoring
@@ -396,13 +633,7 @@ class PerformanceOptimizer:
 
         # Clear previous page resources
         if self.settings.enable_dom_optimization:
-            script = """
-            // Clear previous page data
-            if (window.performance && window.performance.mark) {
-                window.performance.mark('surfboard-preload-start');
-            }
-            """
-            await session.runtime.evaluate(script)
+            await session.runtime.evaluate(_PRELOAD_JS)
 
     async def _monitor_page_load(self, session: CDPSession, url: str) -> Dict[str, Any]:
         """Monitor page load performance."""
@@ -416,24 +647,7 @@ class PerformanceOptimizer:
         await asyncio.sleep(0.1)  # Small delay to start measuring
 
         # Get performance metrics
-        metrics_script = """
-        (function() {
-            if (!window.performance) return {};
-
-            const navigation = performance.getEntriesByType('navigation')[0];
-            const resources = performance.getEntriesByType('resource');
-
-            return {
-                loadTime: navigation ? navigation.loadEventEnd - navigation.navigationStart : 0,
-                domContentLoaded: navigation ? navigation.domContentLoadedEventEnd - navigation.navigationStart : 0,
-                resourceCount: resources.length,
-                totalResourceSize: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
-                largestResource: Math.max(...resources.map(r => r.transferSize || 0))
-            };
-        })()
-        """
-
-        load_metrics = await session.runtime.evaluate(metrics_script) or {}
+        load_metrics = await session.runtime.evaluate(_LOAD_METRICS_JS) or {}
         load_metrics["total_time"] = time.time() - start_time
 
         return load_metrics
@@ -444,154 +658,60 @@ class PerformanceOptimizer:
         if not self.settings.enable_dom_optimization:
             return
 
-        # Remove unused DOM nodes and optimize structure
-        optimization_script = """
-        (function() {
-            let optimizations = {
-                removedNodes: 0,
-                optimizedStyles: 0,
-                cleanedEvents: 0
-            };
-
-            // Remove hidden elements if aggressive optimization
-            if (true) {  // Would check optimization level
-                const hiddenElements = document.querySelectorAll('[style*="display: none"], [hidden]');
-                hiddenElements.forEach(el => {
-                    if (el.tagName !== 'SCRIPT' && el.tagName !== 'STYLE') {
-                        el.remove();
-                        optimizations.removedNodes++;
-                    }
-                });
-            }
-
-            // Clean up inline styles
-            const elementsWithInlineStyles = document.querySelectorAll('[style]');
-            elementsWithInlineStyles.forEach(el => {
-                if (el.style.display === 'none' && el.tagName !== 'SCRIPT') {
-                    el.remove();
-                    optimizations.removedNodes++;
-                }
-            });
-
-            // Mark optimization complete
-            if (window.performance && window.performance.mark) {
-                window.performance.mark('surfboard-optimization-complete');
-            }
-
-            return optimizations;
-        })()
-        """
-
         try:
-            result = await session.runtime.evaluate(optimization_script)
+            # Remove unused DOM nodes and optimize structure
+            result = await session.runtime.evaluate(_POSTLOAD_JS)
             logger.debug(f"Post-load optimizations: {result}")
         except Exception as e:
             logger.debug(f"Post-load optimization error: {e}")
 
     async def _optimize_script(self, script: str) -> str:
         """Optimize JavaScript code for better performance."""
-
-        # Basic script optimizations
-        optimized = script.strip()
-
-        # Remove comments for smaller payload
-        if self.settings.level in [
-            OptimizationLevel.AGGRESSIVE,
-            OptimizationLevel.MAXIMUM,
-        ]:
-            import re
-
-            optimized = re.sub(r"//.*?\n", "\n", optimized)
-            optimized = re.sub(r"/\*.*?\*/", "", optimized, flags=re.DOTALL)
-
-        # Minify whitespace
-        if self.settings.level == OptimizationLevel.MAXIMUM:
-            optimized = " ".join(optimized.split())
-
-        return optimized
+        return _optimize_script_cached(self.settings.level, script)
 
     async def _get_applied_optimizations(self, session: CDPSession) -> List[str]:
         """Get list of optimizations applied to session."""
-
-        optimizations = []
-
-        if self.settings.enable_dom_optimization:
-            optimizations.append("dom_cleanup")
-
-        if self.settings.enable_script_optimization:
-            optimizations.append("script_optimization")
-
-        if "no-cache" in self.settings.cache_strategies:
-            optimizations.append("cache_disabled")
-
-        return optimizations
+        return list(
+            _applied_optimizations(
+                self.settings.enable_dom_optimization,
+                self.settings.enable_script_optimization,
+                "no-cache" in self.settings.cache_strategies,
+            )
+        )
 
     async def _get_dom_element_count(self, session: CDPSession) -> int:
         """Get DOM element count for session."""
 
-        script = "document.querySelectorAll('*').length"
-
         try:
-            return await session.runtime.evaluate(script) or 0
+            return await session.runtime.evaluate(_DOM_COUNT_JS) or 0
         except Exception:
             return 0
 
     async def _should_cleanup_memory(self) -> bool:
         """Check if memory cleanup is needed."""
 
-        memory_info = psutil.virtual_memory()
-        memory_usage_mb = memory_info.used / 1024 / 1024
-
-        return memory_usage_mb > self.memory_warning_threshold
+        return self._memory_usage_mb() > self.memory_warning_threshold
 
-    async def _cleanup_dom_nodes(self, session: CDPSession) -> int:
-        """Clean up unnecessary DOM nodes."""
+    def _sample_process(self) -> Tuple[float, float, int]:
+        """Read memory, CPU and connection counts for this process."""
 
-        cleanup_script = """
-        (function() {
-            let removed = 0;
-
-            // Remove empty text nodes
-            const walker = document.createTreeWalker(
-                document.body,
-                NodeFilter.SHOW_TEXT,
-                {
-                    acceptNode: function(node) {
-                        return node.nodeValue.trim() === '' ?
-                               NodeFilter.FILTER_ACCEPT :
-                               NodeFilter.FILTER_REJECT;
-                    }
-                }
-            );
+        # cpu_percent(None) reports usage since the previous call instead of
+        # sleeping for a sampling interval
+        return (
+            self._memory_usage_mb(),
+            self._process.cpu_percent(None) / self._cpu_count,
+            len(self._process_connections(kind="inet")),
+        )
 
-            const emptyNodes = [];
-            let node;
-            while (node = walker.nextNode()) {
-                emptyNodes.push(node);
-            }
+    def _memory_usage_mb(self) -> float:
+        """Get the resident memory of this process in MB."""
+        return self._process.memory_info().rss / 1024 / 1024
 
-            emptyNodes.forEach(node => {
-                if (node.parentNode) {
-                    node.parentNode.removeChild(node);
-                    removed++;
-                }
-            });
-
-            // Remove invisible elements (if safe to do so)
-            const invisibleElements = document.querySelectorAll('[style*="display: none"]:not(script):not(style)');
-            invisibleElements.forEach(el => {
-                if (!el.querySelector('script, style') && el.children.length === 0) {
-                    el.remove();
-                    removed++;
-                }
-            });
-
-            return removed;
-        })()
-        """
+    async def _cleanup_dom_nodes(self, session: CDPSession) -> int:
+        """Clean up unnecessary DOM nodes."""
 
         try:
-            return await session.runtime.evaluate(cleanup_script) or 0
+            return await session.runtime.evaluate(_DOM_CLEANUP_JS) or 0
         except Exception:
             return 0
 
@@ -599,14 +719,8 @@ class PerformanceOptimizer:
         """Clean up resources for specific session."""
 
         # Remove session-specific cache entries
-        keys_to_remove = [
-            key
-            for key in self.optimization_cache.keys()
-            if isinstance(key, str) and session_id in key
-        ]
-
-        for key in keys_to_remove:
-            del self.optimization_cache[key]
+        for key in self._cache_by_session.pop(session_id, ()):
+            self.optimization_cache.pop(key, None)
 
     async def _throttle_operations(self) -> None:
         """Throttle operations due to high CPU usage."""
@@ -629,11 +743,11 @@ class PerformanceOptimizer:
         if not self.metrics_history:
             return {"status": "No metrics available"}
 
-        recent_metrics = self.metrics_history[-10:]  # Last 10 measurements
-        avg_memory = sum(m.memory_usage_mb for m in recent_metrics) / len(
-            recent_metrics
-        )
-        avg_cpu = sum(m.cpu_percent for m in recent_metrics) / len(recent_metrics)
+        # Averages over the last 10 measurements, read from the newest end
+        # so the rest of the history is never copied
+        recent = list(islice(reversed(self.metrics_history), _RECENT_WINDOW))
+        avg_memory = sum(m.memory_usage_mb for m in recent) / len(recent)
+        avg_cpu = sum(m.cpu_percent for m in recent) / len(recent)
 
         recommendations = {}
 
@@ -6,13 +6,16 @@ and provide predictive timeout adjustments.
 """
 
 import asyncio
+import json
 import logging
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from ..protocols.cdp_domains import CDPSession
+from ..protocols.cdp import CDPError
+from ..protocols.cdp_domains import CDPSession, RuntimeDomain
 from ..protocols.llm_protocol import ElementSelector, WaitCondition
 
 logger = logging.getLogger(__name__)
@@ -31,6 +34,427 @@ class WaitType(str, Enum):
     ANIMATION_COMPLETE = "animation_complete"
 
 
+# Timeout multiplier per condition, for conditions that take longer
+_CONDITION_FACTORS = {
+    WaitType.ELEMENT_VISIBLE: 1.0,
+    WaitType.ELEMENT_CLICKABLE: 1.2,
+    WaitType.ELEMENT_STABLE: 1.5,
+    WaitType.PAGE_LOAD: 2.0,
+    WaitType.NETWORK_IDLE: 2.5,
+    WaitType.ANIMATION_COMPLETE: 1.3,
+    WaitType.DOM_CHANGE: 1.1,
+    WaitType.CUSTOM_CONDITION: 1.0,
+}
+
+# Waits kept in the history, and the most recent of them that shape the
+# historical timeout factor
+_HISTORY_SIZE = 200
+_HISTORY_WINDOW = 50
+
+# Page binding the mutation observer calls whenever the DOM changes
+_WAKE_BINDING = "__sbWake"
+
+# Installs one observer per document; mutations are coalesced so a burst
+# of DOM work produces a single binding call. The observer also counts
+# DOM generations, which date the element probes' cached lookups.
+_WAKE_OBSERVER_JS = f"""
+(function() {{
+    if (window.__sbWakeObserver || typeof {_WAKE_BINDING} !== 'function') return;
+    let queued = false;
+    window.__sbGen = 0;
+    window.__sbWakeObserver = new MutationObserver(() => {{
+        window.__sbGen++;
+        if (queued) return;
+        queued = true;
+        setTimeout(() => {{ queued = false; {_WAKE_BINDING}(''); }}, 16);
+    }});
+    window.__sbWakeObserver.observe(document, {{
+        subtree: true, childList: true, attributes: true, characterData: true
+    }});
+}})()
+"""
+
+# CDP events that can change the outcome of each wait source
+_WAKE_SOURCE_EVENTS: Dict[str, Tuple[str, ...]] = {
+    "page": ("Page.frameStoppedLoading", "Page.lifecycleEvent"),
+    "network": (
+        "Network.requestWillBeSent",
+        "Network.loadingFinished",
+        "Network.loadingFailed",
+    ),
+    "dom": ("Runtime.bindingCalled",),
+}
+
+# Conditions re-checked on CDP events; the rest are only polled
+_WAKE_SOURCES: Dict[WaitType, str] = {
+    WaitType.PAGE_LOAD: "page",
+    WaitType.NETWORK_IDLE: "network",
+    WaitType.ELEMENT_VISIBLE: "dom",
+    WaitType.ELEMENT_CLICKABLE: "dom",
+    WaitType.ELEMENT_STABLE: "dom",
+    WaitType.DOM_CHANGE: "dom",
+}
+
+# Checker fields that count outstanding work; a falling total is progress
+_PROGRESS_KEYS: Dict[WaitType, Tuple[str, ...]] = {
+    WaitType.PAGE_LOAD: ("pendingImages", "pendingScripts"),
+    WaitType.NETWORK_IDLE: ("recentRequestCount",),
+    WaitType.ANIMATION_COMPLETE: ("runningAnimations",),
+}
+
+# Upper bound for the poll backoff, i.e. the worst-case detection delay
+_MAX_POLL_INTERVAL = 2.0
+
+# Longest gap between checks while events are driving the wait. Layout and
+# style changes that do not mutate the DOM are still caught by this poll.
+_EVENT_POLL_INTERVAL = 0.5
+
+
+# Locates the element a selector describes, one finder per selector type
+# so each probe only ships the lookup it uses; the element probes below
+# are applied to its result
+_FIND_ELEMENT: Dict[str, str] = {
+    "css": """
+function(value) {
+    return document.querySelector(value);
+}
+""",
+    "xpath": """
+function(value) {
+    return document.evaluate(
+        value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+""",
+    "text": """
+function(value) {
+    const needle = value.toLowerCase();
+    const walker = document.createTreeWalker(
+        document.body, NodeFilter.SHOW_ELEMENT
+    );
+    while (walker.nextNode()) {
+        if (walker.currentNode.textContent.trim().toLowerCase() === needle) {
+            return walker.currentNode;
+        }
+    }
+    return null;
+}
+""",
+}
+
+# Finder for selector types the waiter cannot resolve
+_FIND_NOTHING = "function(value) { return null; }"
+
+# Wraps a finder so a selector that matched nothing is not searched for
+# again until the DOM changes. Only misses are kept: whether a found
+# element is visible or clickable also depends on layout, which mutations
+# do not cover. Without the wake observer nothing is cached, and CSS
+# selectors with pseudo-classes bypass it (see _is_miss_cacheable).
+_FIND_CACHED = """
+function(find, key, value) {
+    const gen = window.__sbGen;
+    if (gen === undefined) return find(value);
+
+    let misses = window.__sbMisses;
+    if (!misses || misses.gen !== gen) {
+        misses = window.__sbMisses = {gen: gen, keys: new Set()};
+    }
+    if (misses.keys.has(key)) return null;
+
+    const element = find(value);
+    if (!element) misses.keys.add(key);
+    return element;
+}
+"""
+
+# Visibility and clickability together, so each element check costs one
+# evaluate; the covering test only runs for visible elements
+_ELEMENT_STATE_PROBE = """
+function(element) {
+    if (!element) return {visible: false, clickable: false, found: false};
+
+    const rect = element.getBoundingClientRect();
+    const style = window.getComputedStyle(element);
+
+    const visible = style.display !== 'none' &&
+                    style.visibility !== 'hidden' &&
+                    style.opacity !== '0' &&
+                    rect.width > 0 &&
+                    rect.height > 0;
+
+    const state = {
+        visible: visible,
+        clickable: false,
+        found: true,
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        style: {
+            display: style.display,
+            visibility: style.visibility,
+            opacity: style.opacity
+        }
+    };
+    if (!visible) return state;
+
+    // Check if element is covered by another element
+    const centerX = rect.x + rect.width / 2;
+    const centerY = rect.y + rect.height / 2;
+    const elementAtPoint = document.elementFromPoint(centerX, centerY);
+
+    const notCovered = elementAtPoint === element ||
+                       element.contains(elementAtPoint) ||
+                       (elementAtPoint && elementAtPoint.contains(element));
+
+    state.clickable = !element.disabled &&
+                      style.pointerEvents !== 'none' &&
+                      !!notCovered;
+    state.disabled = !!element.disabled;
+    state.covered = !notCovered;
+    state.elementAtPoint = elementAtPoint ? elementAtPoint.tagName : null;
+    return state;
+}
+"""
+
+# Tells whether an element still matches a selector, per selector type;
+# an XPath match must still be the expression's first result
+_MATCHES_ELEMENT: Dict[str, str] = {
+    "css": """
+function(element, value) {
+    return element.matches(value);
+}
+""",
+    "xpath": """
+function(element, value) {
+    return document.evaluate(
+        value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue === element;
+}
+""",
+    "text": """
+function(element, value) {
+    return element.textContent.trim().toLowerCase() === value.toLowerCase();
+}
+""",
+}
+
+# Applies the state probe to a held element; null once it has left the
+# document or stopped matching its selector, so the caller looks the
+# selector up again
+_HELD_ELEMENT_STATE_PROBES: Dict[str, str] = {
+    selector_type: f"""
+function(value) {{
+    if (!this.isConnected || !({matcher})(this, value)) return null;
+    return ({_ELEMENT_STATE_PROBE})(this);
+}}
+"""
+    for selector_type, matcher in _MATCHES_ELEMENT.items()
+}
+
+# Two bounding boxes a frame apart, compared in the page so only the
+# verdict and deltas come back; the timeout covers background tabs, which
+# do not produce frames
+_ELEMENT_RECTS_PROBE = """
+function(element) {
+    if (!element) return null;
+
+    const measure = () => {
+        const rect = element.getBoundingClientRect();
+        return {x: rect.x, y: rect.y, width: rect.width, height: rect.height};
+    };
+    const first = measure();
+
+    return new Promise(resolve => {
+        let done = false;
+        const finish = () => {
+            if (done) return;
+            done = true;
+            const second = measure();
+            const positionChange = Math.abs(first.x - second.x) +
+                                   Math.abs(first.y - second.y);
+            const sizeChange = Math.abs(first.width - second.width) +
+                               Math.abs(first.height - second.height);
+            resolve({
+                stable: positionChange < 2 && sizeChange < 2,
+                positionChange: positionChange,
+                sizeChange: sizeChange,
+                first: first,
+                second: second
+            });
+        };
+        requestAnimationFrame(finish);
+        setTimeout(finish, 100);
+    });
+}
+"""
+
+
+# Longest in-page settle, as a multiple of stability_time, and the extra
+# seconds allowed for its evaluate to come back
+_SETTLE_WINDOW = 2.0
+_SETTLE_GRACE = 1.0
+
+# Resolves once the element's box has gone stableMs without resizing or
+# moving more than the 2px stability tolerance, or with stable: false at
+# maxMs. Changes to its content do not count, so live text or a spinner
+# inside the element cannot keep it from settling.
+_SETTLE_PROBE = """
+function(element, stableMs, maxMs) {
+    if (!element) return {stable: false, found: false};
+
+    return new Promise(resolve => {
+        const read = () => {
+            const rect = element.getBoundingClientRect();
+            return [rect.x, rect.y, rect.width, rect.height];
+        };
+        let last = read();
+        let timer = null;
+
+        const finish = stable => {
+            clearTimeout(timer);
+            clearTimeout(deadline);
+            if (resizes) resizes.disconnect();
+            resolve({stable: stable, found: element.isConnected});
+        };
+        const arm = () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                // Layout can move an element without resizing it
+                const now = read();
+                if (now.some((value, i) => Math.abs(value - last[i]) >= 2)) {
+                    last = now;
+                    arm();
+                } else {
+                    finish(true);
+                }
+            }, stableMs);
+        };
+
+        const resizes = typeof ResizeObserver === 'function'
+            ? new ResizeObserver(arm) : null;
+        if (resizes) resizes.observe(element);
+        const deadline = setTimeout(() => finish(false), maxMs);
+        arm();
+    });
+}
+"""
+
+
+def _is_miss_cacheable(selector: ElementSelector) -> bool:
+    """Whether a selector's match can only change through DOM mutations.
+
+    Pseudo-classes such as :checked, :focus, :hover or :placeholder-shown
+    follow element state that no mutation reports, so a CSS selector
+    containing a colon is always looked up afresh. XPath and text finders
+    only read attributes and text, which mutations do cover.
+    """
+
+    return selector.type.value != "css" or ":" not in selector.value
+
+
+def _element_key(
+    session: CDPSession, selector: ElementSelector
+) -> Tuple[Any, str, str]:
+    """Key under which an element held for a selector is tracked."""
+
+    return (session.client, selector.type.value, selector.value)
+
+
+def _element_script(probe: str, selector: ElementSelector, *args: Any) -> str:
+    """Build an expression applying an element probe to a selector's match.
+
+    Extra arguments are passed to the probe after the element.
+    """
+
+    finder = _FIND_ELEMENT.get(selector.type.value, _FIND_NOTHING)
+    value = json.dumps(selector.value)
+    extra = "".join(f", {json.dumps(arg)}" for arg in args)
+    if not _is_miss_cacheable(selector):
+        return f"({probe})(({finder})({value}){extra})"
+
+    key = json.dumps(f"{selector.type.value}:{selector.value}")
+    return f"({probe})(({_FIND_CACHED})(({finder}), {key}, {value}){extra})"
+
+
+class _ChangeSignal(asyncio.Event):
+    """Event that can be registered directly as a CDP event listener."""
+
+    def __call__(self, params: Dict[str, Any]) -> None:
+        self.set()
+
+
+@dataclass
+class _PageLifecycle:
+    """Lifecycle events reached by a page's current main-frame document."""
+
+    frame_id: Optional[str] = None
+    events: Set[str] = field(default_factory=set)
+
+
+class _EvaluateBatcher:
+    """Coalesces evaluates issued in the same event-loop tick.
+
+    Concurrent waits on one page wake together, so their probes are sent
+    as a single array expression and the results handed back in order.
+    Each probe is wrapped so one failing expression does not fail the
+    others.
+    """
+
+    def __init__(self, runtime: RuntimeDomain):
+        self._runtime = runtime
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        # Strong references to running flushes
+        self._runs: Set[asyncio.Task] = set()
+
+    def submit(self, expression: str) -> asyncio.Future:
+        """Queue an expression for the next flush and return its future."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        self._pending.append((expression, future))
+        return future
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        run = asyncio.ensure_future(self._run(batch))
+        self._runs.add(run)
+        run.add_done_callback(self._runs.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                value = await self._runtime.evaluate(batch[0][0])
+                outcomes = [{"value": value}]
+            else:
+                expression = ",".join(
+                    f"(() => {{ try {{ return {{value: ({expr})}}; }} "
+                    f"catch (e) {{ return {{error: String(e)}}; }} }})()"
+                    for expr, _ in batch
+                )
+                outcomes = await self._runtime.evaluate(f"[{expression}]")
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        if not isinstance(outcomes, list) or len(outcomes) != len(batch):
+            self._fail(batch, CDPError(f"Unexpected batch result: {outcomes}"))
+            return
+
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if "error" in outcome:
+                future.set_exception(CDPError(f"JavaScript error: {outcome['error']}"))
+            else:
+                future.set_result(outcome.get("value"))
+
+    @staticmethod
+    def _fail(batch: List[Tuple[str, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
 @dataclass
 class WaitResult:
     """Result of a wait operation."""
@@ -47,9 +471,40 @@ class SmartWaiter:
 
     def __init__(self):
         """Initialize smart waiter."""
-        self.wait_history = []  # Track wait times for learning
-        self.page_complexity_cache = {}
+        self.wait_history: deque = deque(maxlen=_HISTORY_SIZE)
+        # Waits inside the history window, with per-condition running
+        # [count, successes, success time] over them
+        self._recent_waits: deque = deque(maxlen=_HISTORY_WINDOW)
+        self._recent_stats: Dict[Any, List[float]] = {}
+        # Complexity factor per client, dropped when its page navigates
+        self.page_complexity_cache: Dict[Any, float] = {}
+        self._complexity_invalidators: Dict[Any, Callable] = {}
         self.network_activity_baseline = None
+        # Listeners of in-flight waits, per (client, CDP event), with the
+        # single handler registered for them
+        self._event_listeners: Dict[
+            Tuple[Any, str], Tuple[Callable, Set[Callable[[Dict[str, Any]], None]]]
+        ] = {}
+        # Remote object IDs of elements found but not yet ready, per
+        # (client, selector type, selector value), and the number of running
+        # waits sharing each; a handle is released when its last wait ends
+        self._element_handles: Dict[Tuple[Any, str, str], str] = {}
+        self._element_waits: Dict[Tuple[Any, str, str], int] = {}
+        # Main-frame lifecycle per client, None where events are unavailable
+        self._page_lifecycles: Dict[Any, Optional[_PageLifecycle]] = {}
+        self._evaluate_batchers: Dict[Any, _EvaluateBatcher] = {}
+        # Clients holding any of the state above, which is dropped when
+        # their connection closes
+        self._tracked_clients: Set[Any] = set()
+        self._condition_checkers: Dict[WaitType, Callable] = {
+            WaitType.ELEMENT_VISIBLE: self._check_element_visible,
+            WaitType.ELEMENT_CLICKABLE: self._check_element_clickable,
+            WaitType.ELEMENT_STABLE: self._check_element_stable,
+            WaitType.PAGE_LOAD: self._check_page_load,
+            WaitType.NETWORK_IDLE: self._check_network_idle,
+            WaitType.DOM_CHANGE: self._check_dom_change,
+            WaitType.ANIMATION_COMPLETE: self._check_animation_complete,
+        }
 
     async def wait_for_condition(
         self,
@@ -75,7 +530,7 @@ class SmartWaiter:
         Returns:
             Wait result with timing information
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Adjust timeout if adaptive
         if adaptive:
@@ -83,80 +538,124 @@ class SmartWaiter:
                 session, condition, timeout
             )
             logger.debug(
-                f"Adaptive timeout: {adjusted_timeout:.1f}s (original: {timeout:.1f}s)"
+                "Adaptive timeout: %.1fs (original: %.1fs)", adjusted_timeout, timeout
             )
             timeout = adjusted_timeout
 
-        logger.debug(f"Waiting for condition: {condition} (timeout: {timeout:.1f}s)")
+        # Wait logging is deferred, so nothing is formatted unless DEBUG is on
+        logger.debug("Waiting for condition: %s (timeout: %.1fs)", condition, timeout)
 
         # Set up condition checker
         condition_checker = self._get_condition_checker(condition, target)
 
-        last_check_time = 0
-        stability_start = None
-        consecutive_successes = 0
+        # Re-check as soon as CDP reports a relevant change
+        wake = await self._watch_changes(session, condition)
 
-        while time.time() - start_time < timeout:
-            try:
-                # Check condition
-                condition_met, additional_info = await condition_checker(session)
-
-                if condition_met:
-                    # Start stability tracking if needed
-                    if stability_time > 0:
-                        if stability_start is None:
-                            stability_start = time.time()
-                            consecutive_successes = 1
-                        else:
-                            consecutive_successes += 1
-
-                        # Check if stable for required time
-                        if time.time() - stability_start >= stability_time:
-                            wait_time = time.time() - start_time
-                            logger.debug(
-                                f"Condition met after {wait_time:.2f}s with stability"
-                            )
-
-                            # Record success for learning
-                            self._record_wait_result(condition, wait_time, True)
+        if isinstance(target, ElementSelector):
+            element_key = _element_key(session, target)
+            self._element_waits[element_key] = (
+                self._element_waits.get(element_key, 0) + 1
+            )
 
-                            return WaitResult(
-                                success=True,
-                                wait_time=wait_time,
-                                condition_met=str(condition),
-                                additional_info=additional_info,
+        last_check_time = 0.0
+        stability_start = None
+        # Outstanding work reported by the previous check, and how many
+        # checks in a row have made no progress
+        last_remaining = None
+        checks_without_progress = 0
+
+        try:
+            while time.monotonic() - start_time < timeout:
+                if wake is not None:
+                    wake.clear()
+
+                try:
+                    # Check condition
+                    condition_met, additional_info = await condition_checker(
+                        session, target
+                    )
+                    check_time = time.monotonic()
+                    remaining = self._remaining_work(condition, additional_info)
+
+                    if condition_met:
+                        if stability_time > 0 and isinstance(target, ElementSelector):
+                            # The page reports once the element stops moving;
+                            # one more check confirms the condition still holds
+                            settled = await self._wait_element_settled(
+                                session,
+                                target,
+                                stability_time,
+                                timeout - (time.monotonic() - start_time),
                             )
+                            if settled:
+                                (
+                                    condition_met,
+                                    additional_info,
+                                ) = await condition_checker(session, target)
+                            if settled and condition_met:
+                                return self._wait_succeeded(
+                                    condition, start_time, additional_info
+                                )
+                        else:
+                            # Succeed once the condition has held for
+                            # stability_time, at once if none is required
+                            if stability_start is None:
+                                stability_start = check_time
+                            if check_time - stability_start >= stability_time:
+                                return self._wait_succeeded(
+                                    condition, start_time, additional_info
+                                )
                     else:
-                        # No stability required
-                        wait_time = time.time() - start_time
-                        logger.debug(f"Condition met after {wait_time:.2f}s")
-
-                        self._record_wait_result(condition, wait_time, True)
-
-                        return WaitResult(
-                            success=True,
-                            wait_time=wait_time,
-                            condition_met=str(condition),
-                            additional_info=additional_info,
+                        # Reset stability tracking
+                        stability_start = None
+
+                    progressed = (
+                        remaining is not None
+                        and last_remaining is not None
+                        and remaining < last_remaining
+                    )
+                    if condition_met or progressed:
+                        checks_without_progress = 0
+
+                    # Back off while nothing changes, or aim for when the
+                    # observed rate of progress should finish the work
+                    current_interval = self._calculate_poll_interval(
+                        condition,
+                        poll_interval,
+                        remaining,
+                        last_remaining,
+                        check_time - last_check_time,
+                        checks_without_progress,
+                    )
+
+                    if not (condition_met or progressed):
+                        checks_without_progress += 1
+                    last_remaining = remaining
+                    last_check_time = check_time
+
+                    if wake is not None:
+                        # Events wake us early, so the poll only backs them up
+                        current_interval = max(current_interval, _EVENT_POLL_INTERVAL)
+
+                    if stability_start is not None:
+                        stable_at = stability_start + stability_time
+                        current_interval = min(
+                            current_interval, max(0.0, stable_at - time.monotonic())
                         )
-                else:
-                    # Reset stability tracking
-                    stability_start = None
-                    consecutive_successes = 0
-
-                # Adaptive polling interval based on condition type
-                current_interval = self._calculate_poll_interval(
-                    condition, poll_interval, time.time() - start_time
-                )
 
-                await asyncio.sleep(current_interval)
+                    await self._sleep_or_wake(wake, current_interval)
 
-            except Exception as e:
-                logger.debug(f"Wait condition check error: {e}")
-                await asyncio.sleep(poll_interval)
+                except Exception as e:
+                    logger.debug("Wait condition check error: %s", e)
+                    await asyncio.sleep(poll_interval)
+        finally:
+            if wake is not None:
+                self._unwatch_changes(session, condition, wake)
+            if isinstance(target, ElementSelector):
+                await self._end_element_wait(session, target)
 
         # Timeout occurred
-        wait_time = time.time() - start_time
+        wait_time = time.monotonic() - start_time
         logger.warning(
             f"Wait timeout after {wait_time:.2f}s for condition: {condition}"
         )
@@ -189,6 +688,65 @@ class SmartWaiter:
             stability_time=stability_time,
         )
 
+    async def wait_for_any_element(
+        self,
+        session: CDPSession,
+        selectors: List[ElementSelector],
+        condition: WaitType = WaitType.ELEMENT_VISIBLE,
+        timeout: float = 30.0,
+        stability_time: float = 0.5,
+    ) -> WaitResult:
+        """Wait until any of several alternative selectors meets a condition.
+
+        The selectors are waited for concurrently, so the wait lasts as long
+        as the quickest match rather than the sum of sequential fallbacks.
+        The remaining waits are cancelled once one succeeds.
+
+        Returns:
+            Result of the first successful wait, with the index of its
+            selector in additional_info["selector_index"], or the last
+            failure if none succeeds
+        """
+
+        if not selectors:
+            return WaitResult(
+                success=False,
+                wait_time=0.0,
+                condition_met="error",
+                additional_info={"error": "No selector provided"},
+                timeout_occurred=False,
+            )
+
+        tasks = [
+            asyncio.create_task(
+                self.wait_for_element(
+                    session, selector, condition, timeout, stability_time
+                )
+            )
+            for selector in selectors
+        ]
+        pending = set(tasks)
+        result = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for index, task in enumerate(tasks):
+                    if task not in done:
+                        continue
+                    result = task.result()
+                    if result.success:
+                        result.additional_info["selector_index"] = index
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return result
+
     async def wait_for_page_load(
         self,
         session: CDPSession,
@@ -227,58 +785,268 @@ class SmartWaiter:
     ) -> WaitResult:
         """Wait for network activity to become idle."""
 
-        start_time = time.time()
+        start_time = time.monotonic()
         last_activity_time = start_time
-        active_requests = 0
+        in_flight: Set[Any] = set()
+        activity = asyncio.Event()
 
         # Enable network domain
         await session.network.enable()
 
-        def on_request_started():
-            nonlocal active_requests, last_activity_time
-            active_requests += 1
-            last_activity_time = time.time()
-
-        def on_request_finished():
-            nonlocal active_requests, last_activity_time
-            active_requests = max(0, active_requests - 1)
-            last_activity_time = time.time()
-
-        # Set up network monitoring (simplified)
-        # In real implementation, would use CDP events
-
-        while time.time() - start_time < timeout:
-            current_time = time.time()
-
-            # Check if network has been idle for required time
-            time_since_activity = current_time - last_activity_time
-
-            if active_requests <= max_connections and time_since_activity >= idle_time:
-                wait_time = current_time - start_time
-                logger.debug(f"Network idle achieved after {wait_time:.2f}s")
-
-                return WaitResult(
-                    success=True,
-                    wait_time=wait_time,
-                    condition_met="network_idle",
-                    additional_info={
-                        "active_requests": active_requests,
-                        "idle_duration": time_since_activity,
-                    },
-                )
-
-            await asyncio.sleep(0.1)
+        def on_request_started(params):
+            nonlocal last_activity_time
+            # Redirects reuse the request ID, so they are not counted twice
+            in_flight.add(params.get("requestId"))
+            last_activity_time = time.monotonic()
+            activity.set()
+
+        def on_request_finished(params):
+            nonlocal last_activity_time
+            in_flight.discard(params.get("requestId"))
+            last_activity_time = time.monotonic()
+            activity.set()
+
+        listeners = (
+            ("Network.requestWillBeSent", on_request_started),
+            ("Network.loadingFinished", on_request_finished),
+            ("Network.loadingFailed", on_request_finished),
+        )
+        for event_name, listener in listeners:
+            self._listen(session, event_name, listener)
+
+        try:
+            while True:
+                current_time = time.monotonic()
+                remaining = timeout - (current_time - start_time)
+
+                # Check if network has been idle for required time
+                time_since_activity = current_time - last_activity_time
+                quiet = len(in_flight) <= max_connections
+
+                if quiet and time_since_activity >= idle_time:
+                    wait_time = current_time - start_time
+                    logger.debug("Network idle achieved after %.2fs", wait_time)
+
+                    return WaitResult(
+                        success=True,
+                        wait_time=wait_time,
+                        condition_met="network_idle",
+                        additional_info={
+                            "active_requests": len(in_flight),
+                            "idle_duration": time_since_activity,
+                        },
+                    )
+
+                if remaining <= 0:
+                    break
+
+                # Sleep until the quiet period would be over, or until the
+                # next request starts or finishes
+                delay = remaining
+                if quiet:
+                    delay = min(delay, idle_time - time_since_activity)
+
+                activity.clear()
+                try:
+                    await asyncio.wait_for(activity.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for event_name, listener in listeners:
+                self._unlisten(session, event_name, listener)
 
         # Timeout
-        wait_time = time.time() - start_time
+        wait_time = time.monotonic() - start_time
         return WaitResult(
             success=False,
             wait_time=wait_time,
             condition_met="timeout",
-            additional_info={"active_requests": active_requests},
+            additional_info={"active_requests": len(in_flight)},
             timeout_occurred=True,
         )
 
+    def _wait_succeeded(
+        self,
+        condition: Union[WaitType, str],
+        start_time: float,
+        additional_info: Dict[str, Any],
+    ) -> WaitResult:
+        """Record a satisfied wait and build its result."""
+
+        wait_time = time.monotonic() - start_time
+        logger.debug("Condition met after %.2fs", wait_time)
+
+        # Record success for learning
+        self._record_wait_result(condition, wait_time, True)
+
+        return WaitResult(
+            success=True,
+            wait_time=wait_time,
+            condition_met=str(condition),
+            additional_info=additional_info,
+        )
+
+    async def _wait_element_settled(
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        stability_time: float,
+        max_wait: float,
+    ) -> bool:
+        """Wait in the page until an element stops moving.
+
+        A resize observer on the element resolves a single evaluate once its
+        box has gone stability_time without resizing or moving. The settle is
+        capped near stability_time; an element still moving then is checked
+        again on a later poll.
+
+        Returns:
+            True if the element settled within max_wait
+        """
+        max_wait = min(max_wait, stability_time * _SETTLE_WINDOW)
+        if max_wait <= 0:
+            return False
+
+        try:
+            result = await asyncio.wait_for(
+                session.runtime.evaluate(
+                    _element_script(
+                        _SETTLE_PROBE,
+                        selector,
+                        int(stability_time * 1000),
+                        int(max_wait * 1000),
+                    ),
+                    await_promise=True,
+                ),
+                timeout=max_wait + _SETTLE_GRACE,
+            )
+        except asyncio.TimeoutError:
+            return False
+        return bool(result and result.get("stable"))
+
+    async def _watch_changes(
+        self, session: CDPSession, condition: Union[WaitType, str]
+    ) -> Optional[asyncio.Event]:
+        """Subscribe to the CDP events that can change a condition.
+
+        Returns:
+            Event set on each relevant change, or None if the condition
+            can only be polled
+        """
+        source = _WAKE_SOURCES.get(condition)
+        if source is None:
+            return None
+
+        try:
+            if source == "page":
+                await session.page.enable()
+            elif source == "network":
+                await session.network.enable()
+            else:
+                await session.runtime.add_binding(_WAKE_BINDING)
+                await session.runtime.evaluate(_WAKE_OBSERVER_JS)
+        except Exception as e:
+            logger.debug(f"Change events unavailable, polling instead: {e}")
+            return None
+
+        wake = _ChangeSignal()
+        for event_name in _WAKE_SOURCE_EVENTS[source]:
+            self._listen(session, event_name, wake)
+
+        return wake
+
+    def _unwatch_changes(
+        self,
+        session: CDPSession,
+        condition: Union[WaitType, str],
+        wake: asyncio.Event,
+    ) -> None:
+        """Drop a wait's wake event, removing handlers nobody needs."""
+
+        for event_name in _WAKE_SOURCE_EVENTS[_WAKE_SOURCES[condition]]:
+            self._unlisten(session, event_name, wake)
+
+    def _listen(
+        self,
+        session: CDPSession,
+        event_name: str,
+        listener: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Call a listener with the params of each matching CDP event."""
+
+        # The client keeps one handler per event, so concurrent waits share
+        # a handler that fans out to each of their listeners
+        key = (session.client, event_name)
+        entry = self._event_listeners.get(key)
+        if entry is None:
+            self._track_client(session.client)
+            listeners: Set[Callable[[Dict[str, Any]], None]] = set()
+
+            def handler(params, listeners=listeners):
+                for listener in listeners:
+                    listener(params)
+
+            session.client.add_event_handler(event_name, handler)
+            entry = self._event_listeners[key] = (handler, listeners)
+        entry[1].add(listener)
+
+    def _unlisten(
+        self,
+        session: CDPSession,
+        event_name: str,
+        listener: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Remove a listener, dropping the client handler once unused."""
+
+        key = (session.client, event_name)
+        entry = self._event_listeners.get(key)
+        if entry is None:
+            # The client's connection closed and its handlers were dropped
+            return
+        handler, listeners = entry
+        listeners.discard(listener)
+        if not listeners:
+            del self._event_listeners[key]
+            session.client.remove_event_handler(event_name, handler)
+
+    def _track_client(self, client: Any) -> None:
+        """Forget a client's per-page state once its connection closes."""
+
+        if client in self._tracked_clients:
+            return
+        self._tracked_clients.add(client)
+        client.add_close_callback(lambda: self._forget_client(client))
+
+    def _forget_client(self, client: Any) -> None:
+        """Drop all state kept for a client and remove its event handlers."""
+
+        self._tracked_clients.discard(client)
+        for key in [key for key in self._event_listeners if key[0] is client]:
+            handler, _ = self._event_listeners.pop(key)
+            client.remove_event_handler(key[1], handler)
+
+        self.page_complexity_cache.pop(client, None)
+        self._complexity_invalidators.pop(client, None)
+        self._page_lifecycles.pop(client, None)
+        self._evaluate_batchers.pop(client, None)
+        # Remote objects die with the connection, so nothing is released
+        for held in (self._element_handles, self._element_waits):
+            for key in [key for key in held if key[0] is client]:
+                del held[key]
+
+    @staticmethod
+    async def _sleep_or_wake(wake: Optional[asyncio.Event], delay: float) -> None:
+        """Sleep for the poll interval, returning early if a change arrives."""
+
+        if wake is None:
+            await asyncio.sleep(delay)
+            return
+
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
     def _get_condition_checker(
         self, condition: Union[WaitType, str], target: Optional[Any]
     ) -> Callable:
@@ -287,22 +1055,102 @@ class SmartWaiter:
         if isinstance(condition, str):
             condition = WaitType(condition)
 
-        if condition == WaitType.ELEMENT_VISIBLE:
-            return self._check_element_visible
-        elif condition == WaitType.ELEMENT_CLICKABLE:
-            return self._check_element_clickable
-        elif condition == WaitType.ELEMENT_STABLE:
-            return self._check_element_stable
-        elif condition == WaitType.PAGE_LOAD:
-            return self._check_page_load
-        elif condition == WaitType.NETWORK_IDLE:
-            return self._check_network_idle
-        elif condition == WaitType.DOM_CHANGE:
-            return self._check_dom_change
-        elif condition == WaitType.ANIMATION_COMPLETE:
-            return self._check_animation_complete
+        return self._condition_checkers.get(condition, self._check_custom_condition)
+
+    async def _check_element_state(
+        self, session: CDPSession, selector: ElementSelector, ready_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Probe visibility and clickability of an element in one round-trip.
+
+        Selector values are passed as JSON literals. Once the element exists
+        but its ready_key state is still false, it is held as a remote object
+        so later polls skip the selector lookup.
+        """
+
+        key = _element_key(session, selector)
+        object_id = self._element_handles.get(key)
+        held_probe = _HELD_ELEMENT_STATE_PROBES.get(selector.type.value)
+        if object_id is not None and held_probe is not None:
+            try:
+                result = await session.runtime.call_function_on(
+                    held_probe, object_id, [{"value": selector.value}]
+                )
+            except Exception as e:
+                # The object's execution context may have been discarded
+                logger.debug(f"Held element unavailable: {e}")
+                result = None
+
+            if result is not None:
+                return result
+            await self._release_element(session, selector, object_id)
+
+        batcher = self._evaluate_batchers.get(session.client)
+        if batcher is None:
+            self._track_client(session.client)
+            batcher = self._evaluate_batchers[session.client] = _EvaluateBatcher(
+                session.runtime
+            )
+        result = await batcher.submit(_element_script(_ELEMENT_STATE_PROBE, selector))
+
+        if result and result.get("found") and not result.get(ready_key):
+            try:
+                handle = await session.runtime.evaluate(
+                    _element_script("function(element) { return element; }", selector),
+                    return_by_value=False,
+                )
+            except Exception as e:
+                logger.debug(f"Could not hold element: {e}")
+            else:
+                object_id = handle.get("objectId")
+                if object_id and key in self._element_handles:
+                    # A concurrent wait on the selector already holds it
+                    await self._release_object(session, object_id)
+                elif object_id:
+                    self._track_client(session.client)
+                    self._element_handles[key] = object_id
+
+        return result
+
+    async def _end_element_wait(
+        self, session: CDPSession, selector: ElementSelector
+    ) -> None:
+        """Drop a finished wait's share of its selector's held element."""
+
+        key = _element_key(session, selector)
+        remaining = self._element_waits.pop(key, 1) - 1
+        if remaining > 0:
+            self._element_waits[key] = remaining
         else:
-            return self._check_custom_condition
+            await self._release_element(session, selector)
+
+    async def _release_element(
+        self,
+        session: CDPSession,
+        selector: ElementSelector,
+        object_id: Optional[str] = None,
+    ) -> None:
+        """Let the page collect an element held for a selector, if any.
+
+        Given an object_id, the handle is only released while it is still
+        the one held, so a handle another wait has since taken is kept.
+        """
+
+        key = _element_key(session, selector)
+        held = self._element_handles.get(key)
+        if held is None or (object_id is not None and held != object_id):
+            return
+
+        del self._element_handles[key]
+        await self._release_object(session, held)
+
+    @staticmethod
+    async def _release_object(session: CDPSession, object_id: str) -> None:
+        """Release a remote element object, ignoring a discarded context."""
+
+        try:
+            await session.runtime.release_object(object_id)
+        except Exception as e:
+            logger.debug(f"Failed to release held element: {e}")
 
     async def _check_element_visible(
         self, session: CDPSession, selector: Optional[ElementSelector] = None
@@ -312,61 +1160,7 @@ class SmartWaiter:
         if not selector:
             return False, {"error": "No selector provided"}
 
-        script = f"""
-        (function() {{
-            let element;
-
-            if ({repr(selector.type.value)} === 'css') {{
-                element = document.querySelector({repr(selector.value)});
-            }} else if ({repr(selector.type.value)} === 'xpath') {{
-                const result = document.evaluate(
-                    {repr(selector.value)}, document, null,
-                    XPathResult.FIRST_ORDERED_NODE_TYPE, null
-                );
-                element = result.singleNodeValue;
-            }} else if ({repr(selector.type.value)} === 'text') {{
-                const walker = document.createTreeWalker(
-                    document.body, NodeFilter.SHOW_ELEMENT
-                );
-                while (walker.nextNode()) {{
-                    if (walker.currentNode.textContent.trim().toLowerCase() ===
-                        {repr(selector.value.lower())}) {{
-                        element = walker.currentNode;
-                        break;
-                    }}
-                }}
-            }}
-
-            if (!element) return {{visible: false, found: false}};
-
-            const rect = element.getBoundingClientRect();
-            const style = window.getComputedStyle(element);
-
-            const visible = style.display !== 'none' &&
-                          style.visibility !== 'hidden' &&
-                          style.opacity !== '0' &&
-                          rect.width > 0 &&
-                          rect.height > 0;
-
-            return {{
-                visible: visible,
-                found: true,
-                rect: {{
-                    x: rect.x,
-                    y: rect.y,
-                    width: rect.width,
-                    height: rect.height
-                }},
-                style: {{
-                    display: style.display,
-                    visibility: style.visibility,
-                    opacity: style.opacity
-                }}
-            }};
-        }})()
-        """
-
-        result = await session.runtime.evaluate(script)
+        result = await self._check_element_state(session, selector, "visible")
         if not result:
             return False, {"error": "Script execution failed"}
 
@@ -377,56 +1171,15 @@ class SmartWaiter:
     ) -> tuple[bool, Dict[str, Any]]:
         """Check if element is clickable."""
 
-        # First check if visible
-        visible, info = await self._check_element_visible(session, selector)
-        if not visible:
-            return False, info
-
         if not selector:
             return False, {"error": "No selector provided"}
 
-        script = f"""
-        (function() {{
-            let element;
-
-            if ({repr(selector.type.value)} === 'css') {{
-                element = document.querySelector({repr(selector.value)});
-            }}
-
-            if (!element) return {{clickable: false}};
-
-            const rect = element.getBoundingClientRect();
-            const style = window.getComputedStyle(element);
-
-            // Check if element is not disabled and not covered
-            const clickable = !element.disabled &&
-                            style.pointerEvents !== 'none' &&
-                            rect.width > 0 &&
-                            rect.height > 0;
-
-            // Check if element is covered by another element
-            const centerX = rect.x + rect.width / 2;
-            const centerY = rect.y + rect.height / 2;
-            const elementAtPoint = document.elementFromPoint(centerX, centerY);
-
-            const notCovered = elementAtPoint === element ||
-                             element.contains(elementAtPoint) ||
-                             (elementAtPoint && elementAtPoint.contains(element));
-
-            return {{
-                clickable: clickable && notCovered,
-                disabled: element.disabled,
-                covered: !notCovered,
-                elementAtPoint: elementAtPoint ? elementAtPoint.tagName : null
-            }};
-        }})()
-        """
-
-        result = await session.runtime.evaluate(script)
+        # The state probe only tests clickability once the element is visible
+        result = await self._check_element_state(session, selector, "clickable")
         if not result:
             return False, {"error": "Script execution failed"}
 
-        return result.get("clickable", False), {**info, **result}
+        return result.get("clickable", False), result
 
     async def _check_element_stable(
         self, session: CDPSession, selector: Optional[ElementSelector] = None
@@ -436,60 +1189,33 @@ class SmartWaiter:
         if not selector:
             return False, {"error": "No selector provided"}
 
-        # Take two measurements with small delay
-        script = f"""
-        (function() {{
-            let element;
-
-            if ({repr(selector.type.value)} === 'css') {{
-                element = document.querySelector({repr(selector.value)});
-            }}
-
-            if (!element) return null;
-
-            const rect = element.getBoundingClientRect();
-            return {{
-                x: rect.x,
-                y: rect.y,
-                width: rect.width,
-                height: rect.height
-            }};
-        }})()
-        """
-
-        first_measurement = await session.runtime.evaluate(script)
-        if not first_measurement:
-            return False, {"error": "Element not found"}
-
-        # Small delay for stability check
-        await asyncio.sleep(0.1)
-
-        second_measurement = await session.runtime.evaluate(script)
-        if not second_measurement:
-            return False, {"error": "Element disappeared"}
-
-        # Check if position changed significantly
-        position_change = abs(first_measurement["x"] - second_measurement["x"]) + abs(
-            first_measurement["y"] - second_measurement["y"]
+        # Both measurements are taken in the page, a frame apart
+        measurements = await session.runtime.evaluate(
+            _element_script(_ELEMENT_RECTS_PROBE, selector), await_promise=True
         )
+        if not measurements:
+            return False, {"error": "Element not found"}
 
-        size_change = abs(
-            first_measurement["width"] - second_measurement["width"]
-        ) + abs(first_measurement["height"] - second_measurement["height"])
-
-        stable = position_change < 2 and size_change < 2  # 2px tolerance
-
-        return stable, {
-            "position_change": position_change,
-            "size_change": size_change,
-            "first_measurement": first_measurement,
-            "second_measurement": second_measurement,
+        return measurements["stable"], {
+            "position_change": measurements["positionChange"],
+            "size_change": measurements["sizeChange"],
+            "first_measurement": measurements["first"],
+            "second_measurement": measurements["second"],
         }
 
     async def _check_page_load(
         self, session: CDPSession, target: Optional[Any] = None
     ) -> tuple[bool, Dict[str, Any]]:
-        """Check if page is fully loaded."""
+        """Check if page is fully loaded.
+
+        Page.lifecycleEvent answers this without touching the page once the
+        current document's lifecycle is known; the in-page probe covers
+        the time before that.
+        """
+
+        lifecycle = await self._track_lifecycle(session)
+        if lifecycle is not None and "init" in lifecycle.events:
+            return "load" in lifecycle.events, {"lifecycle": sorted(lifecycle.events)}
 
         script = """
         (function() {
@@ -516,6 +1242,55 @@ class SmartWaiter:
 
         return loaded, result
 
+    async def _track_lifecycle(self, session: CDPSession) -> Optional[_PageLifecycle]:
+        """Follow the main frame's lifecycle events for a session's page.
+
+        Returns:
+            Lifecycle kept current by the events, or None if they are
+            unavailable
+        """
+
+        client = session.client
+        if client in self._page_lifecycles:
+            return self._page_lifecycles[client]
+
+        # Registered first so concurrent checks fall back to the probe
+        lifecycle = self._page_lifecycles[client] = _PageLifecycle()
+
+        def on_navigated(params):
+            frame = params.get("frame", {})
+            if frame.get("parentId") is None:
+                lifecycle.frame_id = frame.get("id")
+
+        def on_lifecycle(params):
+            if params.get("frameId") != lifecycle.frame_id:
+                return
+            # "init" starts a new document
+            if params.get("name") == "init":
+                lifecycle.events.clear()
+            lifecycle.events.add(params.get("name"))
+
+        listeners = (
+            ("Page.frameNavigated", on_navigated),
+            ("Page.lifecycleEvent", on_lifecycle),
+        )
+        for event_name, listener in listeners:
+            self._listen(session, event_name, listener)
+
+        try:
+            tree = await session.page.get_frame_tree()
+            lifecycle.frame_id = tree["frameTree"]["frame"]["id"]
+            # Enabling replays the events the document has already reached
+            await session.page.set_lifecycle_events_enabled()
+        except Exception as e:
+            logger.debug(f"Lifecycle events unavailable, probing instead: {e}")
+            for event_name, listener in listeners:
+                self._unlisten(session, event_name, listener)
+            self._page_lifecycles[client] = None
+            return None
+
+        return lifecycle
+
     async def _check_network_idle(
         self, session: CDPSession, target: Optional[Any] = None
     ) -> tuple[bool, Dict[str, Any]]:
@@ -616,7 +1391,15 @@ class SmartWaiter:
         return adaptive_timeout
 
     async def _get_page_complexity_factor(self, session: CDPSession) -> float:
-        """Get page complexity factor for timeout adjustment."""
+        """Get page complexity factor for timeout adjustment.
+
+        The factor of a loaded page is cached until its main frame navigates
+        or a new document starts, so clustered waits skip the DOM scan.
+        """
+
+        cached = self.page_complexity_cache.get(session.client)
+        if cached is not None:
+            return cached
 
         script = """
         (function() {
@@ -654,32 +1437,59 @@ class SmartWaiter:
         if image_count > 20:
             complexity += 0.2
 
+        # Counts of a document still loading are about to change
+        if result.get("readyState") == "complete" and await self._watch_navigation(
+            session
+        ):
+            self.page_complexity_cache[session.client] = complexity
+
         return complexity
 
+    async def _watch_navigation(self, session: CDPSession) -> bool:
+        """Drop the cached complexity of a client whenever its page changes.
+
+        Returns:
+            Whether navigations are observed, and so caching is safe
+        """
+
+        if session.client in self._complexity_invalidators:
+            return True
+
+        try:
+            await session.page.enable()
+        except Exception as e:
+            logger.debug(f"Navigation events unavailable, not caching: {e}")
+            return False
+
+        client = session.client
+        cache = self.page_complexity_cache
+
+        def invalidate(params):
+            frame = params.get("frame")
+            if frame is not None:
+                # Page.frameNavigated; subframes have their own documents
+                if frame.get("parentId") is None:
+                    cache.pop(client, None)
+            elif params.get("name") == "init":
+                cache.pop(client, None)
+
+        self._listen(session, "Page.frameNavigated", invalidate)
+        self._listen(session, "Page.lifecycleEvent", invalidate)
+        self._complexity_invalidators[client] = invalidate
+        return True
+
     def _get_historical_factor(self, condition: WaitType) -> float:
         """Get historical performance factor."""
 
-        # Filter history for this condition type
-        condition_history = [
-            entry
-            for entry in self.wait_history[-50:]  # Last 50 entries
-            if entry.get("condition") == condition
-        ]
-
-        if not condition_history:
+        stats = self._recent_stats.get(condition)
+        if not stats:
             return 1.0
 
-        # Calculate average success time
-        successful_waits = [
-            entry["wait_time"]
-            for entry in condition_history
-            if entry.get("success", False)
-        ]
-
-        if not successful_waits:
+        _, successes, success_time = stats
+        if not successes:
             return 1.2  # Increase timeout if recent failures
 
-        avg_time = sum(successful_waits) / len(successful_waits)
+        avg_time = success_time / successes
 
         # Factor based on average time
         if avg_time > 10.0:
@@ -694,31 +1504,50 @@ class SmartWaiter:
     def _get_condition_factor(self, condition: WaitType) -> float:
         """Get condition-specific timeout factor."""
 
-        factors = {
-            WaitType.ELEMENT_VISIBLE: 1.0,
-            WaitType.ELEMENT_CLICKABLE: 1.2,
-            WaitType.ELEMENT_STABLE: 1.5,
-            WaitType.PAGE_LOAD: 2.0,
-            WaitType.NETWORK_IDLE: 2.5,
-            WaitType.ANIMATION_COMPLETE: 1.3,
-            WaitType.DOM_CHANGE: 1.1,
-            WaitType.CUSTOM_CONDITION: 1.0,
-        }
-
-        return factors.get(condition, 1.0)
+        return _CONDITION_FACTORS.get(condition, 1.0)
 
     def _calculate_poll_interval(
-        self, condition: WaitType, base_interval: float, elapsed_time: float
+        self,
+        condition: WaitType,
+        base_interval: float,
+        remaining: Optional[float] = None,
+        last_remaining: Optional[float] = None,
+        since_last_check: float = 0.0,
+        checks_without_progress: int = 0,
     ) -> float:
-        """Calculate adaptive polling interval."""
+        """Calculate adaptive polling interval.
+
+        While the outstanding work shrinks, the next check is scheduled for
+        when the current rate would finish it; otherwise polling backs off
+        exponentially. Both are bounded by base_interval and
+        _MAX_POLL_INTERVAL.
+        """
 
-        # Start with more frequent polling, then back off
-        if elapsed_time < 1.0:
-            return base_interval * 0.5
-        elif elapsed_time < 5.0:
-            return base_interval
+        if (
+            remaining is not None
+            and last_remaining is not None
+            and remaining < last_remaining
+            and since_last_check > 0
+        ):
+            rate = (last_remaining - remaining) / since_last_check
+            estimate = remaining / rate
         else:
-            return base_interval * 2.0
+            # The exponent is clamped; the cap is reached long before anyway
+            estimate = base_interval * 2 ** min(checks_without_progress, 16)
+
+        return max(base_interval, min(estimate, _MAX_POLL_INTERVAL))
+
+    @staticmethod
+    def _remaining_work(
+        condition: Union[WaitType, str], info: Dict[str, Any]
+    ) -> Optional[float]:
+        """Outstanding work a checker reported, if the condition measures any."""
+
+        keys = _PROGRESS_KEYS.get(condition)
+        if not keys or not isinstance(info, dict):
+            return None
+
+        return float(sum(info.get(key, 0) for key in keys))
 
     def _record_wait_result(
         self, condition: WaitType, wait_time: float, success: bool
@@ -732,8 +1561,22 @@ class SmartWaiter:
             "timestamp": time.time(),
         }
 
+        # The deques drop the oldest entries themselves; the one leaving
+        # the window is taken out of its condition's totals first
         self.wait_history.append(entry)
-
-        # Keep only recent history
-        if len(self.wait_history) > 200:
-            self.wait_history = self.wait_history[-100:]
+        if len(self._recent_waits) == _HISTORY_WINDOW:
+            self._update_recent_stats(self._recent_waits[0], -1)
+        self._recent_waits.append(entry)
+        self._update_recent_stats(entry, 1)
+
+    def _update_recent_stats(self, entry: Dict[str, Any], sign: int) -> None:
+        """Add a wait to, or with sign -1 remove it from, the window totals."""
+
+        stats = self._recent_stats.setdefault(entry["condition"], [0, 0, 0.0])
+        stats[0] += sign
+        if entry["success"]:
+            stats[1] += sign
+            # Reset with the last success so rounding error cannot linger
+            stats[2] = stats[2] + sign * entry["wait_time"] if stats[1] else 0.0
+        if not stats[0]:
+            del self._recent_stats[entry["condition"]]
@@ -5,14 +5,98 @@ This module provides cross-platform desktop automation capabilities,
 with Windows UI Automation API integration when available.
 """
 
+import asyncio
+import ctypes
 import logging
 import platform
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# The platform cannot change while the process runs, so it is read once
+_PLATFORM = platform.system().lower()
+_IS_WINDOWS = _PLATFORM == "windows"
+
+
+def _probe_uia() -> bool:
+    """Check whether the pywin32 modules used for UI Automation import."""
+    try:
+        # Try to import Windows-specific modules
+        import win32con
+        import win32gui  # pywin32
+        import win32process
+
+        logger.info("Windows UI Automation libraries available")
+        return True
+    except ImportError as e:
+        logger.info(f"Windows UI Automation libraries not available: {e}")
+        # Fall back to cross-platform alternatives
+        return False
+
+
+_UIA_AVAILABLE = _IS_WINDOWS and _probe_uia()
+
+# Characters read from window titles and class names
+_TITLE_BUFFER_SIZE = 512
+_CLASS_BUFFER_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def _user32() -> Tuple[Any, Any]:
+    """Load user32 with typed prototypes for window enumeration (Windows only).
+
+    Returns:
+        The user32 library and the WNDENUMPROC callback type
+    """
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    enum_proc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    user32.EnumWindows.argtypes = [enum_proc, wintypes.LPARAM]
+    user32.EnumWindows.restype = wintypes.BOOL
+    user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    user32.IsWindowVisible.restype = wintypes.BOOL
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetClassNameW.restype = ctypes.c_int
+    user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+    user32.GetWindowRect.restype = wintypes.BOOL
+    user32.GetWindowThreadProcessId.argtypes = [
+        wintypes.HWND,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+
+    return user32, enum_proc
+
+
+# Whether each desktop tool could be run, remembered after the first probe
+_TOOL_AVAILABILITY: Dict[str, bool] = {}
+
+
+def _tool_available(command: List[str]) -> bool:
+    """Check once whether a command-line tool can be run.
+
+    Timeouts are not remembered, since a busy system may answer later.
+    """
+    tool = command[0]
+    if tool not in _TOOL_AVAILABILITY:
+        try:
+            subprocess.run(command, capture_output=True, timeout=2)
+        except subprocess.TimeoutExpired:
+            return False
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            _TOOL_AVAILABILITY[tool] = False
+        else:
+            _TOOL_AVAILABILITY[tool] = True
+
+    return _TOOL_AVAILABILITY[tool]
+
 
 class WindowsAutomationError(Exception):
     """Exception raised when Windows automation operations fail."""
@@ -54,33 +138,19 @@ class WindowsAutomation:
     """Cross-platform Windows/desktop automation interface."""
 
     def __init__(self):
-        """Initialize Windows automation."""
-        self.platform = platform.system().lower()
-        self.is_windows = self.platform == "windows"
-        self._uia_available = False
+        """Initialize Windows automation.
 
-        if self.is_windows:
-            try:
-                self._check_uia_availability()
-            except Exception as e:
-                logger.warning(f"Windows UI Automation not fully available: {e}")
+        Platform and library detection happen once at import, so instances
+        are cheap to create.
+        """
+        self.platform = _PLATFORM
+        self.is_windows = _IS_WINDOWS
+        self._uia_available = _UIA_AVAILABLE
 
     def _check_uia_availability(self) -> bool:
-        """Check if Windows UI Automation is available."""
-        try:
-            # Try to import Windows-specific modules
-            import win32con
-            import win32gui  # pywin32
-            import win32process
-
-            self._uia_available = True
-            logger.info("Windows UI Automation libraries available")
-            return True
-        except ImportError as e:
-            logger.info(f"Windows UI Automation libraries not available: {e}")
-            # Fall back to cross-platform alternatives
-            self._uia_available = False
-            return False
+        """Check again if Windows UI Automation is available."""
+        self._uia_available = _probe_uia()
+        return self._uia_available
 
     async def find_windows_by_title(self, title_pattern: str) -> List[WindowInfo]:
         """Find windows matching title pattern.
@@ -94,42 +164,62 @@ class WindowsAutomation:
         Raises:
             WindowsAutomationError: If window enumeration fails
         """
-        if self.is_windows and self._uia_available:
-            return self._find_windows_win32(title_pattern)
+        if self.is_windows:
+            # EnumWindows blocks for the whole walk; keep it off the event loop
+            return await asyncio.to_thread(self._find_windows_win32, title_pattern)
         else:
             return await self._find_windows_cross_platform(title_pattern)
 
     def _find_windows_win32(self, title_pattern: str) -> List[WindowInfo]:
-        """Find windows using Win32 APIs (Windows only)."""
+        """Find windows using Win32 APIs (Windows only).
+
+        user32 is called through ctypes, so enumeration needs no pywin32
+        and avoids its per-call object conversions; windows whose title
+        does not match are skipped before any further queries.
+        """
         try:
-            import win32gui
-            import win32process
+            from ctypes import wintypes
 
+            user32, enum_proc = _user32()
+            pattern = title_pattern.lower()
+            title_buffer = ctypes.create_unicode_buffer(_TITLE_BUFFER_SIZE)
+            class_buffer = ctypes.create_unicode_buffer(_CLASS_BUFFER_SIZE)
             windows = []
 
-            def enum_windows_callback(hwnd, windows_list):
-                if win32gui.IsWindowVisible(hwnd):
-                    title = win32gui.GetWindowText(hwnd)
-                    class_name = win32gui.GetClassName(hwnd)
+            def enum_windows_callback(hwnd, lparam):
+                if not user32.IsWindowVisible(hwnd):
+                    return True
 
-                    if title_pattern.lower() in title.lower():
-                        try:
-                            _, process_id = win32process.GetWindowThreadProcessId(hwnd)
-                            rect = win32gui.GetWindowRect(hwnd)
+                user32.GetWindowTextW(hwnd, title_buffer, _TITLE_BUFFER_SIZE)
+                title = title_buffer.value
+                if pattern not in title.lower():
+                    return True
 
-                            window_info = WindowInfo(
-                                hwnd=hwnd,
-                                title=title,
-                                class_name=class_name,
-                                process_id=process_id,
-                                rect=rect,
-                            )
-                            windows_list.append(window_info)
-                        except Exception as e:
-                            logger.debug(f"Error getting window info for {hwnd}: {e}")
+                # Exceptions cannot propagate out of a ctypes callback
+                try:
+                    user32.GetClassNameW(hwnd, class_buffer, _CLASS_BUFFER_SIZE)
+                    rect = wintypes.RECT()
+                    user32.GetWindowRect(hwnd, ctypes.byref(rect))
+                    process_id = wintypes.DWORD()
+                    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(process_id))
+
+                    window_info = WindowInfo(
+                        hwnd=hwnd,
+                        title=title,
+                        class_name=class_buffer.value,
+                        process_id=process_id.value,
+                        rect=(rect.left, rect.top, rect.right, rect.bottom),
+                    )
+                    windows.append(window_info)
+                except Exception as e:
+                    logger.debug(f"Error getting window info for {hwnd}: {e}")
                 return True
 
-            win32gui.EnumWindows(enum_windows_callback, windows)
+            # The callback object must stay alive until EnumWindows returns
+            callback = enum_proc(enum_windows_callback)
+            if not user32.EnumWindows(callback, 0):
+                raise ctypes.WinError(ctypes.get_last_error())
+
             logger.debug(f"Found {len(windows)} windows matching '{title_pattern}'")
             return windows
 
@@ -156,76 +246,100 @@ class WindowsAutomation:
         return windows
 
     async def _find_windows_linux(self, title_pattern: str) -> List[WindowInfo]:
-        """Find windows on Linux using wmctrl."""
+        """Find windows on Linux using wmctrl, or xdotool without it."""
         windows = []
+        wmctrl_listed = False
 
         try:
-            # Try wmctrl first
-            result = subprocess.run(
-                ["wmctrl", "-l"], capture_output=True, text=True, timeout=5
+            # One wmctrl run lists the ID, PID, geometry and title of every
+            # window; a successful listing is final even without matches
+            result = await asyncio.to_thread(
+                subprocess.run,
+                ["wmctrl", "-lpG"],
+                capture_output=True,
+                text=True,
+                timeout=5,
             )
 
             if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if line and title_pattern.lower() in line.lower():
-                        parts = line.split(None, 3)
-                        if len(parts) >= 4:
-                            window_id = parts[0]
-                            title = parts[3]
-
-                            windows.append(
-                                WindowInfo(
-                                    title=title,
-                                    class_name="",
-                                    # Convert hex window ID to int if possible
-                                    hwnd=int(window_id, 16)
-                                    if window_id.startswith("0x")
-                                    else None,
-                                )
-                            )
+                wmctrl_listed = True
+                pattern = title_pattern.lower()
+                for line in result.stdout.splitlines():
+                    # ID, desktop, PID, x, y, width, height, host, title
+                    parts = line.split(None, 8)
+                    if len(parts) < 8:
+                        continue
+                    title = parts[8] if len(parts) > 8 else ""
+                    if pattern not in title.lower():
+                        continue
+
+                    window_id, _, pid, x, y, width, height = parts[:7]
+                    left, top = int(x), int(y)
+                    windows.append(
+                        WindowInfo(
+                            title=title,
+                            class_name="",
+                            # Convert hex window ID to int if possible
+                            hwnd=int(window_id, 16)
+                            if window_id.startswith("0x")
+                            else None,
+                            # wmctrl reports 0 when the PID is unknown
+                            process_id=int(pid) or None,
+                            rect=(left, top, left + int(width), top + int(height)),
+                        )
+                    )
 
         except (
             subprocess.TimeoutExpired,
             subprocess.CalledProcessError,
             FileNotFoundError,
+            ValueError,
         ):
             logger.debug("wmctrl not available or failed")
 
         # Try xdotool as fallback
-        if not windows:
+        if not wmctrl_listed:
             try:
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["xdotool", "search", "--name", title_pattern],
                     capture_output=True,
                     text=True,
                     timeout=5,
                 )
 
-                if result.returncode == 0:
-                    for window_id in result.stdout.strip().split("\n"):
-                        if window_id.strip():
-                            # Get window title
-                            title_result = subprocess.run(
-                                ["xdotool", "getwindowname", window_id.strip()],
-                                capture_output=True,
-                                text=True,
-                                timeout=2,
-                            )
+                window_ids = (
+                    [line.strip() for line in result.stdout.split("\n") if line.strip()]
+                    if result.returncode == 0
+                    else []
+                )
 
-                            title = (
-                                title_result.stdout.strip()
-                                if title_result.returncode == 0
-                                else "Unknown"
-                            )
+                if window_ids:
+                    # Chain one getwindowname per window into a single run;
+                    # titles come back in order, up to any window that closed
+                    command = ["xdotool"]
+                    for window_id in window_ids:
+                        command.extend(["getwindowname", window_id])
+                    title_result = await asyncio.to_thread(
+                        subprocess.run,
+                        command,
+                        capture_output=True,
+                        text=True,
+                        timeout=5,
+                    )
+                    titles = title_result.stdout.splitlines()
+
+                    for index, window_id in enumerate(window_ids):
+                        title = (
+                            titles[index].strip() if index < len(titles) else "Unknown"
+                        )
 
-                            windows.append(
-                                WindowInfo(
-                                    title=title,
-                                    hwnd=int(window_id.strip())
-                                    if window_id.strip().isdigit()
-                                    else None,
-                                )
+                        windows.append(
+                            WindowInfo(
+                                title=title,
+                                hwnd=int(window_id) if window_id.isdigit() else None,
                             )
+                        )
 
             except (
                 subprocess.TimeoutExpired,
@@ -259,7 +373,8 @@ class WindowsAutomation:
         """
 
         try:
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["osascript", "-e", applescript],
                 capture_output=True,
                 text=True,
@@ -318,7 +433,8 @@ class WindowsAutomation:
         if self.platform == "linux" and window.hwnd:
             try:
                 # Try wmctrl first
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["wmctrl", "-i", "-a", str(window.hwnd)],
                     capture_output=True,
                     timeout=5,
@@ -327,7 +443,8 @@ class WindowsAutomation:
                     return True
 
                 # Try xdotool as fallback
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["xdotool", "windowactivate", str(window.hwnd)],
                     capture_output=True,
                     timeout=5,
@@ -359,8 +476,11 @@ class WindowsAutomation:
             """
 
             try:
-                result = subprocess.run(
-                    ["osascript", "-e", applescript], capture_output=True, timeout=10
+                result = await asyncio.to_thread(
+                    subprocess.run,
+                    ["osascript", "-e", applescript],
+                    capture_output=True,
+                    timeout=10,
                 )
                 return result.returncode == 0
             except (
@@ -392,31 +512,13 @@ class WindowsAutomation:
             # Check for Linux/macOS tools
             if self.platform == "linux":
                 # Check for wmctrl or xdotool
-                for tool in ["wmctrl", "xdotool"]:
-                    try:
-                        subprocess.run(
-                            [tool, "--version"], capture_output=True, timeout=2
-                        )
-                        return True
-                    except (
-                        subprocess.TimeoutExpired,
-                        subprocess.CalledProcessError,
-                        FileNotFoundError,
-                    ):
-                        continue
+                return any(
+                    _tool_available([tool, "--version"])
+                    for tool in ["wmctrl", "xdotool"]
+                )
             elif self.platform == "darwin":
                 # AppleScript should be available on macOS
-                try:
-                    subprocess.run(
-                        ["osascript", "-e", "return 1"], capture_output=True, timeout=2
-                    )
-                    return True
-                except (
-                    subprocess.TimeoutExpired,
-                    subprocess.CalledProcessError,
-                    FileNotFoundError,
-                ):
-                    pass
+                return _tool_available(["osascript", "-e", "return 1"])
 
         return False
 
@@ -8,7 +8,7 @@ via the DevTools Protocol over WebSocket connections.
 import asyncio
 import json
 import logging
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import aiohttp
 import websockets
@@ -55,6 +55,7 @@ class CDPClient:
         self._message_id = 0
         self._pending_messages: Dict[int, asyncio.Future] = {}
         self._event_handlers: Dict[str, Callable] = {}
+        self._close_callbacks: List[Callable[[], None]] = []
         self._receive_task: Optional[asyncio.Task] = None
 
     async def connect(self, tab_id: Optional[str] = None) -> None:
@@ -106,6 +107,7 @@ class CDPClient:
                 future.cancel()
         self._pending_messages.clear()
 
+        self._notify_closed()
         logger.info("CDP connection closed")
 
     async def send_command(
@@ -168,6 +170,36 @@ class CDPClient:
         """
         self._event_handlers[event_name] = handler
 
+    def remove_event_handler(
+        self, event_name: str, handler: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Remove a CDP event handler if it is still the registered one.
+
+        Args:
+            event_name: CDP event name
+            handler: Handler previously passed to add_event_handler
+        """
+        if self._event_handlers.get(event_name) is handler:
+            del self._event_handlers[event_name]
+
+    def add_close_callback(self, callback: Callable[[], None]) -> None:
+        """Call a function once when the connection closes.
+
+        Args:
+            callback: Function called without arguments on close or
+                disconnect
+        """
+        self._close_callbacks.append(callback)
+
+    def _notify_closed(self) -> None:
+        """Run and clear the registered close callbacks."""
+        callbacks, self._close_callbacks = self._close_callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in CDP close callback: {e}")
+
     async def enable_domain(self, domain: str) -> None:
         """Enable CDP domain to receive events.
 
@@ -233,6 +265,9 @@ class CDPClient:
         except Exception as e:
             logger.error(f"Error in CDP message receiver: {e}")
 
+        # The connection is gone without close() having been called
+        self._notify_closed()
+
     async def _handle_message(self, data: Dict[str, Any]) -> None:
         """Handle incoming CDP message.
 
@@ -104,6 +104,37 @@ class PageDomain(CDPDomain):
         await self.enable()
         return await self.client.send_command("Page.getFrameTree")
 
+    async def set_lifecycle_events_enabled(self, enabled: bool = True) -> None:
+        """Control Page.lifecycleEvent reporting.
+
+        When enabled, lifecycle events already reached by the current
+        documents are reported too.
+
+        Args:
+            enabled: Whether to report lifecycle events
+        """
+        await self.enable()
+        await self.client.send_command(
+            "Page.setLifecycleEventsEnabled", {"enabled": enabled}
+        )
+
+    async def create_isolated_world(self, frame_id: str, world_name: str = "") -> int:
+        """Create an isolated JavaScript world in a frame.
+
+        Args:
+            frame_id: Frame to create the world in
+            world_name: Name for the world
+
+        Returns:
+            Execution context ID of the new world
+        """
+        await self.enable()
+        result = await self.client.send_command(
+            "Page.createIsolatedWorld",
+            {"frameId": frame_id, "worldName": world_name},
+        )
+        return result["executionContextId"]
+
     async def capture_screenshot(
         self,
         format: str = "png",
@@ -192,6 +223,15 @@ class PageDomain(CDPDomain):
 class RuntimeDomain(CDPDomain):
     """Runtime domain for JavaScript execution."""
 
+    def __init__(self, client: CDPClient):
+        """Initialize runtime domain.
+
+        Args:
+            client: CDP client instance
+        """
+        super().__init__(client)
+        self._bindings: set = set()
+
     @property
     def domain_name(self) -> str:
         return "Runtime"
@@ -212,7 +252,8 @@ class RuntimeDomain(CDPDomain):
             context_id: Execution context ID
 
         Returns:
-            Evaluation result
+            Evaluation result, or its remote object description (with an
+            ``objectId`` for non-primitive values) when not returned by value
         """
         await self.enable()
 
@@ -230,8 +271,98 @@ class RuntimeDomain(CDPDomain):
         if result.get("exceptionDetails"):
             raise CDPError(f"JavaScript error: {result['exceptionDetails']}")
 
+        if not return_by_value:
+            return result.get("result", {})
+
         return result.get("result", {}).get("value")
 
+    async def compile_script(
+        self,
+        expression: str,
+        source_url: str = "",
+        persist_script: bool = True,
+        context_id: Optional[int] = None,
+    ) -> str:
+        """Compile a JavaScript expression for later runs.
+
+        Args:
+            expression: JavaScript expression to compile
+            source_url: Source URL reported for the script
+            persist_script: Whether the compiled script should be kept
+            context_id: Execution context ID
+
+        Returns:
+            Script ID to pass to run_script
+        """
+        await self.enable()
+
+        params = {
+            "expression": expression,
+            "sourceURL": source_url,
+            "persistScript": persist_script,
+        }
+
+        if context_id:
+            params["executionContextId"] = context_id
+
+        result = await self.client.send_command("Runtime.compileScript", params)
+
+        if result.get("exceptionDetails"):
+            raise CDPError(f"Compilation error: {result['exceptionDetails']}")
+
+        return result["scriptId"]
+
+    async def run_script(
+        self,
+        script_id: str,
+        return_by_value: bool = True,
+        await_promise: bool = False,
+        context_id: Optional[int] = None,
+    ) -> Any:
+        """Run a script compiled with compile_script.
+
+        Args:
+            script_id: Script ID returned by compile_script
+            return_by_value: Whether to return by value
+            await_promise: Whether to await promise resolution
+            context_id: Execution context ID
+
+        Returns:
+            Run result
+        """
+        await self.enable()
+
+        params = {
+            "scriptId": script_id,
+            "returnByValue": return_by_value,
+            "awaitPromise": await_promise,
+        }
+
+        if context_id:
+            params["executionContextId"] = context_id
+
+        result = await self.client.send_command("Runtime.runScript", params)
+
+        if result.get("exceptionDetails"):
+            raise CDPError(f"JavaScript error: {result['exceptionDetails']}")
+
+        return result.get("result", {}).get("value")
+
+    async def add_binding(self, name: str) -> None:
+        """Expose a page function whose calls arrive as Runtime.bindingCalled.
+
+        Bindings persist across navigations, so each name is added once.
+
+        Args:
+            name: Global function name to install in every execution context
+        """
+        if name in self._bindings:
+            return
+
+        await self.enable()
+        await self.client.send_command("Runtime.addBinding", {"name": name})
+        self._bindings.add(name)
+
     async def call_function_on(
         self,
         function_declaration: str,
@@ -268,21 +399,35 @@ class RuntimeDomain(CDPDomain):
 
         return result.get("result", {}).get("value")
 
-    async def get_properties(self, object_id: str) -> List[Dict[str, Any]]:
+    async def get_properties(
+        self, object_id: str, own_properties: bool = False
+    ) -> List[Dict[str, Any]]:
         """Get object properties.
 
         Args:
             object_id: Object ID
+            own_properties: Only return the object's own properties
 
         Returns:
             List of properties
         """
         await self.enable()
-        result = await self.client.send_command(
-            "Runtime.getProperties", {"objectId": object_id}
-        )
+
+        params: Dict[str, Any] = {"objectId": object_id}
+        if own_properties:
+            params["ownProperties"] = True
+
+        result = await self.client.send_command("Runtime.getProperties", params)
         return result.get("result", [])
 
+    async def release_object(self, object_id: str) -> None:
+        """Release a remote object so the page can garbage collect it.
+
+        Args:
+            object_id: Object ID
+        """
+        await self.client.send_command("Runtime.releaseObject", {"objectId": object_id})
+
 
 class DOMDomain(CDPDomain):
     """DOM domain for document manipulation."""
@@ -3,7 +3,8 @@ Tests for Phase 3: Advanced Automation features.
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -15,6 +16,7 @@ from surfboard.automation.advanced_interactions import (
 )
 from surfboard.automation.element_selector import (
     AdvancedElementSelector,
+    ElementFlags,
     SelectionResult,
     SelectionStrategy,
 )
@@ -31,8 +33,10 @@ from surfboard.automation.performance_optimizer import (
     ResourceMetrics,
 )
 from surfboard.automation.smart_waiter import SmartWaiter, WaitResult, WaitType
+from surfboard.protocols.cdp import CDPConnectionError, CDPError, CDPTimeoutError
 from surfboard.protocols.llm_protocol import (
     BaseCommand,
+    ClickCommand,
     CommandType,
     ElementSelector,
     ElementSelectorType,
@@ -91,6 +95,251 @@ class TestAdvancedElementSelector:
         assert result.confidence == 1.0
         assert result.element_id == "test-button"
         assert result.text_content == "Submit"
+        # An exact match returns before the page complexity probe runs
+        assert mock_session.runtime.evaluate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_multiple_elements_fast_path(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test that the fast path skips attribute and text collection."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "names": [],
+            "rows": [["button1", [100, 200, 80, 30], None, "", 1]],
+        }
+
+        results = await selector.find_multiple_elements(
+            mock_session, element_selector_css, limit=5, fast_path=True
+        )
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "__sbAttrPairs(element, names, codes)," not in script
+        assert "textContent" not in script
+        assert results[0].element_id == "button1"
+        assert results[0].attributes == {}
+
+    @pytest.mark.asyncio
+    async def test_iter_elements_stops_early(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test that callers can stop after the first streamed match."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "names": [],
+            "rows": [
+                ["first", [0, 0, 10, 10], [], "Click me", 3],
+                ["second", [0, 20, 10, 10], [], "Click me", 3],
+            ],
+        }
+
+        seen = []
+        async for result in selector.iter_elements(
+            mock_session, element_selector_css, limit=5
+        ):
+            seen.append(result.element_id)
+            break
+
+        assert seen == ["first"]
+        assert mock_session.runtime.evaluate.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_multiple_elements_reuses_script(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test that repeated selection reuses the cached script."""
+
+        mock_session.runtime.evaluate.return_value = []
+
+        await selector.find_multiple_elements(mock_session, element_selector_css)
+        await selector.find_multiple_elements(mock_session, element_selector_css)
+        first, second = mock_session.runtime.evaluate.call_args_list
+
+        assert first[0][0] is second[0][0]
+        assert len(selector._script_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_find_element_handles(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test that handles come back by reference, without serialization."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "type": "object",
+            "subtype": "array",
+            "objectId": "array-1",
+        }
+        mock_session.runtime.get_properties.return_value = [
+            {"name": "1", "value": {"type": "object", "objectId": "node-b"}},
+            {"name": "0", "value": {"type": "object", "objectId": "node-a"}},
+            {"name": "length", "value": {"type": "number", "value": 2}},
+        ]
+
+        handles = await selector.find_element_handles(
+            mock_session, element_selector_css
+        )
+
+        assert handles == ["node-a", "node-b"]
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "__sbAttrPairs(element, names, codes)," not in script
+        assert mock_session.runtime.evaluate.call_args[1] == {"return_by_value": False}
+        mock_session.runtime.release_object.assert_awaited_once_with("array-1")
+
+    @pytest.mark.asyncio
+    async def test_multiple_elements_in_frames(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test selection fanned out across frames, skipping unreachable ones."""
+
+        mock_session.client = MagicMock()
+        mock_session.page.get_frame_tree.return_value = {
+            "frameTree": {
+                "frame": {"id": "main"},
+                "childFrames": [
+                    {"frame": {"id": "ad"}},
+                    {"frame": {"id": "login"}},
+                ],
+            }
+        }
+        mock_session.page.create_isolated_world.side_effect = [
+            1,
+            CDPError("Frame is out of process"),
+            3,
+        ]
+        mock_session.runtime.evaluate.side_effect = [
+            {"names": [], "rows": [["top", [0, 0, 80, 30], [], "Top", 3]]},
+            {
+                "names": ["name"],
+                "rows": [["inner", [5, 5, 80, 30], [0, "go"], "Go", 7]],
+            },
+        ]
+
+        results = await selector.find_multiple_elements_in_frames(
+            mock_session, element_selector_css
+        )
+
+        assert [(r.element_id, r.frame_id) for r in results] == [
+            ("top", "main"),
+            ("inner", "login"),
+        ]
+        assert results[1].attributes == {"name": "go"}
+        contexts = [
+            call[1]["context_id"]
+            for call in mock_session.runtime.evaluate.call_args_list
+        ]
+        assert contexts == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_frame_worlds_are_reused(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test isolated worlds are created once per frame document."""
+
+        closers = []
+        mock_session.client = MagicMock()
+        mock_session.client.add_close_callback.side_effect = closers.append
+        tree = {"frame": {"id": "main"}, "childFrames": [{"frame": {"id": "child"}}]}
+        mock_session.page.get_frame_tree.return_value = {"frameTree": tree}
+        mock_session.page.create_isolated_world.side_effect = [1, 2, 3]
+        stale = CDPError("CDP command failed: Cannot find context with specified id")
+        mock_session.runtime.evaluate.side_effect = [None, None, None, stale, None]
+
+        await selector.find_multiple_elements_in_frames(
+            mock_session, element_selector_css
+        )
+        assert mock_session.page.create_isolated_world.await_count == 2
+
+        # Only the navigated child frame gets a new world
+        await selector.find_multiple_elements_in_frames(
+            mock_session, element_selector_css
+        )
+        assert mock_session.page.create_isolated_world.await_count == 3
+        assert selector._frame_worlds == {
+            (mock_session.client, "main"): 1,
+            (mock_session.client, "child"): 3,
+        }
+
+        # Frames that left the tree, and closed clients, are forgotten
+        del tree["childFrames"]
+        mock_session.runtime.evaluate.side_effect = None
+        mock_session.runtime.evaluate.return_value = None
+        await selector.find_multiple_elements_in_frames(
+            mock_session, element_selector_css
+        )
+        assert list(selector._frame_worlds) == [(mock_session.client, "main")]
+        assert len(closers) == 1
+        closers[0]()
+        assert selector._frame_worlds == {}
+
+    @pytest.mark.asyncio
+    async def test_multiple_elements_include_hidden(self, selector, mock_session):
+        """Test that visible_only=False keeps hidden rows with their flags."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "names": [],
+            "rows": [["menu", [0, 0, 0, 0], [], "Menu", 0]],
+        }
+
+        results = await selector.find_multiple_elements(
+            mock_session,
+            ElementSelector(
+                type=ElementSelectorType.CSS, value=".menu", visible_only=False
+            ),
+        )
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "if (false && !(flags & 1)) return;" in script
+        assert ElementFlags.VISIBLE not in results[0].flags
+
+    @pytest.mark.asyncio
+    async def test_multiple_broad_elements_walk_with_limit(
+        self, selector, mock_session
+    ):
+        """Test that '*'-rooted selectors stop walking the DOM at the limit."""
+
+        mock_session.runtime.evaluate.return_value = None
+
+        await selector.find_multiple_elements(
+            mock_session,
+            ElementSelector(type=ElementSelectorType.CSS, value="main *[role]"),
+            limit=3,
+        )
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "createTreeWalker" in script
+        assert "nodes.length < 3" in script
+        assert "querySelectorAll" not in script
+
+    @pytest.mark.asyncio
+    async def test_multiple_xpath_elements(self, selector, mock_session):
+        """Test that simple XPath runs as CSS and complex XPath as a snapshot."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "names": ["type"],
+            "rows": [["submit", [10, 20, 80, 30], [0, "submit"], "Send", 7]],
+        }
+
+        results = await selector.find_multiple_elements(
+            mock_session,
+            ElementSelector(
+                type=ElementSelectorType.XPATH,
+                value="//form//button[@type='submit']",
+            ),
+        )
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "querySelectorAll('form button[type=\"submit\"]')" in script
+        assert "document.evaluate" not in script
+        assert results[0].element_id == "submit"
+        assert results[0].attributes == {"type": "submit"}
+
+        await selector.find_multiple_elements(
+            mock_session,
+            ElementSelector(type=ElementSelectorType.XPATH, value="//ul/li[2]"),
+        )
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "ORDERED_NODE_SNAPSHOT_TYPE" in script
 
     @pytest.mark.asyncio
     async def test_fuzzy_text_strategy(
@@ -152,25 +401,21 @@ class TestAdvancedElementSelector:
     ):
         """Test finding multiple elements."""
 
-        # Mock multiple elements found
-        mock_session.runtime.evaluate.return_value = [
-            {
-                "elementId": "button1",
-                "tagName": "button",
-                "text": "Submit 1",
-                "attributes": {"class": "submit"},
-                "boundingBox": {"x": 100, "y": 200, "width": 80, "height": 30},
-                "isVisible": True,
-            },
-            {
-                "elementId": "button2",
-                "tagName": "button",
-                "text": "Submit 2",
-                "attributes": {"class": "submit"},
-                "boundingBox": {"x": 100, "y": 250, "width": 80, "height": 30},
-                "isVisible": True,
-            },
-        ]
+        # Mock multiple elements found, as compact [id, box, attrs, text] rows
+        # with attribute names dictionary-encoded
+        mock_session.runtime.evaluate.return_value = {
+            "names": ["class", "type"],
+            "rows": [
+                ["button1", [100, 200, 80, 30], [0, "submit"], "Submit 1", 7],
+                [
+                    "button2",
+                    [100, 250, 80, 30],
+                    [0, "submit", 1, "button"],
+                    "Submit 2",
+                    5,
+                ],
+            ],
+        }
 
         results = await selector.find_multiple_elements(
             mock_session, element_selector_css, limit=5
@@ -182,6 +427,128 @@ class TestAdvancedElementSelector:
         )
         assert results[0].element_id == "button1"
         assert results[1].element_id == "button2"
+        assert results[1].bounding_box == {
+            "x": 100,
+            "y": 250,
+            "width": 80,
+            "height": 30,
+        }
+        assert results[1].text_content == "Submit 2"
+        assert results[1].attributes == {"class": "submit", "type": "button"}
+        assert (
+            results[0].flags
+            == ElementFlags.VISIBLE
+            | ElementFlags.IN_VIEWPORT
+            | ElementFlags.INTERACTIVE
+        )
+        assert ElementFlags.IN_VIEWPORT not in results[1].flags
+
+    @pytest.mark.asyncio
+    async def test_multiple_fuzzy_text_elements(
+        self, selector, mock_session, element_selector_text
+    ):
+        """Test fuzzy matching across harvested DOM shards."""
+
+        def shard(*candidates):
+            rows = [
+                [element_id, [0, 0, 80, 20], [], text, 3]
+                for element_id, text in candidates
+            ]
+            return {"names": [], "rows": rows}
+
+        mock_session.runtime.evaluate.side_effect = [
+            shard(("exact", "Click me now")),
+            shard(("close", "Clik me"), ("other", "Unrelated")),
+            shard(),
+        ]
+
+        results = await selector.find_multiple_elements(
+            mock_session, element_selector_text, limit=5
+        )
+
+        assert mock_session.runtime.evaluate.call_count == 3
+        assert [result.element_id for result in results] == ["close", "exact"]
+        assert all(
+            result.strategy == SelectionStrategy.FUZZY_TEXT for result in results
+        )
+        assert results[0].confidence > results[1].confidence
+
+    @pytest.mark.asyncio
+    async def test_multiple_fuzzy_text_without_rapidfuzz(
+        self, selector, mock_session, element_selector_text, monkeypatch
+    ):
+        """Test the pure Python fallback when rapidfuzz is not installed."""
+
+        monkeypatch.setattr(
+            "surfboard.automation.element_selector._RAPIDFUZZ_AVAILABLE", False
+        )
+        mock_session.runtime.evaluate.side_effect = [
+            {"names": [], "rows": [["close", [0, 0, 80, 20], [], "Clik me", 3]]},
+            {
+                "names": [],
+                "rows": [
+                    [
+                        "long",
+                        [0, 0, 80, 20],
+                        [],
+                        "Completely unrelated paragraph " * 5,
+                        1,
+                    ]
+                ],
+            },
+            {"names": [], "rows": []},
+        ]
+
+        results = await selector.find_multiple_elements(
+            mock_session, element_selector_text, limit=5
+        )
+
+        assert [result.element_id for result in results] == ["close"]
+        assert results[0].confidence == pytest.approx(14 / 15)
+
+    def test_batched_similarity_matches_per_phrase_scoring(self, monkeypatch):
+        """Test that cdist batch scoring agrees with per-phrase extraction."""
+
+        pytest.importorskip("numpy")
+        pytest.importorskip("rapidfuzz")
+        from surfboard.automation import element_selector as module
+
+        phrases = ("sign in", "log in")
+        texts = ["sign in", "log on", "signing", "help center"]
+        batched = module._score_phrase_similarity(phrases, texts, 0.7)
+
+        monkeypatch.setattr(module, "_NUMPY_AVAILABLE", False)
+        per_phrase = module._score_phrase_similarity(phrases, texts, 0.7)
+
+        assert batched.keys() == per_phrase.keys()
+        for index, score in per_phrase.items():
+            assert batched[index] == pytest.approx(score, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_multiple_fuzzy_text_alternatives(self, selector, mock_session):
+        """Test that '|' separated phrases match any alternative."""
+
+        mock_session.runtime.evaluate.side_effect = [
+            {
+                "names": ["role"],
+                "rows": [
+                    ["login", [0, 0, 80, 20], [0, "button"], "Log in", 7],
+                    ["signin", [0, 20, 80, 20], [], "Sign in to continue", 3],
+                ],
+            },
+            {"names": [], "rows": [["help", [0, 40, 80, 20], [], "Help center", 3]]},
+            {"names": [], "rows": []},
+        ]
+
+        results = await selector.find_multiple_elements(
+            mock_session,
+            ElementSelector(type=ElementSelectorType.TEXT, value="Sign in|Log in"),
+        )
+
+        assert {result.element_id for result in results} == {"login", "signin"}
+        assert all(result.confidence == 0.9 for result in results)
+        login = next(result for result in results if result.element_id == "login")
+        assert login.attributes == {"role": "button"}
 
     @pytest.mark.asyncio
     async def test_adaptive_timeout(self, selector, mock_session, element_selector_css):
@@ -217,6 +584,36 @@ class TestAdvancedElementSelector:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_results_share_interned_attribute_names(
+        self, selector, mock_session, element_selector_css
+    ):
+        """Test that results are slotted and share attribute name strings."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "names": ["".join(["cl", "ass"])],
+            "rows": [
+                [
+                    f"item-{i}",
+                    [0, i * 20, 80, 20],
+                    [0, "".join(["it", "em"])],
+                    f"Item {i}",
+                    3,
+                ]
+                for i in range(2)
+            ],
+        }
+
+        results = await selector.find_multiple_elements(
+            mock_session, element_selector_css, limit=5
+        )
+
+        assert not hasattr(results[0], "__dict__")
+        first_key = next(iter(results[0].attributes))
+        second_key = next(iter(results[1].attributes))
+        assert first_key is second_key
+        assert results[0].attributes[first_key] is results[1].attributes[second_key]
+
 
 class TestSmartWaiter:
     """Test smart waiting mechanisms."""
@@ -230,6 +627,7 @@ class TestSmartWaiter:
     def mock_session(self):
         """Create mock CDP session."""
         session = AsyncMock()
+        session.client = MagicMock()
         session.runtime.evaluate = AsyncMock()
         session.network.enable = AsyncMock()
         session.profiler.enable = AsyncMock()
@@ -243,6 +641,37 @@ class TestSmartWaiter:
             type=ElementSelectorType.CSS, value="#test-element", timeout=5.0
         )
 
+    @pytest.mark.asyncio
+    async def test_page_load_rechecks_on_cdp_event(self, waiter, mock_session):
+        """Test a lifecycle event wakes the wait before the fallback poll."""
+
+        handlers = {}
+        mock_session.client.add_event_handler.side_effect = handlers.__setitem__
+        loading = {"readyState": "loading", "pendingImages": 0, "pendingScripts": 0}
+        loaded = {"readyState": "complete", "pendingImages": 0, "pendingScripts": 0}
+        checks = iter([loading, loaded])
+
+        async def check(session, target=None):
+            state = next(checks)
+            if state is loading:
+                loop = asyncio.get_running_loop()
+                loop.call_later(0.01, handlers["Page.lifecycleEvent"], {})
+            return state["readyState"] == "complete", state
+
+        with patch.dict(waiter._condition_checkers, {WaitType.PAGE_LOAD: check}):
+            result = await waiter.wait_for_condition(
+                mock_session,
+                WaitType.PAGE_LOAD,
+                adaptive=False,
+                stability_time=0,
+            )
+
+        assert result.success
+        assert result.wait_time < 0.4
+        # Handlers are released once the wait finishes
+        assert waiter._event_listeners == {}
+        assert mock_session.client.remove_event_handler.call_count == len(handlers)
+
     @pytest.mark.asyncio
     async def test_wait_for_element_visible_success(
         self, waiter, mock_session, element_selector
@@ -272,31 +701,321 @@ class TestSmartWaiter:
     ):
         """Test waiting for element to become clickable."""
 
-        # Mock element visible first, then clickable
+        # Visibility and clickability come back from a single probe
+        mock_session.runtime.evaluate.return_value = {
+            "visible": True,
+            "clickable": True,
+            "found": True,
+            "rect": {"x": 100, "y": 200, "width": 80, "height": 30},
+            "style": {"display": "block", "visibility": "visible", "opacity": "1"},
+            "disabled": False,
+            "covered": False,
+            "elementAtPoint": "BUTTON",
+        }
+
+        # Test the internal method directly
+        condition_met, info = await waiter._check_element_clickable(
+            mock_session, element_selector
+        )
+
+        assert condition_met is True
+        assert info["clickable"] is True
+        assert mock_session.runtime.evaluate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_element_probe_ships_only_its_finder(self, waiter, mock_session):
+        """Test each selector type sends just the lookup it needs."""
+
+        mock_session.runtime.evaluate.return_value = {"found": False}
+
+        scripts = {}
+        for selector_type in (
+            ElementSelectorType.CSS,
+            ElementSelectorType.XPATH,
+            ElementSelectorType.TEXT,
+        ):
+            selector = ElementSelector(type=selector_type, value='Say "hi"')
+            await waiter._check_element_visible(mock_session, selector)
+            scripts[selector_type] = mock_session.runtime.evaluate.call_args[0][0]
+
+        css = scripts[ElementSelectorType.CSS]
+        assert "querySelector(value)" in css
+        assert "document.evaluate" not in css
+        assert "createTreeWalker" not in css
+        assert '"Say \\"hi\\""' in css
+
+        assert "document.evaluate" in scripts[ElementSelectorType.XPATH]
+        assert "createTreeWalker" not in scripts[ElementSelectorType.XPATH]
+        assert "createTreeWalker" in scripts[ElementSelectorType.TEXT]
+        assert "querySelector(" not in scripts[ElementSelectorType.TEXT]
+
+    @pytest.mark.asyncio
+    async def test_element_probe_caches_misses_per_dom_generation(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test lookups that found nothing are dated by the DOM generation."""
+
+        mock_session.runtime.evaluate.return_value = {"found": False}
+
+        await waiter._check_element_visible(mock_session, element_selector)
+
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "window.__sbGen" in script
+        assert '"css:#test-element"' in script
+
+        await waiter._watch_changes(mock_session, WaitType.ELEMENT_VISIBLE)
+        observer = mock_session.runtime.evaluate.call_args[0][0]
+        assert "window.__sbGen++" in observer
+
+        # State pseudo-classes can change without any DOM mutation
+        checked = ElementSelector(type=ElementSelectorType.CSS, value="input:checked")
+        await waiter._check_element_visible(mock_session, checked)
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert "__sbMisses" not in script
+        assert '"input:checked"' in script
+
+    @pytest.mark.asyncio
+    async def test_found_element_is_held_between_polls(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test a found but hidden element is re-probed without a lookup."""
+
+        hidden = {"visible": False, "found": True}
+        handle = {"type": "object", "subtype": "node", "objectId": "element-1"}
+
+        async def evaluate(script, return_by_value=True):
+            return hidden if return_by_value else handle
+
+        mock_session.runtime.evaluate.side_effect = evaluate
+        mock_session.runtime.call_function_on.return_value = hidden
+
+        await waiter._check_element_visible(mock_session, element_selector)
+        assert mock_session.runtime.evaluate.call_args[1] == {"return_by_value": False}
+
+        visible, _ = await waiter._check_element_visible(mock_session, element_selector)
+        assert visible is False
+        assert mock_session.runtime.evaluate.await_count == 2
+        (
+            held_probe,
+            object_id,
+            arguments,
+        ) = mock_session.runtime.call_function_on.call_args[0]
+        assert object_id == "element-1"
+        assert "matches(value)" in held_probe
+        assert arguments == [{"value": "#test-element"}]
+
+        # Detached or no longer matching elements are released and looked
+        # up again
+        mock_session.runtime.call_function_on.return_value = None
+        await waiter._check_element_visible(mock_session, element_selector)
+        mock_session.runtime.release_object.assert_awaited_once_with("element-1")
+        assert mock_session.runtime.evaluate.await_count == 4
+
+        await waiter._release_element(mock_session, element_selector)
+        assert waiter._element_handles == {}
+
+    @pytest.mark.asyncio
+    async def test_held_element_outlives_concurrent_wait(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test a held element is released only when its last wait ends."""
+
+        hidden = {"visible": False, "found": True}
+        handle = {"type": "object", "subtype": "node", "objectId": "element-1"}
+        first_done = asyncio.Event()
+
+        async def evaluate(script, return_by_value=True):
+            return hidden if return_by_value else handle
+
+        async def call_function_on(function, object_id, arguments=None):
+            # Report visible only once the first wait has finished
+            return {"visible": first_done.is_set(), "found": True}
+
+        mock_session.runtime.evaluate.side_effect = evaluate
+        mock_session.runtime.call_function_on.side_effect = call_function_on
+
+        async def first_wait():
+            try:
+                return await waiter.wait_for_condition(
+                    mock_session,
+                    WaitType.ELEMENT_VISIBLE,
+                    target=element_selector,
+                    adaptive=False,
+                    timeout=0.3,
+                    stability_time=0,
+                )
+            finally:
+                first_done.set()
+
+        first, second = await asyncio.gather(
+            first_wait(),
+            waiter.wait_for_condition(
+                mock_session,
+                WaitType.ELEMENT_VISIBLE,
+                target=element_selector,
+                adaptive=False,
+                timeout=5.0,
+                stability_time=0,
+            ),
+        )
+
+        assert first.timeout_occurred
+        assert second.success and not second.timeout_occurred
+        # Lookups always report hidden, so the second wait succeeded on the
+        # element still held after the first wait ended
+        mock_session.runtime.call_function_on.assert_awaited()
+        mock_session.runtime.release_object.assert_awaited_once_with("element-1")
+        assert waiter._element_handles == {}
+        assert waiter._element_waits == {}
+
+    @pytest.mark.asyncio
+    async def test_element_stable_measures_in_page(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test both stability measurements come from one evaluate."""
+
+        rect = {"x": 10, "y": 20, "width": 80, "height": 30}
+        moved = {"x": 10, "y": 26, "width": 80, "height": 30}
         mock_session.runtime.evaluate.side_effect = [
-            # First call for visibility check
             {
-                "visible": True,
-                "found": True,
-                "rect": {"x": 100, "y": 200, "width": 80, "height": 30},
-                "style": {"display": "block", "visibility": "visible", "opacity": "1"},
+                "stable": True,
+                "positionChange": 0,
+                "sizeChange": 0,
+                "first": rect,
+                "second": rect,
             },
-            # Second call for clickability check
             {
-                "clickable": True,
-                "disabled": False,
-                "covered": False,
-                "elementAtPoint": "BUTTON",
+                "stable": False,
+                "positionChange": 6,
+                "sizeChange": 0,
+                "first": rect,
+                "second": moved,
             },
         ]
 
-        # Test the internal method directly
-        condition_met, info = await waiter._check_element_clickable(
+        stable, _ = await waiter._check_element_stable(mock_session, element_selector)
+        moving, info = await waiter._check_element_stable(
             mock_session, element_selector
         )
 
-        assert condition_met is True
-        assert info["clickable"] is True
+        assert stable is True
+        assert moving is False
+        assert info["position_change"] == 6
+        assert mock_session.runtime.evaluate.call_args[1] == {"await_promise": True}
+
+    @pytest.mark.asyncio
+    async def test_element_stability_waits_in_page(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test stability is confirmed by one in-page settle, not polling."""
+
+        async def evaluate(script, await_promise=False):
+            if await_promise:
+                return {"stable": True, "found": True}
+            return {"visible": True, "found": True}
+
+        mock_session.runtime.evaluate.side_effect = evaluate
+
+        result = await waiter.wait_for_condition(
+            mock_session,
+            WaitType.ELEMENT_VISIBLE,
+            target=element_selector,
+            adaptive=False,
+            stability_time=0.5,
+        )
+
+        assert result.success
+        assert result.wait_time < 0.5
+        settle_calls = [
+            c
+            for c in mock_session.runtime.evaluate.call_args_list
+            if c.kwargs.get("await_promise")
+        ]
+        assert len(settle_calls) == 1
+        # Only the element's box is watched, for at most twice stability_time
+        settle = settle_calls[0][0][0]
+        assert settle.endswith(", 500, 1000)")
+        assert "MutationObserver" not in settle
+
+    @pytest.mark.asyncio
+    async def test_element_settle_times_out_client_side(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test an unanswered settle probe does not stall the wait."""
+
+        async def evaluate(script, await_promise=False):
+            await asyncio.sleep(10)
+
+        mock_session.runtime.evaluate.side_effect = evaluate
+
+        start = time.monotonic()
+        settled = await waiter._wait_element_settled(
+            mock_session, element_selector, 0.01, 30.0
+        )
+
+        assert settled is False
+        assert time.monotonic() - start < 2.0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_any_element_returns_first_match(self, waiter, mock_session):
+        """Test alternative selectors are waited for concurrently."""
+
+        states = {
+            '"#missing"': {"visible": False, "found": False},
+            '"#late"': {"visible": True, "found": True},
+        }
+
+        async def evaluate(script):
+            # Probes of waits polling together arrive as one array
+            probed = sorted((k for k in states if k in script), key=script.index)
+            if script.startswith("["):
+                return [{"value": states[key]} for key in probed]
+            return states[probed[0]] if probed else {}
+
+        mock_session.runtime.evaluate.side_effect = evaluate
+        selectors = [
+            ElementSelector(type=ElementSelectorType.CSS, value="#missing"),
+            ElementSelector(type=ElementSelectorType.CSS, value="#late"),
+        ]
+
+        result = await waiter.wait_for_any_element(
+            mock_session, selectors, timeout=5.0, stability_time=0
+        )
+
+        assert result.success
+        assert result.additional_info["selector_index"] == 1
+        assert result.wait_time < 1.0
+        # The losing wait is cancelled and drops its event listeners
+        assert waiter._event_listeners == {}
+
+        result = await waiter.wait_for_any_element(mock_session, [])
+        assert not result.success
+
+    @pytest.mark.asyncio
+    async def test_concurrent_element_probes_share_one_evaluate(
+        self, waiter, mock_session
+    ):
+        """Test probes issued in the same tick go out as one batch."""
+
+        mock_session.runtime.evaluate.return_value = [
+            {"value": {"visible": True, "found": True}},
+            {"error": "SyntaxError: bad selector"},
+        ]
+        selectors = [
+            ElementSelector(type=ElementSelectorType.CSS, value="#a"),
+            ElementSelector(type=ElementSelectorType.CSS, value="#b["),
+        ]
+
+        first, second = await asyncio.gather(
+            *(waiter._check_element_visible(mock_session, s) for s in selectors),
+            return_exceptions=True,
+        )
+
+        assert mock_session.runtime.evaluate.await_count == 1
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert script.startswith("[") and '"#a"' in script and '"#b["' in script
+        assert first == (True, {"visible": True, "found": True})
+        assert isinstance(second, CDPError)
 
     @pytest.mark.asyncio
     async def test_wait_for_page_load(self, waiter, mock_session):
@@ -314,12 +1033,50 @@ class TestSmartWaiter:
         assert result.success
         assert result.condition_met == str(WaitType.PAGE_LOAD)
 
+    @pytest.mark.asyncio
+    async def test_page_load_follows_lifecycle_events(self, waiter, mock_session):
+        """Test page load is read from lifecycle events once they are known."""
+
+        handlers = {}
+        mock_session.client.add_event_handler.side_effect = handlers.__setitem__
+        mock_session.page.get_frame_tree.return_value = {
+            "frameTree": {"frame": {"id": "main"}}
+        }
+        mock_session.runtime.evaluate.return_value = {"readyState": "loading"}
+
+        # Until the document's lifecycle is reported, the page is probed
+        loaded, _ = await waiter._check_page_load(mock_session)
+        assert loaded is False
+        assert mock_session.runtime.evaluate.await_count == 1
+        mock_session.page.set_lifecycle_events_enabled.assert_awaited_once()
+
+        lifecycle = handlers["Page.lifecycleEvent"]
+        lifecycle({"frameId": "main", "name": "init"})
+        lifecycle({"frameId": "main", "name": "DOMContentLoaded"})
+        lifecycle({"frameId": "child", "name": "load"})
+        loaded, info = await waiter._check_page_load(mock_session)
+        assert loaded is False
+        assert info["lifecycle"] == ["DOMContentLoaded", "init"]
+
+        lifecycle({"frameId": "main", "name": "load"})
+        loaded, _ = await waiter._check_page_load(mock_session)
+        assert loaded is True
+
+        # A new document starts over
+        lifecycle({"frameId": "main", "name": "init"})
+        loaded, _ = await waiter._check_page_load(mock_session)
+        assert loaded is False
+        assert mock_session.runtime.evaluate.await_count == 1
+
     @pytest.mark.asyncio
     async def test_wait_timeout(self, waiter, mock_session, element_selector):
         """Test wait operation timeout."""
 
         # Mock element never found
-        mock_session.runtime.evaluate.return_value = {"visible": False, "found": False}
+        mock_session.runtime.evaluate.return_value = {
+            "visible": False,
+            "found": False,
+        }
 
         result = await waiter.wait_for_element(
             mock_session, element_selector, WaitType.ELEMENT_VISIBLE, timeout=0.5
@@ -329,16 +1086,72 @@ class TestSmartWaiter:
         assert result.timeout_occurred
         assert result.condition_met == "timeout"
 
-    @pytest.mark.asyncio
-    async def test_network_idle_wait(self, waiter, mock_session):
-        """Test waiting for network idle state."""
+    @pytest.mark.asyncio
+    async def test_network_idle_wait(self, waiter, mock_session):
+        """Test waiting for network idle state."""
+
+        result = await waiter.wait_for_network_idle(
+            mock_session, idle_time=1.0, timeout=2.0
+        )
+
+        # Network idle detection is simplified in tests
+        assert result.condition_met == "network_idle"
+
+    def test_poll_interval_backs_off_and_follows_progress(self, waiter):
+        """Test polling backs off when idle and tracks the rate of progress."""
+
+        backoff = [
+            waiter._calculate_poll_interval(
+                WaitType.PAGE_LOAD, 0.1, checks_without_progress=n
+            )
+            for n in range(7)
+        ]
+        assert backoff == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0])
+
+        # 4 images finished in 0.5s, so the remaining 2 need about 0.25s
+        assert waiter._calculate_poll_interval(
+            WaitType.PAGE_LOAD, 0.1, 2.0, 6.0, 0.5, 3
+        ) == pytest.approx(0.25)
+
+        info = {"pendingImages": 2, "pendingScripts": 1}
+        assert waiter._remaining_work(WaitType.PAGE_LOAD, info) == 3.0
+        assert waiter._remaining_work(WaitType.ELEMENT_VISIBLE, info) is None
+
+    @pytest.mark.asyncio
+    async def test_network_idle_tracks_request_events(self, waiter, mock_session):
+        """Test network idle waits out requests reported by CDP events."""
+
+        handlers = {}
+        mock_session.client.add_event_handler.side_effect = handlers.__setitem__
+
+        async def traffic():
+            await asyncio.sleep(0)
+            for request_id in ("a", "b", "c"):
+                handlers["Network.requestWillBeSent"]({"requestId": request_id})
+            # A redirect reuses its request ID
+            handlers["Network.requestWillBeSent"]({"requestId": "a"})
+            await asyncio.sleep(0.1)
+            handlers["Network.loadingFinished"]({"requestId": "a"})
+            handlers["Network.loadingFailed"]({"requestId": "b"})
+
+        traffic_task = asyncio.create_task(traffic())
+        result = await waiter.wait_for_network_idle(
+            mock_session, idle_time=0.05, timeout=0.3, max_connections=0
+        )
+        await traffic_task
+
+        assert not result.success
+        assert result.additional_info["active_requests"] == 1
 
+        traffic_task = asyncio.create_task(traffic())
         result = await waiter.wait_for_network_idle(
-            mock_session, idle_time=1.0, timeout=2.0
+            mock_session, idle_time=0.05, timeout=2.0, max_connections=1
         )
+        await traffic_task
 
-        # Network idle detection is simplified in tests
-        assert result.condition_met == "network_idle"
+        assert result.success
+        assert 0.15 <= result.wait_time < 1.0
+        assert waiter._event_listeners == {}
 
     @pytest.mark.asyncio
     async def test_adaptive_timeout_calculation(self, waiter, mock_session):
@@ -360,6 +1173,102 @@ class TestSmartWaiter:
         # Should increase timeout for complex page
         assert adaptive_timeout >= 10.0
 
+    def test_historical_factor_uses_recent_window(self, waiter):
+        """Test the history factor only reflects the last 50 waits."""
+
+        assert waiter._get_historical_factor(WaitType.PAGE_LOAD) == 1.0
+
+        for _ in range(10):
+            waiter._record_wait_result(WaitType.PAGE_LOAD, 12.0, True)
+        assert waiter._get_historical_factor(WaitType.PAGE_LOAD) == 1.3
+
+        waiter._record_wait_result(WaitType.PAGE_LOAD, 1.0, False)
+        for _ in range(39):
+            waiter._record_wait_result(WaitType.ELEMENT_VISIBLE, 0.5, True)
+        assert waiter._get_historical_factor(WaitType.PAGE_LOAD) == 1.3
+        assert waiter._get_historical_factor(WaitType.ELEMENT_VISIBLE) == 0.8
+
+        # The successful page loads leave the window, the failure remains
+        for _ in range(10):
+            waiter._record_wait_result(WaitType.ELEMENT_VISIBLE, 0.5, True)
+        assert waiter._get_historical_factor(WaitType.PAGE_LOAD) == 1.2
+
+        waiter._record_wait_result(WaitType.ELEMENT_VISIBLE, 0.5, True)
+        assert waiter._get_historical_factor(WaitType.PAGE_LOAD) == 1.0
+
+        for _ in range(200):
+            waiter._record_wait_result(WaitType.ELEMENT_VISIBLE, 0.5, True)
+        assert len(waiter.wait_history) == 200
+
+    @pytest.mark.asyncio
+    async def test_page_complexity_cached_until_navigation(self, waiter, mock_session):
+        """Test the complexity probe runs once per loaded document."""
+
+        handlers = {}
+        mock_session.client.add_event_handler.side_effect = handlers.__setitem__
+        mock_session.runtime.evaluate.return_value = {
+            "elementCount": 2000,
+            "scriptCount": 0,
+            "imageCount": 0,
+            "readyState": "complete",
+        }
+
+        assert await waiter._get_page_complexity_factor(mock_session) == 1.5
+        assert await waiter._get_page_complexity_factor(mock_session) == 1.5
+        assert mock_session.runtime.evaluate.await_count == 1
+
+        # Subframe navigations leave the main document alone
+        handlers["Page.frameNavigated"]({"frame": {"id": "f", "parentId": "m"}})
+        await waiter._get_page_complexity_factor(mock_session)
+        assert mock_session.runtime.evaluate.await_count == 1
+
+        handlers["Page.frameNavigated"]({"frame": {"id": "m"}})
+        mock_session.runtime.evaluate.return_value["readyState"] = "loading"
+        await waiter._get_page_complexity_factor(mock_session)
+        await waiter._get_page_complexity_factor(mock_session)
+        assert mock_session.runtime.evaluate.await_count == 3
+
+        mock_session.runtime.evaluate.return_value["readyState"] = "complete"
+        await waiter._get_page_complexity_factor(mock_session)
+        handlers["Page.lifecycleEvent"]({"frameId": "m", "name": "init"})
+        await waiter._get_page_complexity_factor(mock_session)
+        assert mock_session.runtime.evaluate.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_closed_client_state_is_dropped(
+        self, waiter, mock_session, element_selector
+    ):
+        """Test per-client state and handlers go away with the connection."""
+
+        closers = []
+        mock_session.client.add_close_callback.side_effect = closers.append
+        mock_session.page.get_frame_tree.return_value = {
+            "frameTree": {"frame": {"id": "main"}}
+        }
+        mock_session.runtime.evaluate.return_value = {
+            "elementCount": 10,
+            "readyState": "complete",
+            "visible": True,
+            "found": True,
+        }
+
+        await waiter._get_page_complexity_factor(mock_session)
+        await waiter._track_lifecycle(mock_session)
+        await waiter._check_element_visible(mock_session, element_selector)
+        assert len(closers) == 1
+
+        closers[0]()
+
+        assert waiter.page_complexity_cache == {}
+        assert waiter._complexity_invalidators == {}
+        assert waiter._page_lifecycles == {}
+        assert waiter._evaluate_batchers == {}
+        assert waiter._event_listeners == {}
+        removed = {
+            c[0][0] for c in mock_session.client.remove_event_handler.call_args_list
+        }
+        assert removed == {"Page.frameNavigated", "Page.lifecycleEvent"}
+
 
 class TestErrorRecoverySystem:
     """Test error recovery and retry systems."""
@@ -406,6 +1315,36 @@ class TestErrorRecoverySystem:
         error_type4 = recovery_system._classify_error(error4)
         assert error_type4 == ErrorType.UNKNOWN_ERROR
 
+        # Test that the higher priority type wins, wherever it appears
+        error5 = Exception("Timeout after 5s: Element Not Found")
+        error_type5 = recovery_system._classify_error(error5)
+        assert error_type5 == ErrorType.ELEMENT_NOT_FOUND
+
+        # Test a prerendered message is classified case-insensitively
+        assert (
+            recovery_system._classify_error(error1, "Traceback...\nNETWORK Failure")
+            == ErrorType.NETWORK_ERROR
+        )
+
+        # Test classification by exception class alone
+        assert (
+            recovery_system._classify_error(asyncio.TimeoutError())
+            == ErrorType.TIMEOUT_ERROR
+        )
+        assert (
+            recovery_system._classify_error(ConnectionRefusedError("refused"))
+            == ErrorType.NETWORK_ERROR
+        )
+        # The class wins over a misleading message
+        assert (
+            recovery_system._classify_error(CDPTimeoutError("element not found"))
+            == ErrorType.TIMEOUT_ERROR
+        )
+        assert (
+            recovery_system._classify_error(CDPConnectionError("Not connected to CDP"))
+            == ErrorType.CONNECTION_LOST
+        )
+
     @pytest.mark.asyncio
     async def test_immediate_retry_strategy(
         self, recovery_system, mock_session, test_command
@@ -421,6 +1360,151 @@ class TestErrorRecoverySystem:
         # Should attempt recovery
         assert result.attempts_made == 1
 
+    @pytest.mark.asyncio
+    async def test_backoff_recovery_skips_page_probes(
+        self, recovery_system, mock_session, test_command
+    ):
+        """Test backoff-led recovery does not probe the page."""
+
+        recovery_system.base_retry_delay = 0.0
+
+        result = await recovery_system.handle_error(
+            mock_session, asyncio.TimeoutError(), test_command, attempt_count=1
+        )
+
+        assert result.success
+        assert result.strategy_used == RecoveryStrategy.EXPONENTIAL_BACKOFF
+        mock_session.runtime.evaluate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_identical_errors_share_one_recovery(
+        self, recovery_system, mock_session
+    ):
+        """Test concurrent identical errors coalesce into one recovery."""
+
+        async def evaluate(script):
+            await asyncio.sleep(0)
+            return {"page": {"url": "https://example.com"}}
+
+        mock_session.runtime.evaluate = AsyncMock(side_effect=evaluate)
+        commands = [
+            ClickCommand(
+                selector=ElementSelector(type=ElementSelectorType.CSS, value="#submit")
+            )
+            for _ in range(5)
+        ]
+
+        results = await asyncio.gather(
+            *(
+                recovery_system.handle_error(
+                    mock_session, Exception("element not found"), command
+                )
+                for command in commands
+            ),
+            # A later attempt orders its strategies differently
+            recovery_system.handle_error(
+                mock_session, Exception("element not found"), commands[0], 3
+            ),
+        )
+
+        assert all(result is results[0] for result in results[:5])
+        assert results[0].strategy_used == RecoveryStrategy.ELEMENT_WAIT_RETRY
+        assert results[5] is not results[0]
+        assert results[5].strategy_used == RecoveryStrategy.PAGE_REFRESH
+        # Context probe and element wait, plus the later attempt's probe
+        assert mock_session.runtime.evaluate.await_count == 3
+        assert recovery_system._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_recovery_rewrites_every_selector(
+        self, recovery_system, mock_session
+    ):
+        """Test an alternative selector found once reaches every caller."""
+
+        mock_session.runtime.evaluate.return_value = {}
+
+        async def wait_retry(session, error_context):
+            await asyncio.sleep(0)
+            return False, "still missing"
+
+        async def alternative(session, error_context):
+            error_context.selector.value = "#submit-alt"
+            return True, "Alternative selector found: #submit-alt"
+
+        commands = [
+            ClickCommand(
+                selector=ElementSelector(type=ElementSelectorType.CSS, value="#submit")
+            )
+            for _ in range(3)
+        ]
+
+        with patch.dict(
+            recovery_system._dispatch,
+            {
+                RecoveryStrategy.ELEMENT_WAIT_RETRY: wait_retry,
+                RecoveryStrategy.ALTERNATIVE_SELECTOR: alternative,
+            },
+        ):
+            results = await asyncio.gather(
+                *(
+                    recovery_system.handle_error(
+                        mock_session, Exception("element not found"), command
+                    )
+                    for command in commands
+                )
+            )
+
+        assert all(
+            result.strategy_used == RecoveryStrategy.ALTERNATIVE_SELECTOR
+            for result in results
+        )
+        assert [command.selector.value for command in commands] == ["#submit-alt"] * 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_shared_recovery_running(
+        self, recovery_system, mock_session
+    ):
+        """Test cancelling the first caller does not cancel the others."""
+
+        mock_session.runtime.evaluate.return_value = {}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def wait_retry(session, error_context):
+            started.set()
+            await release.wait()
+            return True, "element_found"
+
+        def handle():
+            return recovery_system.handle_error(
+                mock_session,
+                Exception("element not found"),
+                ClickCommand(
+                    selector=ElementSelector(
+                        type=ElementSelectorType.CSS, value="#submit"
+                    )
+                ),
+            )
+
+        with patch.dict(
+            recovery_system._dispatch,
+            {RecoveryStrategy.ELEMENT_WAIT_RETRY: wait_retry},
+        ):
+            first = asyncio.create_task(handle())
+            await started.wait()
+            second = asyncio.create_task(handle())
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            result = await second
+
+        assert first.cancelled()
+        assert result.success
+        assert result.strategy_used == RecoveryStrategy.ELEMENT_WAIT_RETRY
+        assert recovery_system._inflight == {}
+
     @pytest.mark.asyncio
     async def test_exponential_backoff_strategy(
         self, recovery_system, mock_session, test_command
@@ -458,13 +1542,18 @@ class TestErrorRecoverySystem:
             page_state={"url": "https://example.com"},
         )
 
-        success, result = await recovery_system._apply_recovery_strategy(
-            mock_session, RecoveryStrategy.PAGE_REFRESH, error_context
-        )
+        with patch(
+            "surfboard.automation.error_recovery.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            success, result = await recovery_system._apply_recovery_strategy(
+                mock_session, RecoveryStrategy.PAGE_REFRESH, error_context
+            )
 
         assert success
         assert result == "page_refreshed"
         mock_session.page.navigate.assert_called_once_with("https://example.com")
+        # The load wait is navigate's own, not a fixed sleep
+        sleep.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_retry_with_recovery(
@@ -490,6 +1579,31 @@ class TestErrorRecoverySystem:
         assert result == "success"
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_retry_delay_uses_full_jitter(
+        self, recovery_system, mock_session, test_command
+    ):
+        """Test retry delays are drawn uniformly below the backoff cap."""
+
+        recovery_system.base_retry_delay = 2.0
+        recovery_system._rng = MagicMock()
+        recovery_system._rng.random.return_value = 0.25
+
+        async def failing_operation():
+            raise Exception("fails")
+
+        with patch(
+            "surfboard.automation.error_recovery.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            success, _ = await recovery_system.retry_with_recovery(
+                mock_session, failing_operation, test_command, max_attempts=3
+            )
+
+        assert not success
+        # Each retry waits jitter * min(base * 2^(attempt - 1), max)
+        assert call(0.5) in sleep.await_args_list
+        assert call(1.0) in sleep.await_args_list
+
     @pytest.mark.asyncio
     async def test_graceful_degradation(
         self, recovery_system, mock_session, test_command
@@ -512,6 +1626,108 @@ class TestErrorRecoverySystem:
         assert result["status"] == "degraded"
         assert result["original_command"] == test_command.command_type
 
+    @pytest.mark.asyncio
+    async def test_analyze_error_uses_single_probe(self, recovery_system, mock_session):
+        """Test error analysis gathers its page context in one evaluation."""
+
+        mock_session.runtime.evaluate.return_value = {
+            "page": {"url": "https://example.com"},
+            "element": {"found": False, "similar": []},
+            "network": {"online": True},
+        }
+        command = ClickCommand(
+            selector=ElementSelector(type=ElementSelectorType.CSS, value="#submit")
+        )
+
+        context = await recovery_system._analyze_error(
+            mock_session, Exception("element not found"), command, 1, {}
+        )
+
+        mock_session.runtime.evaluate.assert_awaited_once()
+        script = mock_session.runtime.evaluate.call_args[0][0]
+        assert script.endswith('("css", "#submit")')
+        assert context.page_state == {"url": "https://example.com"}
+        assert context.element_info == {"found": False, "similar": []}
+        assert context.network_info == {"online": True}
+
+        # Without a selector the element probe is skipped
+        mock_session.runtime.evaluate.side_effect = Exception("detached")
+        context = await recovery_system._analyze_error(
+            mock_session,
+            Exception("timeout"),
+            BaseCommand(command_type=CommandType.NAVIGATE),
+            1,
+            {},
+        )
+
+        assert context.page_state == {"error": "Could not retrieve page state"}
+        assert context.element_info == {}
+
+    @pytest.mark.asyncio
+    async def test_context_probes_time_out(self, recovery_system, mock_session):
+        """Test a hanging page probe yields an error dict instead of blocking."""
+
+        async def hang(script):
+            await asyncio.sleep(10)
+
+        mock_session.runtime.evaluate = AsyncMock(side_effect=hang)
+
+        with patch("surfboard.automation.error_recovery._EVAL_TIMEOUT", 0.01):
+            page_state = await recovery_system._get_page_state(mock_session)
+            context = await recovery_system._analyze_error(
+                mock_session,
+                Exception("timeout"),
+                BaseCommand(command_type=CommandType.NAVIGATE),
+                1,
+                {},
+            )
+
+        assert page_state == {"error": "Could not retrieve page state"}
+        assert context.network_info == {"error": "Could not retrieve network info"}
+
+    @pytest.mark.asyncio
+    async def test_element_wait_retry_passes_selector_as_arguments(
+        self, recovery_system, mock_session
+    ):
+        """Test element wait keeps its script constant across selectors."""
+
+        mock_session.runtime.evaluate.return_value = True
+        scripts = []
+        for value in ("#first", """[title='a "b"']"""):
+            context = ErrorContext(
+                error_type=ErrorType.ELEMENT_NOT_FOUND,
+                error_message="test",
+                command=ClickCommand(
+                    selector=ElementSelector(type=ElementSelectorType.CSS, value=value)
+                ),
+                attempt_count=1,
+                timestamp=1234567890.0,
+            )
+            success, _ = await recovery_system._element_wait_retry(
+                mock_session, context
+            )
+            assert success
+            scripts.append(mock_session.runtime.evaluate.call_args[0][0])
+
+        assert scripts[0].endswith('("css", "#first")')
+        assert scripts[1].endswith(r"""("css", "[title='a \"b\"']")""")
+        assert scripts[0].rsplit("(", 1)[0] == scripts[1].rsplit("(", 1)[0]
+        assert context.selector is context.command.selector
+
+        # Commands without a selector are rejected before any evaluation
+        context = ErrorContext(
+            error_type=ErrorType.ELEMENT_NOT_FOUND,
+            error_message="test",
+            command=BaseCommand(command_type=CommandType.NAVIGATE),
+            attempt_count=1,
+            timestamp=1234567890.0,
+        )
+        assert context.selector is None
+        assert await recovery_system._element_wait_retry(mock_session, context) == (
+            False,
+            "No selector to wait for",
+        )
+
     def test_recovery_pattern_learning(self, recovery_system):
         """Test recovery pattern learning."""
 
@@ -536,6 +1752,133 @@ class TestErrorRecoverySystem:
         )
         assert recovery_system.error_history[0]["success"] == True
 
+    def test_recovery_strategy_ordering(self, recovery_system):
+        """Test learned and late-attempt strategies are moved to the front."""
+
+        context = ErrorContext(
+            error_type=ErrorType.ELEMENT_NOT_FOUND,
+            error_message="test",
+            command=BaseCommand(command_type=CommandType.CLICK),
+            attempt_count=3,
+            timestamp=1234567890.0,
+        )
+
+        assert recovery_system._get_recovery_strategies(context) == [
+            RecoveryStrategy.PAGE_REFRESH,
+            RecoveryStrategy.ELEMENT_WAIT_RETRY,
+            RecoveryStrategy.ALTERNATIVE_SELECTOR,
+        ]
+
+        recovery_system._record_successful_recovery(
+            context, RecoveryStrategy.ALTERNATIVE_SELECTOR, 1.0
+        )
+        # Learned strategies outside the mapping are not added
+        recovery_system._record_successful_recovery(
+            context, RecoveryStrategy.SESSION_RESTART, 1.0
+        )
+
+        assert recovery_system._get_recovery_strategies(context) == [
+            RecoveryStrategy.ALTERNATIVE_SELECTOR,
+            RecoveryStrategy.PAGE_REFRESH,
+            RecoveryStrategy.ELEMENT_WAIT_RETRY,
+        ]
+
+    def test_load_history(self, recovery_system):
+        """Test persisted history replays into the learning state."""
+
+        recovery_system.load_history(
+            [
+                {
+                    "error_type": "timeout_error",
+                    "strategy": "page_refresh",
+                    "success": True,
+                },
+                {
+                    "error_message": "Request timeout after 30s",
+                    "strategy": "page_refresh",
+                    "success": True,
+                },
+                {
+                    "error_message": "Request timeout after 30s",
+                    "strategy": "navigation_retry",
+                    "success": False,
+                },
+            ]
+        )
+
+        assert len(recovery_system.error_history) == 3
+        assert all(
+            entry["error_type"] == ErrorType.TIMEOUT_ERROR
+            for entry in recovery_system.error_history
+        )
+        assert (
+            recovery_system.pattern_success[ErrorType.TIMEOUT_ERROR][
+                RecoveryStrategy.PAGE_REFRESH
+            ]
+            == 2
+        )
+        assert (
+            recovery_system.pattern_fail[ErrorType.TIMEOUT_ERROR][
+                RecoveryStrategy.NAVIGATION_RETRY
+            ]
+            == 1
+        )
+
+    def test_error_history_is_bounded(self, recovery_system):
+        """Test error history evicts the oldest entries past its cap."""
+
+        context = ErrorContext(
+            error_type=ErrorType.NETWORK_ERROR,
+            error_message="test",
+            command=BaseCommand(command_type=CommandType.CLICK),
+            attempt_count=1,
+            timestamp=1234567890.0,
+        )
+
+        for attempt in range(600):
+            context.attempt_count = attempt
+            recovery_system._record_failed_recovery(
+                context, [RecoveryStrategy.IMMEDIATE_RETRY], 0.1
+            )
+
+        assert len(recovery_system.error_history) == 500
+        assert recovery_system.error_history[0]["attempt_count"] == 100
+
+    def test_learned_strategies_rank_by_success(self, recovery_system):
+        """Test learned strategies are ranked by recorded successes."""
+
+        context = ErrorContext(
+            error_type=ErrorType.TIMEOUT_ERROR,
+            error_message="test",
+            command=BaseCommand(command_type=CommandType.CLICK),
+            attempt_count=1,
+            timestamp=1234567890.0,
+        )
+
+        assert recovery_system._get_learned_strategies(context) == []
+
+        recovery_system._record_successful_recovery(
+            context, RecoveryStrategy.PAGE_REFRESH, 1.0
+        )
+        for _ in range(2):
+            recovery_system._record_successful_recovery(
+                context, RecoveryStrategy.NAVIGATION_RETRY, 1.0
+            )
+        recovery_system._record_failed_recovery(
+            context, [RecoveryStrategy.EXPONENTIAL_BACKOFF], 1.0
+        )
+
+        assert recovery_system._get_learned_strategies(context) == [
+            RecoveryStrategy.NAVIGATION_RETRY,
+            RecoveryStrategy.PAGE_REFRESH,
+        ]
+        assert (
+            recovery_system.pattern_fail[ErrorType.TIMEOUT_ERROR][
+                RecoveryStrategy.EXPONENTIAL_BACKOFF
+            ]
+            == 1
+        )
+
 
 class TestPerformanceOptimizer:
     """Test performance optimization and resource management."""
@@ -575,8 +1918,21 @@ class TestPerformanceOptimizer:
 
         # Check session was added
         assert len(optimizer.active_sessions) == 1
-        session_ids = [sid for _, sid in optimizer.active_sessions]
-        assert "test-session" in session_ids
+        assert optimizer.active_sessions["test-session"] is mock_session
+
+    @pytest.mark.asyncio
+    async def test_aggressive_session_blocks_images_by_type(self, mock_session):
+        """Test image blocking uses a single resource-type pattern."""
+
+        optimizer = PerformanceOptimizer(
+            OptimizationSettings(level=OptimizationLevel.AGGRESSIVE)
+        )
+
+        await optimizer.register_session(mock_session, "test-session")
+
+        mock_session.page.set_resource_response_interception.assert_awaited_once_with(
+            patterns=[{"urlPattern": "*", "resourceType": "Image"}]
+        )
 
     @pytest.mark.asyncio
     async def test_session_unregistration(self, optimizer, mock_session):
@@ -590,6 +1946,19 @@ class TestPerformanceOptimizer:
         await optimizer.unregister_session("test-session")
         assert len(optimizer.active_sessions) == 0
 
+    @pytest.mark.asyncio
+    async def test_close_stops_background_loops(self, optimizer):
+        """Test close cancels the loops started by initialize."""
+
+        await optimizer.initialize()
+        tasks = list(optimizer.cleanup_tasks)
+        assert [t.get_name() for t in tasks] == ["perf-monitor", "perf-cleanup"]
+
+        await optimizer.close()
+
+        assert all(t.done() for t in tasks)
+        assert optimizer.cleanup_tasks == []
+
     @pytest.mark.asyncio
     async def test_page_load_optimization(self, optimizer, mock_session):
         """Test page load optimization."""
@@ -612,6 +1981,20 @@ class TestPerformanceOptimizer:
         assert "load_metrics" in result
         assert "total_optimization_time" in result
 
+    @pytest.mark.asyncio
+    async def test_unregister_drops_session_cache_entries(
+        self, optimizer, mock_session
+    ):
+        """Test unregistering a session drops only its cached page loads."""
+
+        mock_session.runtime.evaluate.return_value = {}
+        await optimizer.optimize_page_load(mock_session, "https://a.test", "one")
+        await optimizer.optimize_page_load(mock_session, "https://b.test", "two")
+
+        await optimizer.unregister_session("one")
+
+        assert list(optimizer.optimization_cache) == ["https://b.test"]
+
     @pytest.mark.asyncio
     async def test_script_optimization(self, optimizer, mock_session):
         """Test JavaScript execution optimization."""
@@ -640,25 +2023,46 @@ class TestPerformanceOptimizer:
         assert "optimized_script_length" in result
 
     @pytest.mark.asyncio
-    @patch("psutil.virtual_memory")
-    @patch("psutil.cpu_percent")
-    @patch("psutil.net_connections")
-    async def test_performance_metrics_collection(
-        self,
-        mock_net_connections,
-        mock_cpu_percent,
-        mock_virtual_memory,
-        optimizer,
-        mock_session,
-    ):
+    async def test_script_optimization_is_memoized(self, optimizer_settings):
+        """Test script optimization strips by level and reuses results."""
+
+        optimizer_settings.level = OptimizationLevel.MAXIMUM
+        optimizer = PerformanceOptimizer(optimizer_settings)
+        script = "// note\nlet a = 1; /* block */\n  return   a;"
+
+        first = await optimizer._optimize_script(script)
+        second = await optimizer._optimize_script(script)
+
+        assert first == "let a = 1; return a;"
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_repeated_script_execution_hits_cache(self, optimizer, mock_session):
+        """Test repeated executions reuse the optimized script."""
+
+        from surfboard.automation.performance_optimizer import (
+            _optimize_script_cached,
+        )
+
+        script = "  return document.title;  // repeated instrumentation  "
+        await optimizer.optimize_script_execution(mock_session, script, "s")
+        hits = _optimize_script_cached.cache_info().hits
+
+        result = await optimizer.optimize_script_execution(mock_session, script, "s")
+
+        assert _optimize_script_cached.cache_info().hits == hits + 1
+        assert result["optimized_script_length"] == len(script.strip())
+
+    @pytest.mark.asyncio
+    async def test_performance_metrics_collection(self, optimizer, mock_session):
         """Test performance metrics collection."""
 
-        # Mock system metrics
-        mock_memory = MagicMock()
-        mock_memory.used = 1024 * 1024 * 512  # 512 MB
-        mock_virtual_memory.return_value = mock_memory
-        mock_cpu_percent.return_value = 45.0
-        mock_net_connections.return_value = [1, 2, 3]  # 3 connections
+        # Mock process metrics
+        optimizer._process = MagicMock()
+        optimizer._process.memory_info.return_value.rss = 1024 * 1024 * 512  # 512 MB
+        optimizer._process.cpu_percent.return_value = 90.0
+        optimizer._cpu_count = 2
+        optimizer._process_connections = MagicMock(return_value=[1, 2, 3])
 
         # Mock DOM element count
         mock_session.runtime.evaluate.return_value = 150
@@ -673,7 +2077,12 @@ class TestPerformanceOptimizer:
         assert metrics.cpu_percent == 45.0
         assert metrics.network_active_connections == 3
         assert metrics.dom_element_count == 150
+        mock_session.runtime.evaluate.assert_awaited_with(
+            "document.getElementsByTagName('*').length"
+        )
         assert metrics.active_browser_instances == 1
+        optimizer._process.cpu_percent.assert_called_once_with(None)
+        optimizer._process_connections.assert_called_once_with(kind="inet")
 
     @pytest.mark.asyncio
     async def test_resource_cleanup(self, optimizer, mock_session):
@@ -681,7 +2090,7 @@ class TestPerformanceOptimizer:
 
         # Add some data to clean up
         optimizer.optimization_cache["test-url"] = {"data": "test"}
-        optimizer.metrics_history = [MagicMock() for _ in range(100)]
+        optimizer.metrics_history.extend(MagicMock() for _ in range(150))
 
         # Register session
         await optimizer.register_session(mock_session, "test-session")
@@ -696,6 +2105,38 @@ class TestPerformanceOptimizer:
         assert "dom_nodes_removed" in result
         assert result["sessions_cleaned"] == 1
 
+        # A forced cleanup trims the history to its most recent samples
+        await optimizer.cleanup_resources(force=True)
+        assert len(optimizer.metrics_history) == 100
+
+    @pytest.mark.asyncio
+    async def test_dom_scripts_traverse_once(self, optimizer, mock_session):
+        """Test post-load and cleanup scripts use a single tree walk each."""
+
+        await optimizer._apply_postload_optimizations(mock_session)
+        await optimizer._cleanup_dom_nodes(mock_session)
+
+        for script_call in mock_session.runtime.evaluate.call_args_list:
+            script = script_call[0][0]
+            assert script.count("createTreeWalker") == 1
+            assert "querySelectorAll" not in script
+
+    @pytest.mark.asyncio
+    async def test_resource_cleanup_across_sessions(self, optimizer):
+        """Test DOM cleanup runs per session and tolerates one failing."""
+
+        optimizer.active_sessions = {"healthy": AsyncMock(), "broken": AsyncMock()}
+
+        with patch.object(
+            optimizer,
+            "_cleanup_dom_nodes",
+            new=AsyncMock(side_effect=[4, RuntimeError("detached")]),
+        ):
+            result = await optimizer.cleanup_resources()
+
+        assert result["sessions_cleaned"] == 1
+        assert result["dom_nodes_removed"] == 4
+
     def test_optimization_recommendations(self, optimizer):
         """Test optimization recommendations."""
 
@@ -709,13 +2150,66 @@ class TestPerformanceOptimizer:
             active_browser_instances=2,
         )
 
-        optimizer.metrics_history = [high_memory_metrics] * 10
+        optimizer.metrics_history.extend([high_memory_metrics] * 10)
 
         recommendations = optimizer.get_optimization_recommendations()
 
         assert "memory" in recommendations
         assert "aggressive optimization" in recommendations["memory"]
 
+    def test_recommendations_use_recent_window(self, optimizer):
+        """Test recommendations only average the last 10 samples."""
+
+        def sample(memory_mb):
+            return ResourceMetrics(
+                timestamp=0.0,
+                memory_usage_mb=memory_mb,
+                cpu_percent=10.0,
+                network_active_connections=0,
+                dom_element_count=0,
+                active_browser_instances=0,
+            )
+
+        for _ in range(10):
+            optimizer.metrics_history.append(sample(1000.0))
+        for _ in range(10):
+            optimizer.metrics_history.append(sample(100.0))
+
+        assert len(optimizer.metrics_history) == 20
+        assert "memory" not in optimizer.get_optimization_recommendations()
+
+    def test_monitor_interval_adapts_to_load(self, optimizer):
+        """Test the monitor samples faster under load and slower when idle."""
+
+        def sample(memory_mb, cpu):
+            return ResourceMetrics(
+                timestamp=0.0,
+                memory_usage_mb=memory_mb,
+                cpu_percent=cpu,
+                network_active_connections=0,
+                dom_element_count=0,
+                active_browser_instances=0,
+            )
+
+        assert optimizer._monitor_interval == 15.0
+
+        # Thresholds are 819.2MB and 56% CPU for these settings
+        optimizer._adapt_monitor_interval(sample(100.0, 55.0))
+        assert optimizer._monitor_interval == 7.5
+
+        optimizer._adapt_monitor_interval(sample(100.0, 5.0))
+        assert optimizer._monitor_interval == 7.5
+        optimizer._adapt_monitor_interval(sample(100.0, 5.0))
+        assert optimizer._monitor_interval == 11.25
+
+        for _ in range(20):
+            optimizer._adapt_monitor_interval(sample(100.0, 5.0))
+        assert optimizer._monitor_interval == 60.0
+
+        for _ in range(10):
+            optimizer._adapt_monitor_interval(sample(800.0, 5.0))
+        assert optimizer._monitor_interval == 1.0
+
     def test_different_optimization_levels(self):
         """Test different optimization level configurations."""
 
@@ -1029,22 +2523,19 @@ class TestPerformanceStress:
         large_element_list = []
         for i in range(1000):
             large_element_list.append(
-                {
-                    "elementId": f"element-{i}",
-                    "tagName": "div",
-                    "text": f"Element {i}",
-                    "attributes": {"class": "item"},
-                    "boundingBox": {
-                        "x": i % 100,
-                        "y": i // 100,
-                        "width": 50,
-                        "height": 20,
-                    },
-                    "isVisible": True,
-                }
+                [
+                    f"element-{i}",
+                    [i % 100, i // 100, 50, 20],
+                    [0, "item"],
+                    f"Element {i}",
+                    1,
+                ]
             )
 
-        mock_session.runtime.evaluate.return_value = large_element_list
+        mock_session.runtime.evaluate.return_value = {
+            "names": ["class"],
+            "rows": large_element_list,
+        }
 
         element_selector = ElementSelector(type=ElementSelectorType.CSS, value=".item")
 
@@ -1061,9 +2552,18 @@ class TestPerformanceStress:
 
         waiter = SmartWaiter()
         mock_session = AsyncMock()
-        mock_session.runtime.evaluate = AsyncMock(
-            return_value={"visible": True, "found": True}
-        )
+        mock_session.client = MagicMock()
+        state = {"visible": True, "found": True}
+
+        async def evaluate(script, await_promise=False):
+            if await_promise:
+                return {"stable": True, "found": True}
+            # Probes of waits polling together arrive as one array
+            if script.startswith("["):
+                return [{"value": state}] * script.count("return {value: ")
+            return state
+
+        mock_session.runtime.evaluate = AsyncMock(side_effect=evaluate)
 
         element_selector = ElementSelector(type=ElementSelectorType.CSS, value="#test")
 
@@ -73,6 +73,38 @@ class TestCDPClient:
         assert "Page.loadEventFired" in client._event_handlers
         assert client._event_handlers["Page.loadEventFired"] == mock_handler
 
+    @pytest.mark.asyncio
+    async def test_remove_event_handler(self):
+        """Test removing only the handler that is still registered."""
+        client = CDPClient()
+
+        def first(params):
+            pass
+
+        def second(params):
+            pass
+
+        client.add_event_handler("Page.loadEventFired", first)
+        client.add_event_handler("Page.loadEventFired", second)
+
+        client.remove_event_handler("Page.loadEventFired", first)
+        assert client._event_handlers["Page.loadEventFired"] is second
+
+        client.remove_event_handler("Page.loadEventFired", second)
+        assert "Page.loadEventFired" not in client._event_handlers
+
+    @pytest.mark.asyncio
+    async def test_close_callbacks_run_once(self):
+        """Test close callbacks run on close and are then cleared."""
+        client = CDPClient()
+        calls = []
+
+        client.add_close_callback(lambda: calls.append("closed"))
+        await client.close()
+        await client.close()
+
+        assert calls == ["closed"]
+
     @pytest.mark.asyncio
     @patch("aiohttp.ClientSession.get")
     async def test_get_tab_websocket_url_success(self, mock_get):
@@ -98,6 +98,22 @@ class TestPageDomain:
         )
 
 
+    @pytest.mark.asyncio
+    async def test_set_lifecycle_events_enabled(self):
+        """Test enabling lifecycle events."""
+        mock_client = AsyncMock()
+        mock_client.enable_domain = AsyncMock()
+        mock_client.send_command = AsyncMock()
+        
+        page = PageDomain(mock_client)
+        
+        await page.set_lifecycle_events_enabled()
+        
+        mock_client.send_command.assert_called_once_with(
+            "Page.setLifecycleEventsEnabled", {"enabled": True}
+        )
+
+
 class TestRuntimeDomain:
     """Test RuntimeDomain functionality."""
 
@@ -168,6 +184,41 @@ class TestRuntimeDomain:
         )
         assert result == "test_result"
 
+    @pytest.mark.asyncio
+    async def test_compile_and_run_script(self):
+        """Test that a compiled script is run by its script ID."""
+        mock_client = AsyncMock()
+        mock_client.enable_domain = AsyncMock()
+        mock_client.send_command = AsyncMock(
+            side_effect=[{"scriptId": "1"}, {"result": {"value": 3}}]
+        )
+
+        runtime = RuntimeDomain(mock_client)
+
+        script_id = await runtime.compile_script("count()")
+        assert await runtime.run_script(script_id) == 3
+
+        mock_client.send_command.assert_called_with(
+            "Runtime.runScript",
+            {"scriptId": "1", "returnByValue": True, "awaitPromise": False},
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_binding_once(self):
+        """Test that a binding is only added once per domain."""
+        mock_client = AsyncMock()
+        mock_client.enable_domain = AsyncMock()
+        mock_client.send_command = AsyncMock(return_value={})
+
+        runtime = RuntimeDomain(mock_client)
+
+        await runtime.add_binding("__sbWake")
+        await runtime.add_binding("__sbWake")
+
+        mock_client.send_command.assert_called_once_with(
+            "Runtime.addBinding", {"name": "__sbWake"}
+        )
+
 
 class TestDOMDomain:
     """Test DOMDomain functionality."""
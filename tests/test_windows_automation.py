@@ -3,10 +3,12 @@ Tests for Windows UI automation functionality.
 """
 
 import platform
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from surfboard.automation import windows
 from surfboard.automation.windows import (
     WindowInfo,
     WindowsAutomation,
@@ -58,6 +60,13 @@ class TestWindowInfo:
 class TestWindowsAutomation:
     """Test WindowsAutomation class."""
 
+    @pytest.fixture(autouse=True)
+    def forget_tool_probes(self):
+        """Start each test without remembered tool availability."""
+        windows._TOOL_AVAILABILITY.clear()
+        yield
+        windows._TOOL_AVAILABILITY.clear()
+
     def test_initialization(self):
         """Test WindowsAutomation initialization."""
         automation = WindowsAutomation()
@@ -66,27 +75,37 @@ class TestWindowsAutomation:
         assert isinstance(automation.is_windows, bool)
         assert isinstance(automation._uia_available, bool)
 
-    @patch("platform.system")
-    def test_initialization_windows(self, mock_system):
+    def test_initialization_windows(self):
         """Test initialization on Windows."""
-        mock_system.return_value = "Windows"
-
-        with patch.object(
-            WindowsAutomation, "_check_uia_availability", return_value=True
+        with patch.multiple(
+            windows, _PLATFORM="windows", _IS_WINDOWS=True, _UIA_AVAILABLE=True
         ):
             automation = WindowsAutomation()
             assert automation.is_windows is True
             assert automation.platform == "windows"
+            assert automation._uia_available is True
 
-    @patch("platform.system")
-    def test_initialization_linux(self, mock_system):
+    def test_initialization_linux(self):
         """Test initialization on Linux."""
-        mock_system.return_value = "Linux"
-        automation = WindowsAutomation()
+        with patch.multiple(
+            windows, _PLATFORM="linux", _IS_WINDOWS=False, _UIA_AVAILABLE=False
+        ):
+            automation = WindowsAutomation()
 
         assert automation.is_windows is False
         assert automation.platform == "linux"
 
+    def test_initialization_does_not_probe(self):
+        """Test creating instances repeats no platform or library probes."""
+        with patch("platform.system") as mock_system, patch.object(
+            windows, "_probe_uia"
+        ) as mock_probe:
+            WindowsAutomation()
+            WindowsAutomation()
+
+        mock_system.assert_not_called()
+        mock_probe.assert_not_called()
+
     def test_check_uia_availability_success(self):
         """Test UIA availability check success."""
         automation = WindowsAutomation()
@@ -133,6 +152,67 @@ class TestWindowsAutomation:
             assert windows[0].title == "Test Chrome Window"
             mock_find.assert_called_once_with("Chrome")
 
+    @pytest.mark.asyncio
+    async def test_find_windows_by_title_win32_runs_in_thread(self):
+        """Test Win32 enumeration runs off the event loop thread."""
+        automation = WindowsAutomation()
+        automation.is_windows = True
+        threads = []
+
+        def find(title_pattern):
+            threads.append(threading.get_ident())
+            return [WindowInfo(title="Google Chrome", hwnd=1)]
+
+        with patch.object(automation, "_find_windows_win32", side_effect=find):
+            found = await automation.find_windows_by_title("Chrome")
+
+        assert found[0].hwnd == 1
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_find_windows_win32_enumerates_with_user32(self):
+        """Test Win32 enumeration only queries windows whose title matches."""
+        titles = {1: "Google Chrome - Test", 2: "Notepad", 3: "Hidden Chrome"}
+
+        class FakeUser32:
+            def __init__(self):
+                self.class_queries = []
+
+            def EnumWindows(self, callback, lparam):
+                return all(callback(hwnd, lparam) for hwnd in titles)
+
+            def IsWindowVisible(self, hwnd):
+                return hwnd != 3
+
+            def GetWindowTextW(self, hwnd, buffer, size):
+                buffer.value = titles[hwnd]
+                return len(titles[hwnd])
+
+            def GetClassNameW(self, hwnd, buffer, size):
+                self.class_queries.append(hwnd)
+                buffer.value = "Chrome_WidgetWin_1"
+                return len(buffer.value)
+
+            def GetWindowRect(self, hwnd, rect):
+                rect._obj.right, rect._obj.bottom = 800, 600
+                return True
+
+            def GetWindowThreadProcessId(self, hwnd, process_id):
+                process_id._obj.value = 4242
+                return 1
+
+        user32 = FakeUser32()
+        automation = WindowsAutomation()
+
+        with patch.object(windows, "_user32", return_value=(user32, lambda f: f)):
+            found = automation._find_windows_win32("chrome")
+
+        assert len(found) == 1
+        assert found[0].hwnd == 1
+        assert found[0].class_name == "Chrome_WidgetWin_1"
+        assert found[0].process_id == 4242
+        assert found[0].rect == (0, 0, 800, 600)
+        assert user32.class_queries == [1]
+
     @pytest.mark.asyncio
     async def test_find_windows_linux_wmctrl(self):
         """Test finding windows on Linux with wmctrl."""
@@ -141,13 +221,45 @@ class TestWindowsAutomation:
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "0x12345  0  hostname Google Chrome - Test Page"
+        mock_result.stdout = (
+            "0x12345  0 4242   10   20   800  600  hostname Google Chrome - Test Page\n"
+            "0x12346  0 0      0    0    300  200  chrome-host Terminal\n"
+        )
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             windows = await automation._find_windows_linux("Chrome")
 
             assert len(windows) == 1
             assert "Google Chrome" in windows[0].title
+            assert windows[0].hwnd == 0x12345
+            assert windows[0].process_id == 4242
+            assert windows[0].rect == (10, 20, 810, 620)
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0] == ["wmctrl", "-lpG"]
+
+    @pytest.mark.asyncio
+    async def test_find_windows_linux_wmctrl_without_matches(self):
+        """Test an empty wmctrl match does not fall back to xdotool."""
+        automation = WindowsAutomation()
+        automation.platform = "linux"
+
+        mock_result = MagicMock(
+            returncode=0, stdout="0x1  0 7  0 0 10 10  host Terminal\n"
+        )
+
+        threads = []
+
+        def run(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return mock_result
+
+        with patch("subprocess.run", side_effect=run) as mock_run:
+            windows = await automation._find_windows_linux("Chrome")
+
+        assert windows == []
+        mock_run.assert_called_once()
+        # The listing runs off the event loop thread
+        assert threads[0] != threading.get_ident()
 
     @pytest.mark.asyncio
     async def test_find_windows_linux_xdotool_fallback(self):
@@ -184,6 +296,39 @@ class TestWindowsAutomation:
             assert windows[0].title == "Google Chrome"
             assert windows[0].hwnd == 12345678
 
+    @pytest.mark.asyncio
+    async def test_find_windows_linux_xdotool_titles_in_one_run(self):
+        """Test xdotool titles of all matches come from one chained run."""
+        automation = WindowsAutomation()
+        automation.platform = "linux"
+
+        def subprocess_side_effect(cmd, **kwargs):
+            if "wmctrl" in cmd:
+                raise FileNotFoundError()
+            if "search" in cmd:
+                return MagicMock(returncode=0, stdout="101\n102\n103\n")
+            # Window 103 closed before its title was read
+            return MagicMock(returncode=1, stdout="Chrome A\nChrome B\n")
+
+        with patch("subprocess.run", side_effect=subprocess_side_effect) as mock_run:
+            found = await automation._find_windows_linux("Chrome")
+
+        assert mock_run.call_count == 3
+        assert mock_run.call_args[0][0] == [
+            "xdotool",
+            "getwindowname",
+            "101",
+            "getwindowname",
+            "102",
+            "getwindowname",
+            "103",
+        ]
+        assert [(w.hwnd, w.title) for w in found] == [
+            (101, "Chrome A"),
+            (102, "Chrome B"),
+            (103, "Unknown"),
+        ]
+
     @pytest.mark.asyncio
     async def test_find_windows_macos(self):
         """Test finding windows on macOS."""
@@ -298,8 +443,13 @@ class TestWindowsAutomation:
         mock_result = MagicMock()
         mock_result.returncode = 0
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert automation.is_available() is True
             assert automation.is_available() is True
+            WindowsAutomation().is_available()
+
+        # The first tool answered, and its result is remembered
+        assert mock_run.call_count == 1
 
     def test_is_available_linux_without_tools(self):
         """Test availability check on Linux without tools."""